@@ -29,8 +29,9 @@ from pathlib import Path
 from typing import Iterable, Iterator, Optional
 from urllib.parse import urlparse
 
-import requests
-
+from scraper.executor import DEFAULT_SOURCE_TIMEOUT, DEFAULT_WORKERS, STATUS_OK, flatten, run_sources  # type: ignore
+from scraper.http import get as http_get  # type: ignore
+from scraper.normalize import DATES  # type: ignore
 from scraper.run import (  # type: ignore
     DEFAULT_RETENTION_HOURS,
     LOGGER as SCRAPER_LOGGER,
@@ -38,9 +39,11 @@ from scraper.run import (  # type: ignore
     _filter_stale,
     _merge_related,
     _sanitize_event,
+    _serialize_event,
     _sort,
     _parse_now,
 )
+from scraper.similarity import SimilarityIndex  # type: ignore
 from scraper.source_registry import SOURCE_CONFIGS  # type: ignore
 
 ROOT = Path(__file__).resolve().parent
@@ -48,6 +51,8 @@ DATA_DIR = ROOT / "data"
 EVENTS_PATH = DATA_DIR / "events.json"
 GENERATED_DIR = ROOT / "scraper" / "generated"
 DISCOVERY_FILE = ROOT / "docs" / "discovery" / "candidates.json"
+# Trigram Jaccard above which a discovered name is taken for a known source.
+DUPLICATE_SOURCE_THRESHOLD = 0.5
 
 LOGGER = logging.getLogger("spontis.auto_scraper")
 LOGGER.setLevel(logging.INFO)
@@ -73,13 +78,12 @@ def discover_sources(city: str = "Bergen", limit: int = 20) -> list[dict]:
             LOGGER.warning("Failed to read %s: %s", DISCOVERY_FILE, exc)
 
     if len(candidates) >= limit:
-        return candidates[:limit]
+        return mark_duplicate_sources(candidates[:limit])
 
     # Lightweight web discovery via VisitBergen (if available).
     search_url = "https://www.visitbergen.com/whats-on/"
     try:
-        response = requests.get(search_url, timeout=10)
-        response.raise_for_status()
+        response = http_get(search_url, timeout=10)
         for match in re.findall(r'href="([^"]+)"', response.text):
             if city.lower() not in match.lower():
                 continue
@@ -102,10 +106,35 @@ def discover_sources(city: str = "Bergen", limit: int = 20) -> list[dict]:
     except Exception as exc:
         LOGGER.info("VisitBergen discovery failed (%s)", exc)
 
-    return candidates[:limit]
+    return mark_duplicate_sources(candidates[:limit])
+
+
+def _candidate_label(candidate: dict) -> str:
+    name = candidate.get("name") or ""
+    host = urlparse(candidate.get("url") or "").netloc
+    if host and name in ("", host):
+        # Web hits are named after their host: "www.bergenkino.no" -> "bergenkino".
+        labels = [label for label in host.lower().split(".") if label != "www"]
+        return " ".join(labels[:-1] or labels)
+    return name
+
+
+def mark_duplicate_sources(candidates: list[dict]) -> list[dict]:
+    """Set ``duplicate_of`` on candidates resembling a registered source or an earlier candidate."""
+
+    index: SimilarityIndex[str] = SimilarityIndex(DUPLICATE_SOURCE_THRESHOLD)
+    index.add_many((config.name, config.name) for config in SOURCE_CONFIGS)
+    for candidate in candidates:
+        label = _candidate_label(candidate)
+        matches = index.query(label)
+        if matches:
+            candidate["duplicate_of"] = matches[0].key
+        elif label and label not in index:
+            index.add(label, label)
+    return candidates
 
 
-SCRAPER_TEMPLATE = """\"\"\"Auto-generated scraper placeholder for {name}.\"\"\"\n\nfrom __future__ import annotations\n\nfrom bs4 import BeautifulSoup\nimport requests\n\nfrom scraper.normalize import build_event\n\nURL = {url!r}\nHEADERS = {{\"User-Agent\": \"SpontisAutoScraper/0.1\"}}\n\n\ndef fetch() -> list[dict]:\n    \"\"\"Fetch events for {name}.\n\n    This module is a scaffold – fill in selectors and mapping before enabling.\n    \"\"\"\n    try:\n        resp = requests.get(URL, headers=HEADERS, timeout=20)\n        resp.raise_for_status()\n    except Exception as exc:\n        raise RuntimeError(f\"Failed to fetch {{URL}}: {{exc}}\").with_traceback(exc.__traceback__)\n\n    soup = BeautifulSoup(resp.text, \"html.parser\")\n    events: list[dict] = []\n\n    for card in soup.select(\"REPLACE_WITH_SELECTOR\"):\n        title = card.get_text(\" \", strip=True)\n        if not title:\n            continue\n        events.append(\n            build_event(\n                source={source_name!r},\n                title=title,\n                url=URL,\n            )\n        )\n\n    return events\n"""
+SCRAPER_TEMPLATE = """\"\"\"Auto-generated scraper placeholder for {name}.\"\"\"\n\nfrom __future__ import annotations\n\nfrom scraper.html import make_soup\nfrom scraper.http import get as http_get\nfrom scraper.normalize import build_event\n\nURL = {url!r}\nHEADERS = {{\"User-Agent\": \"SpontisAutoScraper/0.1\"}}\n\n\ndef fetch() -> list[dict]:\n    \"\"\"Fetch events for {name}.\n\n    This module is a scaffold – fill in selectors and mapping before enabling.\n    \"\"\"\n    try:\n        resp = http_get(URL, headers=HEADERS, timeout=20)\n    except Exception as exc:\n        raise RuntimeError(f\"Failed to fetch {{URL}}: {{exc}}\").with_traceback(exc.__traceback__)\n\n    soup = make_soup(resp.text)\n    events: list[dict] = []\n\n    for card in soup.select(\"REPLACE_WITH_SELECTOR\"):\n        title = card.get_text(\" \", strip=True)\n        if not title:\n            continue\n        events.append(\n            build_event(\n                source={source_name!r},\n                title=title,\n                url=URL,\n            )\n        )\n\n    return events\n"""
 
 
 def _slugify(url: str) -> str:
@@ -140,7 +169,7 @@ def _load_registered_fetchers() -> Iterator[tuple[str, callable]]:
         if not config.is_enabled(env):
             continue
         try:
-            fetcher = config.resolve()
+            fetcher = config.resolve_async()
         except Exception as exc:
             LOGGER.warning("Unable to import %s: %s", config.name, exc)
             continue
@@ -165,25 +194,33 @@ def _load_generated_fetchers() -> Iterator[tuple[str, callable]]:
     sys.path.pop(0)
 
 
-def _collect(fetchers: Iterable[tuple[str, callable]]) -> list[dict]:
-    events: list[dict] = []
-    for name, fetch in fetchers:
-        LOGGER.info("Fetching %s", name)
-        try:
-            pulled = list(fetch())
-        except Exception as exc:
-            LOGGER.warning("%s failed: %s", name, exc)
-            continue
-        LOGGER.info("%s: %d events", name, len(pulled))
-        events.extend(pulled)
-    return events
+def _collect(
+    fetchers: Iterable[tuple[str, callable]],
+    workers: int = DEFAULT_WORKERS,
+    source_timeout: Optional[float] = DEFAULT_SOURCE_TIMEOUT,
+) -> list[dict]:
+    results = run_sources(list(fetchers), workers=workers, timeout=source_timeout)
+    for result in results:
+        if result.status != STATUS_OK:
+            LOGGER.warning("%s %s: %s", result.name, result.status, result.error)
+    LOGGER.info(
+        "Dates resolved: %(iso)d ISO, %(rejected)d rejected, %(hits)d cached, "
+        "%(grammar)d grammar, %(dateparser)d dateparser, %(unparsed)d unparsed",
+        DATES.stats(),
+    )
+    return flatten(results)
 
 
-def run_all_scrapers(output: Path = EVENTS_PATH, retention_hours: int = DEFAULT_RETENTION_HOURS) -> None:
+def run_all_scrapers(
+    output: Path = EVENTS_PATH,
+    retention_hours: int = DEFAULT_RETENTION_HOURS,
+    workers: int = DEFAULT_WORKERS,
+    source_timeout: Optional[float] = DEFAULT_SOURCE_TIMEOUT,
+) -> None:
     """Run every scraper (static + generated) and write the merged feed."""
 
-    raw_events = _collect(_load_registered_fetchers())
-    raw_events.extend(_collect(_load_generated_fetchers()))
+    fetchers = list(_load_registered_fetchers()) + list(_load_generated_fetchers())
+    raw_events = _collect(fetchers, workers=workers, source_timeout=source_timeout)
 
     validated: list[dict] = []
     for idx, event in enumerate(raw_events, start=1):
@@ -195,11 +232,11 @@ def run_all_scrapers(output: Path = EVENTS_PATH, retention_hours: int = DEFAULT_
     deduped = _dedupe(validated)
     merged, _ = _merge_related(deduped)
     filtered = _filter_stale(merged, now=now, retention_hours=retention_hours)
-    sorted_events = _sort(filtered)
+    records = [_serialize_event(event) for event in _sort(filtered)]
 
     output.parent.mkdir(parents=True, exist_ok=True)
-    output.write_text(json.dumps(sorted_events, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
-    LOGGER.info("Wrote %d events → %s", len(sorted_events), output)
+    output.write_text(json.dumps(records, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    LOGGER.info("Wrote %d events → %s", len(records), output)
 
     # Update derived views via existing build script.
     # Regenerate derived views by invoking the existing script.
@@ -215,6 +252,8 @@ def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
     parser.add_argument("--name", help="Human friendly name for generated scraper.")
     parser.add_argument("--output", type=Path, default=EVENTS_PATH, help="Destination for events.json.")
     parser.add_argument("--retention-hours", type=int, default=DEFAULT_RETENTION_HOURS)
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Sources scraped in parallel.")
+    parser.add_argument("--source-timeout", type=float, default=DEFAULT_SOURCE_TIMEOUT, help="Per-source deadline in seconds.")
     parser.add_argument("--city", default="Bergen")
     parser.add_argument("--limit", type=int, default=20)
     return parser.parse_args(argv)
@@ -233,7 +272,12 @@ def main(argv: Optional[list[str]] = None) -> None:
         return
 
     LOGGER.info("Running all scrapers")
-    run_all_scrapers(output=args.output, retention_hours=args.retention_hours)
+    run_all_scrapers(
+        output=args.output,
+        retention_hours=args.retention_hours,
+        workers=args.workers,
+        source_timeout=args.source_timeout or None,
+    )
 
 
 if __name__ == "__main__":
@@ -232,7 +232,7 @@ function updateHeroMeta(meta, events) {
             : uniqueSources.size;
         const failing = stats.filter(entry => {
             const status = typeof entry?.status === 'string' ? entry.status.toLowerCase() : '';
-            return status === 'error' || status === 'fallback' || status === 'offline';
+            return status === 'error' || status === 'timeout' || status === 'fallback' || status === 'offline';
         });
 
         const fallbackCount = datasetKey === 'all'
@@ -2254,7 +2254,7 @@ function renderSourceRollup(events) {
 function renderMetaAlert(meta) {
     if (!metaAlert || !metaAlertSummary || !metaAlertList) return;
     const stats = Array.isArray(meta?.source_stats) ? meta.source_stats : [];
-    const relevantStatuses = new Set(['error', 'fallback', 'offline']);
+    const relevantStatuses = new Set(['error', 'timeout', 'fallback', 'offline']);
     const issues = stats.filter(entry => {
         const status = typeof entry?.status === 'string' ? entry.status.toLowerCase() : '';
         return relevantStatuses.has(status);
@@ -2268,7 +2268,7 @@ function renderMetaAlert(meta) {
     }
 
     const hasFallback = issues.some(issue => (issue.status || '').toLowerCase() === 'fallback');
-    const hasError = issues.some(issue => (issue.status || '').toLowerCase() === 'error');
+    const hasError = issues.some(issue => ['error', 'timeout'].includes((issue.status || '').toLowerCase()));
     const offlineOnly = issues.every(issue => (issue.status || '').toLowerCase() === 'offline');
 
     let summary;
@@ -2296,6 +2296,8 @@ function renderMetaAlert(meta) {
         let detail;
         if (status === 'error') {
             detail = issue?.error || 'klarte ikke hente data.';
+        } else if (status === 'timeout') {
+            detail = 'svarte ikke innen tidsfristen.';
         } else if (status === 'fallback') {
             detail = 'viser midlertidige sample-eventer.';
         } else if (status === 'offline') {
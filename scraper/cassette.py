@@ -0,0 +1,194 @@
+"""Record/replay of HTTP traffic for deterministic offline scraper runs.
+
+A cassette captures every response that passes through ``requests`` – the
+shared session in :mod:`scraper.http` as well as direct ``requests.get``
+calls in sources – by wrapping ``HTTPAdapter.send``. Replaying serves the
+recorded responses from disk (optionally with artificial latency), so a full
+``python -m scraper.run`` exercises every source's real parse path without a
+network.
+"""
+from __future__ import annotations
+
+import base64
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator, Optional
+
+import requests
+from requests import Response
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+LOGGER = logging.getLogger("spontis.scraper.cassette")
+
+FORMAT_VERSION = 1
+DEFAULT_LATENCY = float(os.getenv("SPONTIS_CASSETTE_LATENCY", "0"))
+RECORD = "record"
+REPLAY = "replay"
+
+_KEPT_HEADERS = {
+    "cache-control",
+    "content-type",
+    "date",
+    "etag",
+    "expires",
+    "last-modified",
+    "location",
+    "retry-after",
+    "vary",
+}
+
+
+class CassetteMiss(requests.ConnectionError):
+    """Raised in replay mode for a request that was never recorded."""
+
+
+class Cassette:
+    def __init__(self, path: Path, mode: str, latency: float = DEFAULT_LATENCY) -> None:
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        self.path = Path(path)
+        self.mode = mode
+        self.latency = max(0.0, latency)
+        self._lock = threading.Lock()
+        self._recorded: list[dict] = []
+        self._interactions: dict[tuple[str, str], list[dict]] = {}
+        self._cursor: dict[tuple[str, str], int] = {}
+        self.hits = 0
+        self.misses = 0
+        if mode == REPLAY:
+            self._load()
+
+    # -- persistence ---------------------------------------------------------
+
+    def _load(self) -> None:
+        with gzip.open(self.path, "rt", encoding="utf-8") as handle:
+            header = json.loads(handle.readline() or "{}")
+            if header.get("version") != FORMAT_VERSION:
+                raise ValueError(f"Unsupported cassette version in {self.path}: {header.get('version')}")
+            for line in handle:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                self._interactions.setdefault((entry["m"], entry["u"]), []).append(entry)
+        LOGGER.info("Loaded %d recorded requests from %s", sum(map(len, self._interactions.values())), self.path)
+
+    def save(self) -> None:
+        if self.mode != RECORD:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            entries = list(self._recorded)
+        header = {
+            "version": FORMAT_VERSION,
+            "recorded_at": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+            "requests": len(entries),
+        }
+        with gzip.open(self.path, "wt", encoding="utf-8") as handle:
+            handle.write(json.dumps(header) + "\n")
+            for entry in entries:
+                handle.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n")
+        LOGGER.info("Recorded %d requests → %s", len(entries), self.path)
+
+    # -- interception --------------------------------------------------------
+
+    def record(self, request: requests.PreparedRequest, response: Response) -> None:
+        body = response.content or b""
+        entry: dict = {
+            "m": request.method or "GET",
+            "u": request.url,
+            "s": response.status_code,
+            "h": {k.lower(): v for k, v in response.headers.items() if k.lower() in _KEPT_HEADERS},
+        }
+        if response.url and response.url != request.url:
+            entry["f"] = response.url
+        try:
+            entry["t"] = body.decode("utf-8")
+        except UnicodeDecodeError:
+            entry["b"] = base64.b64encode(body).decode("ascii")
+        with self._lock:
+            self._recorded.append(entry)
+
+    def replay(self, request: requests.PreparedRequest) -> Response:
+        key = (request.method or "GET", request.url or "")
+        with self._lock:
+            entries = self._interactions.get(key)
+            if not entries:
+                self.misses += 1
+                raise CassetteMiss(f"{key[0]} {key[1]} is not in cassette {self.path}", request=request)
+            # Repeated requests walk through the recordings, then stick to the last one.
+            position = self._cursor.get(key, 0)
+            self._cursor[key] = position + 1
+            entry = entries[min(position, len(entries) - 1)]
+            self.hits += 1
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        response = Response()
+        response.status_code = entry["s"]
+        response.headers = CaseInsensitiveDict(entry.get("h") or {})
+        response._content = (  # type: ignore[attr-defined]
+            entry["t"].encode("utf-8") if "t" in entry else base64.b64decode(entry.get("b", ""))
+        )
+        response._content_consumed = True  # type: ignore[attr-defined]
+        response.url = entry.get("f") or key[1]
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.reason = "OK" if response.status_code < 400 else "Replayed"
+        response.request = request
+        return response
+
+
+_ACTIVE: Optional[Cassette] = None
+_ORIGINAL_SEND = HTTPAdapter.send
+
+
+def active() -> Optional[Cassette]:
+    return _ACTIVE
+
+
+def _send(self: HTTPAdapter, request: requests.PreparedRequest, **kwargs) -> Response:
+    cassette = _ACTIVE
+    if cassette is None:
+        return _ORIGINAL_SEND(self, request, **kwargs)
+    if cassette.mode == REPLAY:
+        return cassette.replay(request)
+    response = _ORIGINAL_SEND(self, request, **kwargs)
+    cassette.record(request, response)
+    return response
+
+
+@contextmanager
+def use(path: Optional[Path], mode: str, latency: float = DEFAULT_LATENCY) -> Iterator[Optional[Cassette]]:
+    """Record to or replay from ``path`` for the duration of the block.
+
+    The on-disk HTTP cache is bypassed while a cassette is active so that
+    every request is captured (or served) by the cassette.
+    """
+
+    global _ACTIVE
+    if path is None:
+        yield None
+        return
+    if _ACTIVE is not None:
+        raise RuntimeError("A cassette is already active")
+
+    cassette = Cassette(path, mode, latency)
+    _ACTIVE = cassette
+    HTTPAdapter.send = _send  # type: ignore[method-assign]
+    try:
+        yield cassette
+    finally:
+        HTTPAdapter.send = _ORIGINAL_SEND  # type: ignore[method-assign]
+        _ACTIVE = None
+        cassette.save()
+        if mode == REPLAY:
+            LOGGER.info("Cassette replay: %d hits, %d misses", cassette.hits, cassette.misses)
@@ -0,0 +1,447 @@
+"""Norwegian/English grammar for the date strings venues actually publish.
+
+Event listings use a small set of shapes – "Tue 7 Oct 19:00",
+"24.05.2025 20:00", "lør 12. okt kl. 21", "7.–9. okt", "7 Oct – 9 Oct", "19:00–23:00",
+"i morgen kl 20" – so a handful of precompiled patterns and lookup tables
+cover them at a fraction of dateparser's import and per-call cost.
+
+Like dateparser, the whole string has to be a date: text with anything else
+around it (titles, venues, navigation) is not a match and ``None`` is
+returned. The dateparser-compatible settings used by the scrapers are
+honoured: ``DATE_ORDER`` (``DMY``/``MDY``) for numeric dates,
+``PREFER_DATES_FROM`` for dates without a year or weekday-only dates,
+``TIMEZONE`` and ``RETURN_AS_TIMEZONE_AWARE``.
+
+Run ``python -m scraper.dates [corpus.json]`` to benchmark the grammar
+against dateparser on a corpus of real strings.
+"""
+from __future__ import annotations
+
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import date, datetime, time, timedelta
+from typing import Any, Iterator, Mapping, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+MONTHS = {
+    "januar": 1, "january": 1, "jan": 1,
+    "februar": 2, "february": 2, "feb": 2,
+    "mars": 3, "march": 3, "mar": 3,
+    "april": 4, "apr": 4,
+    "mai": 5, "may": 5,
+    "juni": 6, "june": 6, "jun": 6,
+    "juli": 7, "july": 7, "jul": 7,
+    "august": 8, "aug": 8,
+    "september": 9, "sept": 9, "sep": 9,
+    "oktober": 10, "october": 10, "okt": 10, "oct": 10,
+    "november": 11, "nov": 11,
+    "desember": 12, "december": 12, "des": 12, "dec": 12,
+}
+WEEKDAYS = {
+    "mandag": 0, "monday": 0, "man": 0, "mon": 0, "ma": 0,
+    "tirsdag": 1, "tuesday": 1, "tues": 1, "tir": 1, "tue": 1, "ti": 1,
+    "onsdag": 2, "wednesday": 2, "ons": 2, "wed": 2, "on": 2,
+    "torsdag": 3, "thursday": 3, "thurs": 3, "thur": 3, "tor": 3, "thu": 3, "to": 3,
+    "fredag": 4, "friday": 4, "fre": 4, "fri": 4, "fr": 4,
+    "lørdag": 5, "saturday": 5, "lør": 5, "sat": 5, "lø": 5,
+    "søndag": 6, "sunday": 6, "søn": 6, "sun": 6, "sø": 6,
+}
+RELATIVE = {
+    "today": 0, "tonight": 0, "idag": 0, "i dag": 0, "i kveld": 0, "ikveld": 0,
+    "tomorrow": 1, "imorgen": 1, "i morgen": 1,
+}
+
+
+def _alternation(words) -> str:
+    return "|".join(re.escape(w).replace("\\ ", r"\s+") for w in sorted(words, key=len, reverse=True))
+
+
+_MONTH = _alternation(MONTHS)
+_WEEKDAY = rf"(?:{_alternation(WEEKDAYS)})\b\.?,?\s*"
+_ORDINAL = r"(?:\.|st|nd|rd|th)?"
+_YEAR = r"(?:,?\s*(?P<{}>\d{{4}}))?"
+
+_DATE = rf"""
+    (?:(?P<rel>{_alternation(RELATIVE)})\b)?
+    \s*
+    (?:(?P<wd>{_alternation(WEEKDAYS)})\b\.?,?\s*)?
+    (?:
+        # 7 Oct / 12. okt 2025 / 7.-9. okt / 7th of October / 30. okt - 2. nov
+        (?P<d1>\d{{1,2}}){_ORDINAL}\s*(?:-\s*(?P<ed1>\d{{1,2}}){_ORDINAL}\s*)?(?:of\s+)?
+        (?P<m1>{_MONTH})\b\.?{_YEAR.format("y1")}
+        (?:\s*-\s*(?:{_WEEKDAY})?(?P<xd1>\d{{1,2}}){_ORDINAL}\s*(?P<xm1>{_MONTH})\b\.?{_YEAR.format("xy1")})?
+      | # Oct 7 / October 7th, 2025 / Oct 7-9 / Oct 30 - Nov 2
+        (?P<m2>{_MONTH})\b\.?\s*(?P<d2>\d{{1,2}})(?:st|nd|rd|th)?(?:\s*-\s*(?P<ed2>\d{{1,2}}))?{_YEAR.format("y2")}
+        (?:\s*-\s*(?:{_WEEKDAY})?(?P<xm2>{_MONTH})\b\.?\s*(?P<xd2>\d{{1,2}})(?:st|nd|rd|th)?{_YEAR.format("xy2")})?
+      | # 2025-10-07
+        (?P<y3>\d{{4}})-(?P<m3>\d{{1,2}})-(?P<d3>\d{{1,2}})t?
+      | # 24.05.2025 / 24.05.25 / 24.05. / 24/5 / 11.10.-30.11.2025
+        (?P<a>\d{{1,2}})[./-](?P<b>\d{{1,2}})(?:[./-](?P<c>\d{{4}}|\d{{2}})\b)?\.?
+        (?:\s*-\s*(?P<ea>\d{{1,2}})[./-](?P<eb>\d{{1,2}})(?:[./-](?P<ec>\d{{4}}|\d{{2}})\b)?\.?)?
+    )?
+"""
+_TIME = r"""
+    (?:\s*[,|-]?\s*(?:(?P<kl>kl\.?|klokken|at|@|fra|from)\s*)?
+        (?P<h>\d{1,2})(?:[:.](?P<mi>\d{2})(?::\d{2})?)?\s*(?P<ap>am|pm)?
+        (?:\s*(?:-|til|to|until)\s*(?:kl\.?\s*)?
+            (?P<eh>\d{1,2})(?:[:.](?P<emi>\d{2}))?\s*(?P<eap>am|pm)?
+        )?
+    )?
+"""
+_GRAMMAR = re.compile(rf"{_DATE}{_TIME}", re.VERBOSE | re.IGNORECASE)
+_TIME_ONLY = re.compile(_TIME, re.VERBOSE | re.IGNORECASE)
+# Where a date can start inside running text: a number or a date word.
+_ANCHOR = re.compile(
+    rf"\b(?:{_alternation(RELATIVE)}|{_alternation(WEEKDAYS)}|{_MONTH})\b|\b\d",
+    re.IGNORECASE,
+)
+# No date we read is longer than "onsdag 22. oktober 2025 kl. 19.30 - 23.00".
+SEARCH_WINDOW = 64
+_DASHES = re.compile("[\u2010-\u2015\u2212]")
+_SPACES = re.compile(r"\s+")
+
+Span = Tuple[datetime, Optional[datetime]]
+
+
+class ReferenceUse:
+    """Whether any date parsed in a :func:`track_reference_date` block needed "today"."""
+
+    __slots__ = ("used",)
+
+    def __init__(self) -> None:
+        self.used = False
+
+
+_REFERENCE: ContextVar[Optional[ReferenceUse]] = ContextVar("spontis_date_reference", default=None)
+
+
+@contextmanager
+def track_reference_date() -> Iterator[ReferenceUse]:
+    """Record whether the dates parsed inside the block depend on the run date.
+
+    Yearless ("24. mai"), weekday-only, relative ("i morgen") and time-only
+    strings resolve against today; explicit dates do not. Callers that keep
+    results across runs (:mod:`scraper.extract_cache`) use this to tell which
+    results are only valid for the day they were parsed on. Blocks nest: a
+    use inside an inner block counts for the outer one as well.
+    """
+
+    outer = _REFERENCE.get()
+    use = ReferenceUse()
+    token = _REFERENCE.set(use)
+    try:
+        yield use
+    finally:
+        _REFERENCE.reset(token)
+        if use.used and outer is not None:
+            outer.used = True
+
+
+def note_reference_date() -> None:
+    """Mark the enclosing :func:`track_reference_date` block as date-dependent."""
+
+    use = _REFERENCE.get()
+    if use is not None:
+        use.used = True
+
+
+def _clock(hour: Optional[str], minute: Optional[str], ampm: Optional[str]) -> Optional[time]:
+    if hour is None:
+        return None
+    h, m = int(hour), int(minute or 0)
+    if ampm:
+        if not 1 <= h <= 12:
+            return None
+        h = h % 12 + (12 if ampm.lower() == "pm" else 0)
+    if h > 23 or m > 59:
+        return None
+    return time(h, m)
+
+
+def _times(match: "re.Match[str]") -> Optional[Tuple[Optional[time], Optional[time]]]:
+    if match["h"] is None:
+        return None, None
+    # A bare number is only an hour when something marks it as one.
+    if not (match["mi"] or match["kl"] or match["ap"]):
+        return None
+    start = _clock(match["h"], match["mi"], match["ap"])
+    end = _clock(match["eh"], match["emi"], match["eap"] or (match["ap"] if match["eh"] else None))
+    if start is None or (match["eh"] is not None and end is None):
+        return None
+    return start, end
+
+
+def _day_month(first: str, second: str, order: str) -> Tuple[str, int]:
+    return (first, int(second)) if order == "DMY" else (second, int(first))
+
+
+def _full_year(year: Optional[str]) -> Optional[str]:
+    return f"20{year}" if year and len(year) == 2 else year
+
+
+def _year_for(month: int, day: int, today: date, prefer: str) -> int:
+    year = today.year
+    try:
+        candidate = date(year, month, day)
+    except ValueError:
+        # 29 February outside a leap year; the caller rejects it if the guess fails too.
+        return year + (1 if prefer == "future" else -1 if prefer == "past" else 0)
+    if prefer == "future" and candidate < today:
+        return year + 1
+    if prefer == "past" and candidate > today:
+        return year - 1
+    return year
+
+
+def _resolve_day(match: "re.Match[str]", today: date, settings: Mapping[str, Any]) -> Optional[Tuple[date, Optional[date]]]:
+    prefer = settings.get("PREFER_DATES_FROM") or "current_period"
+    end_day: Optional[str] = None
+    year: Optional[str] = None
+    if match["m1"] or match["m2"]:
+        month = MONTHS[(match["m1"] or match["m2"]).lower()]
+        day = match["d1"] or match["d2"]
+        end_day = match["ed1"] or match["ed2"]
+        year = match["y1"] or match["y2"]
+    elif match["y3"]:
+        year, month, day = match["y3"], int(match["m3"]), match["d3"]
+    elif match["a"]:
+        order = settings.get("DATE_ORDER") or "DMY"
+        if order not in ("DMY", "MDY"):
+            return None
+        day, month = _day_month(match["a"], match["b"], order)
+        year = _full_year(match["c"] or match["ec"])
+        if match["ea"]:
+            end_day, end_month = _day_month(match["ea"], match["eb"], order)
+            if end_month != month:
+                try:
+                    start = date(int(year) if year else _year_for(month, int(day), today, prefer), month, int(day))
+                    end = date(int(_full_year(match["ec"]) or start.year), end_month, int(end_day))
+                except ValueError:
+                    return None
+                return start, end if end >= start else None
+    elif match["rel"]:
+        start = today + timedelta(days=RELATIVE[_SPACES.sub(" ", match["rel"].lower())])
+        return start, None
+    elif match["wd"]:
+        if len(match["wd"]) < 3:
+            # "on", "to", "ma" … are only weekdays in front of a date.
+            return None
+        weekday = WEEKDAYS[match["wd"].lower()]
+        ahead = (weekday - today.weekday()) % 7
+        if prefer == "past":
+            ahead = ahead - 7 if ahead else 0
+        return today + timedelta(days=ahead), None
+    else:
+        return today, None
+
+    try:
+        if match["xm1"] or match["xm2"]:
+            # "7 Oct - 9 Oct", "30. des - 2. jan 2026": the end names its own
+            # month, and its year (if any) dates the start as well.
+            end_month = MONTHS[(match["xm1"] or match["xm2"]).lower()]
+            end_day, end_year = match["xd1"] or match["xd2"], match["xy1"] or match["xy2"]
+            if end_year and not year:
+                start = date(int(end_year), month, int(day))
+                end = date(int(end_year), end_month, int(end_day))
+                if start > end:
+                    start = start.replace(year=start.year - 1)
+            else:
+                start = date(int(year) if year else _year_for(month, int(day), today, prefer), month, int(day))
+                end = date(int(end_year or start.year), end_month, int(end_day))
+                if end < start and not end_year:
+                    end = end.replace(year=end.year + 1)
+            return start, end if end >= start else None
+        resolved_year = int(year) if year else _year_for(month, int(day), today, prefer)
+        start = date(resolved_year, month, int(day))
+        end = date(resolved_year, month, int(end_day)) if end_day else None
+    except ValueError:
+        return None
+    if end is not None and end < start:
+        end = None
+    return start, end
+
+
+def parse_event_range(
+    text: Optional[str],
+    *,
+    settings: Optional[Mapping[str, Any]] = None,
+    now: Optional[datetime] = None,
+) -> Optional[Span]:
+    """Return ``(start, end)`` for ``text``; ``end`` is ``None`` without a range."""
+
+    if not text:
+        return None
+    settings = settings or {}
+    cleaned = _SPACES.sub(" ", _DASHES.sub("-", text.strip().lower())).strip(" ,")
+    if not cleaned:
+        return None
+
+    match = _GRAMMAR.fullmatch(cleaned)
+    times = _times(match) if match is not None else None
+    if match is not None and match["rel"] and any(match[g] for g in ("wd", "m1", "m2", "y3", "a")):
+        times = None
+    if times == (None, None) and match["a"] and not match["c"] and not 1 <= int(match["b"]) <= 12:
+        # "19.00" or "20.30" on its own is a clock time, not a day and month.
+        times = None
+    if times is None:
+        match = _TIME_ONLY.fullmatch(cleaned)
+        times = _times(match) if match is not None else None
+        if times is None or times[0] is None:
+            return None
+
+    zone = ZoneInfo(settings.get("TIMEZONE") or "Europe/Oslo")
+    if now is None:
+        now = datetime.now(zone)
+    elif now.tzinfo is not None:
+        now = now.astimezone(zone)
+    today = now.date()
+    days = _resolve_day(match, today, settings) if match.re is _GRAMMAR else (today, None)
+    if days is None:
+        return None
+    start_day, end_day = days
+    start_time, end_time = times
+
+    if start_time is None:
+        # dateparser keeps the current clock time for a bare "today"/"tomorrow".
+        clock = now.time().replace(tzinfo=None) if match["rel"] else time()
+        start = datetime.combine(start_day, clock)
+        end = datetime.combine(end_day, time()) if end_day else None
+    else:
+        start = datetime.combine(start_day, start_time)
+        end = None
+        if end_time is not None:
+            end = datetime.combine(end_day or start_day, end_time)
+            if end <= start:
+                end += timedelta(days=1)
+        elif end_day is not None:
+            end = datetime.combine(end_day, start_time)
+
+    if match.re is not _GRAMMAR or not any(match[g] for g in ("y1", "y2", "y3", "c", "ec", "xy1", "xy2")):
+        note_reference_date()
+    if settings.get("RETURN_AS_TIMEZONE_AWARE") is True:
+        start = start.replace(tzinfo=zone)
+        end = end.replace(tzinfo=zone) if end else None
+    return start, end
+
+
+def parse_event_date(
+    text: Optional[str],
+    *,
+    settings: Optional[Mapping[str, Any]] = None,
+    now: Optional[datetime] = None,
+) -> Optional[datetime]:
+    span = parse_event_range(text, settings=settings, now=now)
+    return span[0] if span else None
+
+
+def iter_event_dates(
+    text: Optional[str],
+    *,
+    settings: Optional[Mapping[str, Any]] = None,
+    now: Optional[datetime] = None,
+) -> Iterator[Tuple[datetime, bool]]:
+    """Yield ``(start, confident)`` for every date found inside running text.
+
+    Each candidate is matched in a window of :data:`SEARCH_WINDOW` characters
+    from a number or date word, so the cost per candidate does not depend on
+    the length of ``text``. A hit is confident when it names a day (month
+    name, numeric or ISO date) or is a relative day with a time; bare
+    weekdays and day/month pairs without year or time are not (opening
+    hours, ratings, prices).
+    """
+
+    if not text:
+        return
+    cleaned = _SPACES.sub(" ", _DASHES.sub("-", text.lower()))
+    resume = 0
+    for anchor in _ANCHOR.finditer(cleaned):
+        start = anchor.start()
+        if start < resume:
+            continue
+        match = _GRAMMAR.match(cleaned, start, min(len(cleaned), start + SEARCH_WINDOW))
+        if match is None or match.end() <= anchor.end() and not match["h"]:
+            continue
+        found = match.group().rstrip()
+        end = start + len(found)
+        # Stopping inside a token ("oct 19" of "oct 19:00") is not a date.
+        following = cleaned[end:end + 1]
+        if following.isalnum() or following == ":":
+            continue
+        span = parse_event_range(found, settings=settings, now=now)
+        if span is None:
+            continue
+        resume = end
+        confident = bool(
+            match["m1"] or match["m2"] or match["y3"] or match["c"]
+            or (match["a"] and match["h"]) or (match["rel"] and match["h"])
+        )
+        yield span[0], confident
+
+
+def search_event_date(
+    text: Optional[str],
+    *,
+    settings: Optional[Mapping[str, Any]] = None,
+    now: Optional[datetime] = None,
+) -> Optional[datetime]:
+    """First confident date inside ``text``, else the first tentative one."""
+
+    tentative: Optional[datetime] = None
+    for start, confident in iter_event_dates(text, settings=settings, now=now):
+        if confident:
+            return start
+        if tentative is None:
+            tentative = start
+    return tentative
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    import argparse
+    import json
+    import time as clock
+    from pathlib import Path
+
+    parser = argparse.ArgumentParser(description="Benchmark the event-date grammar against dateparser.")
+    parser.add_argument("corpus", nargs="?", default=str(Path(__file__).resolve().parents[1] / "tests" / "data" / "date_corpus.json"))
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument(
+        "--max-us",
+        type=float,
+        default=None,
+        help="exit non-zero when the grammar needs more than this many µs per string",
+    )
+    args = parser.parse_args(argv)
+
+    corpus = json.loads(Path(args.corpus).read_text(encoding="utf-8"))
+    texts = [case["text"] for case in corpus["cases"]]
+    now = datetime.fromisoformat(corpus["now"])
+    settings = corpus["settings"]
+
+    started = clock.perf_counter()
+    for _ in range(args.rounds):
+        for text in texts:
+            parse_event_date(text, settings=settings, now=now)
+    grammar = (clock.perf_counter() - started) / (args.rounds * len(texts))
+    print(f"grammar:    {grammar * 1e6:8.1f} µs/string")
+    if args.max_us is not None and grammar * 1e6 > args.max_us:
+        print(f"grammar is over the {args.max_us:.1f} µs/string budget")
+        return 1
+
+    try:
+        started = clock.perf_counter()
+        from dateparser.date import DateDataParser
+    except ImportError:
+        return 0
+    imported = clock.perf_counter() - started
+    date_parser = DateDataParser(languages=["nb", "en"], settings=settings)
+    started = clock.perf_counter()
+    for text in texts:
+        date_parser.get_date_data(text)
+    fallback = (clock.perf_counter() - started) / len(texts)
+    print(f"dateparser: {fallback * 1e6:8.1f} µs/string (+{imported:.2f} s import)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
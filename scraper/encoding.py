@@ -0,0 +1,168 @@
+"""Cheap charset resolution for fetched pages.
+
+Statistical detection (``Response.apparent_encoding``) scans the whole body
+and is by far the most expensive way to pick a codec, so it is the last
+step. Before that we trust, in order: an explicit ``charset`` in the
+Content-Type header, a byte-order mark, a ``<meta charset>`` declaration
+near the top of the document, a strict UTF-8 decode, and the encoding this
+host used last time. Declared and detected encodings are remembered per
+host, and the memory is persisted next to the HTTP cache so later runs
+start warm.
+"""
+from __future__ import annotations
+
+import codecs
+import json
+import logging
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Callable, Mapping, Optional
+
+LOGGER = logging.getLogger("spontis.scraper.encoding")
+
+# ``<meta charset>`` must appear within the first 1024 bytes per the HTML
+# spec; sites with long <head> preambles push it further, so look a bit wider.
+SNIFF_BYTES = int(os.getenv("SPONTIS_HTTP_SNIFF_BYTES", "4096"))
+
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+_HEADER_CHARSET = re.compile(r"charset\s*=\s*[\"']?([\w.:-]+)", re.IGNORECASE)
+_META_CHARSET = re.compile(rb"<meta[^>]+charset\s*=\s*[\"']?\s*([\w.:-]+)", re.IGNORECASE)
+# Servers that send no charset or default to Latin-1 frequently serve UTF-8.
+_LATIN_DEFAULTS = {"iso8859-1", "latin-1", "cp1252", "ascii"}
+_UTF8_TYPES = ("application/json", "application/ld+json", "application/javascript", "text/javascript")
+
+
+def _normalise(name: Optional[str]) -> Optional[str]:
+    if not name:
+        return None
+    try:
+        return codecs.lookup(name.strip()).name
+    except LookupError:
+        return None
+
+
+def _is_utf8(body: bytes) -> bool:
+    try:
+        body.decode("utf-8")
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def header_charset(content_type: Optional[str]) -> Optional[str]:
+    match = _HEADER_CHARSET.search(content_type or "")
+    return _normalise(match.group(1)) if match else None
+
+
+def bom_charset(body: bytes) -> Optional[str]:
+    for bom, name in _BOMS:
+        if body.startswith(bom):
+            return name
+    return None
+
+
+def meta_charset(body: bytes) -> Optional[str]:
+    match = _META_CHARSET.search(body[:SNIFF_BYTES])
+    return _normalise(match.group(1).decode("ascii", "ignore")) if match else None
+
+
+class EncodingMemory:
+    """Thread-safe ``host -> codec`` map, optionally backed by a JSON file."""
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+        self._hosts: Optional[dict[str, str]] = None
+
+    @classmethod
+    def from_env(cls) -> "EncodingMemory":
+        if os.getenv("SPONTIS_HTTP_CACHE", "1") == "0":
+            return cls()
+        from scraper.http_cache import DEFAULT_CACHE_DIR
+
+        directory = Path(os.getenv("SPONTIS_HTTP_CACHE_DIR") or DEFAULT_CACHE_DIR).expanduser()
+        return cls(directory / "encodings.json")
+
+    def _load(self) -> dict[str, str]:
+        if self._hosts is None:
+            self._hosts = {}
+            if self.path is not None:
+                try:
+                    payload = json.loads(self.path.read_text(encoding="utf-8"))
+                except (OSError, ValueError):
+                    payload = {}
+                if isinstance(payload, dict):
+                    self._hosts = {str(k): str(v) for k, v in payload.items() if _normalise(str(v))}
+        return self._hosts
+
+    def get(self, host: str) -> Optional[str]:
+        if not host:
+            return None
+        with self._lock:
+            return self._load().get(host)
+
+    def remember(self, host: str, encoding: str) -> None:
+        if not host:
+            return
+        with self._lock:
+            hosts = self._load()
+            if hosts.get(host) == encoding:
+                return
+            hosts[host] = encoding
+            if self.path is None:
+                return
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self.path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+                tmp.write_text(json.dumps(hosts, sort_keys=True), encoding="utf-8")
+                os.replace(tmp, self.path)
+            except OSError as exc:
+                LOGGER.debug("Could not persist encoding memory: %s", exc)
+
+
+def resolve_encoding(
+    headers: Mapping[str, str],
+    body: bytes,
+    host: str,
+    memory: Optional[EncodingMemory],
+    detect: Callable[[], Optional[str]],
+) -> str:
+    """Pick the codec for ``body``; ``detect`` is only called as a last resort."""
+
+    utf8_state: list[bool] = []
+
+    def is_utf8() -> bool:
+        if not utf8_state:
+            utf8_state.append(_is_utf8(body))
+        return utf8_state[0]
+
+    content_type = headers.get("Content-Type") or headers.get("content-type") or ""
+    declared = header_charset(content_type)
+    if declared in _LATIN_DEFAULTS and not body.isascii() and is_utf8():
+        declared = "utf-8"
+    if declared is None and content_type.split(";", 1)[0].strip().lower() in _UTF8_TYPES:
+        declared = "utf-8"
+
+    encoding = declared or bom_charset(body) or meta_charset(body)
+    if encoding == "utf-8" and not is_utf8():
+        # Mislabelled page (typically Latin-1 served as UTF-8).
+        encoding = None
+    if encoding is None:
+        # A strict UTF-8 decode runs at memory speed and settles most pages.
+        if is_utf8():
+            return "utf-8"
+        encoding = memory.get(host) if memory is not None else None
+        if encoding is not None:
+            return encoding
+        encoding = _normalise(detect()) or "utf-8"
+    if memory is not None:
+        memory.remember(host, encoding)
+    return encoding
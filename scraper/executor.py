@@ -0,0 +1,174 @@
+"""Bounded concurrent execution of scraper sources."""
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import inspect
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Iterable, List, Optional, Sequence, Tuple, Union
+
+LOGGER = logging.getLogger("spontis.scraper.executor")
+
+DEFAULT_WORKERS = int(os.getenv("SPONTIS_SOURCE_WORKERS", "8"))
+DEFAULT_SOURCE_TIMEOUT = float(os.getenv("SPONTIS_SOURCE_TIMEOUT", "180"))
+
+STATUS_OK = "ok"
+STATUS_ERROR = "error"
+STATUS_TIMEOUT = "timeout"
+
+Fetcher = Callable[[], Iterable[dict]]
+AsyncFetcher = Callable[[], Awaitable[Iterable[dict]]]
+AnyFetcher = Union[Fetcher, AsyncFetcher]
+
+
+@dataclass
+class SourceResult:
+    name: str
+    status: str
+    events: List[dict] = field(default_factory=list)
+    error: Optional[str] = None
+    duration: float = 0.0
+
+    def as_stat(self) -> dict:
+        stat = {
+            "name": self.name,
+            "status": self.status,
+            "events": len(self.events),
+            "duration_s": round(self.duration, 2),
+        }
+        if self.error:
+            stat["error"] = self.error
+        return stat
+
+
+def _settle(future: "asyncio.Future[Any]", result: Any, exc: Optional[BaseException]) -> None:
+    if future.done():
+        return
+    if exc is not None:
+        future.set_exception(exc)
+    else:
+        future.set_result(result)
+
+
+def run_in_daemon_thread(func: Callable[[], Any]) -> "asyncio.Future[Any]":
+    """Run a blocking callable on a daemon thread and expose it as a future.
+
+    Unlike ``asyncio.to_thread`` the thread is not owned by an executor, so a
+    source that never returns cannot block loop shutdown or interpreter exit.
+    Context variables (such as the per-source HTTP policy) are carried over.
+    """
+
+    loop = asyncio.get_running_loop()
+    future: "asyncio.Future[Any]" = loop.create_future()
+    context = contextvars.copy_context()
+
+    def target() -> None:
+        result: Any = None
+        error: Optional[BaseException] = None
+        try:
+            result = context.run(func)
+        except BaseException as exc:  # noqa: BLE001 - handed to the awaiting task
+            error = exc
+        try:
+            loop.call_soon_threadsafe(_settle, future, result, error)
+        except RuntimeError:
+            # The loop is gone: the source already timed out and was abandoned.
+            pass
+
+    threading.Thread(target=target, name=f"source-{getattr(func, '__name__', 'fetch')}", daemon=True).start()
+    return future
+
+
+def to_async(fetch: Fetcher) -> AsyncFetcher:
+    """Adapt a synchronous ``fetch()`` to the async source contract."""
+
+    async def fetch_async() -> List[dict]:
+        return await run_in_daemon_thread(lambda: list(fetch()))
+
+    fetch_async.__name__ = getattr(fetch, "__name__", "fetch")
+    return fetch_async
+
+
+def _as_async(fetch: AnyFetcher) -> AsyncFetcher:
+    if inspect.iscoroutinefunction(fetch):
+        return fetch  # type: ignore[return-value]
+    return to_async(fetch)  # type: ignore[arg-type]
+
+
+async def _run_one(
+    name: str,
+    fetch: AnyFetcher,
+    slots: asyncio.Semaphore,
+    timeout: Optional[float],
+) -> SourceResult:
+    async with slots:
+        LOGGER.info("Fetching %s", name)
+        started = time.monotonic()
+        try:
+            events = list(await asyncio.wait_for(_as_async(fetch)(), timeout))
+        except asyncio.TimeoutError:
+            LOGGER.warning("%s timed out after %.0fs", name, timeout)
+            return SourceResult(
+                name=name,
+                status=STATUS_TIMEOUT,
+                error=f"timed out after {timeout:.0f}s",
+                duration=time.monotonic() - started,
+            )
+        except Exception as exc:  # noqa: BLE001 - surfaced as a failed source
+            LOGGER.error("%s failed", name, exc_info=exc)
+            return SourceResult(
+                name=name,
+                status=STATUS_ERROR,
+                error=f"{type(exc).__name__}: {exc}",
+                duration=time.monotonic() - started,
+            )
+        duration = time.monotonic() - started
+        LOGGER.info("%s: %d events (%.1fs)", name, len(events), duration)
+        return SourceResult(name=name, status=STATUS_OK, events=events, duration=duration)
+
+
+async def run_sources_async(
+    sources: Sequence[Tuple[str, AnyFetcher]],
+    *,
+    workers: int = DEFAULT_WORKERS,
+    timeout: Optional[float] = DEFAULT_SOURCE_TIMEOUT,
+) -> List[SourceResult]:
+    """Run sync and async sources on one event loop, ``workers`` at a time."""
+
+    from scraper.http import close_async_sessions
+
+    slots = asyncio.Semaphore(max(1, workers))
+    deadline = timeout if timeout and timeout > 0 else None
+    try:
+        return list(
+            await asyncio.gather(*(_run_one(name, fetch, slots, deadline) for name, fetch in sources))
+        )
+    finally:
+        await close_async_sessions()
+
+
+def run_sources(
+    sources: Sequence[Tuple[str, AnyFetcher]],
+    *,
+    workers: int = DEFAULT_WORKERS,
+    timeout: Optional[float] = DEFAULT_SOURCE_TIMEOUT,
+) -> List[SourceResult]:
+    """Run ``sources`` concurrently and return their results in input order.
+
+    Each source gets ``timeout`` seconds from the moment it starts. Sources that
+    overrun are reported as timed out; async sources are cancelled and blocking
+    ones are abandoned on their daemon thread.
+    """
+
+    return asyncio.run(run_sources_async(sources, workers=workers, timeout=timeout))
+
+
+def flatten(results: Iterable[SourceResult]) -> List[dict]:
+    collected: List[dict] = []
+    for result in results:
+        collected.extend(result.events)
+    return collected
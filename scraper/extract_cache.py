@@ -0,0 +1,214 @@
+"""Cross-run memo of the fields sources extract from detail pages.
+
+Detail pages rarely change between daily runs, yet parsing them with
+BeautifulSoup and running ``dateparser`` over them is the bulk of a source's
+CPU time. :class:`ExtractCache` stores the extracted fields (``starts_at``,
+``description``, ``venue``, ``ticket_url`` …) keyed by URL together with a
+hash of the page body and a fingerprint of the source module, of the shared
+date and locator code every extractor delegates to (:data:`SHARED_MODULES`)
+and of any modules it names in ``depends``, such as a shared extraction
+engine. An unchanged page from an unchanged scraper is answered from disk
+without parsing; editing any of those modules invalidates the entries
+automatically.
+
+Yearless, weekday-only and relative dates ("24. mai", "lør", "i morgen")
+resolve against the run date, so an entry whose extraction read one of them
+(see :func:`scraper.dates.track_reference_date`) is only reused on the day it
+was written. Each source's directory is capped at
+``SPONTIS_EXTRACT_CACHE_MAX_MB``; the least recently used entries go first.
+"""
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Optional, Sequence
+
+from bs4 import BeautifulSoup
+
+from scraper import cassette
+from scraper.dates import track_reference_date
+from scraper.html import backend, parse_html
+from scraper.normalize import TZ
+
+LOGGER = logging.getLogger("spontis.scraper.extract_cache")
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_CACHE_DIR = ROOT / ".cache" / "extract"
+FORMAT_VERSION = 2
+DEFAULT_MAX_BYTES = int(float(os.getenv("SPONTIS_EXTRACT_CACHE_MAX_MB", "32")) * 1024 * 1024)
+# Extraction helpers behind every cached ``starts_at``: a fix to the date
+# grammar or the locator must not be masked by stale entries.
+SHARED_MODULES = ("scraper.locate", "scraper.dates", "scraper.normalize")
+
+Fields = dict[str, Any]
+Extractor = Callable[[BeautifulSoup], Fields]
+
+
+def _digest(value: bytes) -> str:
+    return hashlib.sha256(value).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def module_fingerprint(module_name: str) -> str:
+    """Hash of the module's source file; changes whenever the scraper is edited."""
+
+    spec = importlib.util.find_spec(module_name)
+    origin = spec.origin if spec else None
+    try:
+        source = Path(origin).read_bytes() if origin else module_name.encode("utf-8")
+    except OSError:
+        source = module_name.encode("utf-8")
+    return f"{FORMAT_VERSION}:{_digest(source)[:16]}"
+
+
+def _today() -> str:
+    return datetime.now(TZ).date().isoformat()
+
+
+def _encode(fields: Fields) -> Fields:
+    return {
+        key: {"__datetime__": value.isoformat()} if isinstance(value, datetime) else value
+        for key, value in fields.items()
+    }
+
+
+def _decode(fields: Fields) -> Fields:
+    decoded: Fields = {}
+    for key, value in fields.items():
+        if isinstance(value, dict) and "__datetime__" in value:
+            value = datetime.fromisoformat(value["__datetime__"])
+        decoded[key] = value
+    return decoded
+
+
+class ExtractCache:
+    """Per-source store of extracted detail fields, one small JSON file per URL."""
+
+    def __init__(
+        self,
+        module_name: str,
+        directory: Optional[Path] = None,
+        *,
+        depends: Sequence[str] = (),
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        self.module_name = module_name
+        self.depends = tuple(dict.fromkeys((*SHARED_MODULES, *depends)))
+        self.max_bytes = max_bytes
+        self._directory = Path(directory) if directory else None
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def directory(self) -> Optional[Path]:
+        if self._directory is not None:
+            return self._directory
+        if os.getenv("SPONTIS_EXTRACT_CACHE", "1") == "0":
+            return None
+        base = Path(os.getenv("SPONTIS_EXTRACT_CACHE_DIR") or DEFAULT_CACHE_DIR).expanduser()
+        return base / self.module_name.rsplit(".", 1)[-1]
+
+    def _path(self, directory: Path, url: str) -> Path:
+        return directory / f"{_digest(url.encode('utf-8'))[:32]}.json"
+
+    def _read(self, path: Path) -> Optional[dict]:
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, path: Path, entry: dict) -> None:
+        data = json.dumps(entry, ensure_ascii=False).encode("utf-8")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            previous = path.stat().st_size if path.exists() else 0
+            tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        except OSError as exc:
+            LOGGER.debug("Could not persist extracted fields for %s: %s", entry.get("url"), exc)
+            return
+        with self._lock:
+            self._size = self._current_size(path.parent) + len(data) - previous
+            if self._size > self.max_bytes:
+                self._evict(path.parent)
+
+    # -- eviction ------------------------------------------------------------
+
+    def _current_size(self, directory: Path) -> int:
+        if self._size is None:
+            self._size = sum(entry.stat().st_size for entry in directory.glob("*.json"))
+        return self._size
+
+    def _evict(self, directory: Path) -> None:
+        # Hits touch their entry, so mtime orders entries by last use.
+        entries = sorted(directory.glob("*.json"), key=lambda entry: entry.stat().st_mtime)
+        size = sum(entry.stat().st_size for entry in entries)
+        target = int(self.max_bytes * 0.9)
+        removed = 0
+        for entry in entries:
+            if size <= target:
+                break
+            size -= entry.stat().st_size
+            entry.unlink(missing_ok=True)
+            removed += 1
+        self._size = size
+        if removed:
+            LOGGER.info("Evicted %d extracted entries for %s (%.1f MB kept)", removed, self.module_name, size / 1_048_576)
+
+    def extract(self, url: str, text: Optional[str], extractor: Extractor) -> Optional[Fields]:
+        """Return ``extractor(soup)`` for the page, reusing the stored result if unchanged.
+
+        ``None`` is returned when ``text`` is empty (the fetch failed).
+        """
+
+        if not text:
+            return None
+        directory = self.directory
+        if directory is None or cassette.active() is not None:
+            soup = parse_html(text)
+            return extractor(soup) if soup is not None else None
+
+        path = self._path(directory, url)
+        body_hash = _digest(text.encode("utf-8", "surrogatepass"))
+        # The tree builder can change what selectors match, so it is part of the key.
+        fingerprints = ":".join(module_fingerprint(name) for name in (self.module_name, *self.depends))
+        version = f"{fingerprints}:{backend()}"
+        today = _today()
+        entry = self._read(path)
+        if (
+            entry
+            and entry.get("hash") == body_hash
+            and entry.get("version") == version
+            and entry.get("today", today) == today
+        ):
+            with self._lock:
+                self.hits += 1
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+            return _decode(entry.get("fields") or {})
+
+        with self._lock:
+            self.misses += 1
+        soup = parse_html(text)
+        if soup is None:
+            return None
+        with track_reference_date() as reference:
+            fields = extractor(soup)
+        entry = {"url": url, "hash": body_hash, "version": version, "fields": _encode(fields)}
+        if reference.used:
+            # Resolved against today: a later run must parse the page again.
+            entry["today"] = today
+        self._write(path, entry)
+        return fields
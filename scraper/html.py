@@ -0,0 +1,186 @@
+"""HTML parsing front-end shared by all scraper sources.
+
+Sources call :func:`parse_html` / :func:`make_soup` instead of building
+``BeautifulSoup(text, "html.parser")`` themselves, so the tree builder can be
+swapped in one place. The default backend is lxml's C parser, which is several
+times faster than the pure-Python ``html.parser``; both produce regular
+BeautifulSoup trees, so ``select``, ``find``, ``find_all``, ``parents`` and
+``stripped_strings`` behave the same for every backend.
+
+The backend is chosen, in order, from the per-source override
+(``SourceConfig.html_parser``, applied with :func:`parser_backend`), the
+``SPONTIS_HTML_PARSER`` environment variable, and finally lxml when it is
+installed or ``html.parser`` otherwise.
+
+:func:`segment_cards` splits listing pages into event cards.
+
+Sources that only look at a few tags can pass a :class:`ParseOnly` spec to
+build a reduced tree: ``<script>``/``<style>``/``<svg>`` bodies and comments
+are cut from the markup before the parser sees them (JSON-LD is kept for
+:mod:`scraper.structured`), and with ``names`` a ``SoupStrainer`` keeps only
+those elements and their subtrees. Heavy CMS pages that are mostly inline
+scripts and icons then parse faster and use less memory.
+"""
+from __future__ import annotations
+
+import importlib.util
+import logging
+import os
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Iterator, Optional, Tuple
+
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+
+HAS_LXML = importlib.util.find_spec("lxml") is not None
+
+LOGGER = logging.getLogger("spontis.scraper.html")
+
+LXML = "lxml"
+HTML_PARSER = "html.parser"
+BACKENDS = (LXML, HTML_PARSER)
+
+_SOURCE_BACKEND: ContextVar[Optional[str]] = ContextVar("spontis_html_backend", default=None)
+
+STRIP_TAGS = ("script", "style", "svg", "noscript", "template")
+
+
+@dataclass(frozen=True)
+class ParseOnly:
+    """What a source needs from a page; everything else is left out of the tree."""
+
+    # Elements kept (with their subtrees); empty keeps the whole document.
+    names: Tuple[str, ...] = ()
+    # Elements whose bodies are cut from the markup before parsing.
+    strip: Tuple[str, ...] = STRIP_TAGS
+
+
+@lru_cache(maxsize=32)
+def _strip_pattern(names: Tuple[str, ...]) -> "re.Pattern[str]":
+    # The name must end at whitespace, ``/`` or ``>`` so custom elements such
+    # as ``<style-x>`` are left alone.
+    alternation = "|".join(re.escape(name) for name in names)
+    return re.compile(rf"<!--.*?-->|<({alternation})(?=[\s/>])([^>]*?)(?<!/)>.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+
+
+def _keep_ld_json(match: "re.Match[str]") -> str:
+    if match.group(1) and match.group(1).lower() == "script" and "ld+json" in match.group(2).lower():
+        return match.group(0)
+    return ""
+
+
+def strip_markup(markup: str, names: Tuple[str, ...] = STRIP_TAGS) -> str:
+    """``markup`` without comments and the bodies of ``names`` (JSON-LD scripts survive)."""
+
+    if not names:
+        return markup
+    return _strip_pattern(tuple(names)).sub(_keep_ld_json, markup)
+
+
+@lru_cache(maxsize=32)
+def _strainer(names: Tuple[str, ...]) -> Optional[SoupStrainer]:
+    if not names:
+        return None
+    # Structured data lives in JSON-LD scripts wherever the page puts them.
+    return SoupStrainer(list(dict.fromkeys((*names, "script"))))
+
+
+@contextmanager
+def parser_backend(name: Optional[str]) -> Iterator[None]:
+    """Parse with ``name`` for everything in the current context."""
+
+    token = _SOURCE_BACKEND.set(name)
+    try:
+        yield
+    finally:
+        _SOURCE_BACKEND.reset(token)
+
+
+def backend() -> str:
+    requested = _SOURCE_BACKEND.get() or os.getenv("SPONTIS_HTML_PARSER") or (LXML if HAS_LXML else HTML_PARSER)
+    if requested not in BACKENDS:
+        LOGGER.warning("Unknown HTML parser %r, using %s", requested, HTML_PARSER)
+        return HTML_PARSER
+    if requested == LXML and not HAS_LXML:
+        return HTML_PARSER
+    return requested
+
+
+def make_soup(markup: str, parser: Optional[str] = None, *, parse_only: Optional[ParseOnly] = None) -> BeautifulSoup:
+    if parse_only is None:
+        return BeautifulSoup(markup, parser or backend())
+    return BeautifulSoup(
+        strip_markup(markup, parse_only.strip),
+        parser or backend(),
+        parse_only=_strainer(parse_only.names),
+    )
+
+
+def parse_html(
+    text: Optional[str],
+    parser: Optional[str] = None,
+    *,
+    parse_only: Optional[ParseOnly] = None,
+) -> Optional[BeautifulSoup]:
+    """Parse ``text``, or return ``None`` for an empty or failed download."""
+
+    if not text:
+        return None
+    return make_soup(text, parser, parse_only=parse_only)
+
+
+@lru_cache(maxsize=64)
+def _container_matcher(selector: str) -> Any:
+    return soupsieve.compile(selector)
+
+
+def _wraps_only(container: Tag, link: Tag) -> bool:
+    # A container holding nothing but the link gives no extra context.
+    return len(container.get_text(strip=True)) <= len(link.get_text(strip=True))
+
+
+def segment_cards(
+    root: Tag,
+    containers: str = "article, li, div",
+    *,
+    accept: Optional[Callable[[Tag], bool]] = None,
+) -> list[Tuple[Tag, Tag]]:
+    """Pair every ``<a href>`` under ``root`` with its smallest card container.
+
+    One pass over the links replaces ``root.select(containers)`` followed by
+    ``card.find("a")``, which visits nested wrappers (``article > div > div``)
+    once per level. For each link (optionally filtered by ``accept``) the
+    nearest ancestor matching the ``containers`` selector is the card;
+    wrappers holding nothing but the link are skipped in favour of the next
+    matching ancestor. Each ``(card, href)`` pair is returned once, in
+    document order, preferring the link that has text.
+    """
+
+    matcher = _container_matcher(containers)
+    cards: list[Tuple[Tag, Tag]] = []
+    index: dict[Tuple[int, str], int] = {}
+    for link in root.find_all("a", href=True):
+        if accept is not None and not accept(link):
+            continue
+        card: Optional[Tag] = None
+        for ancestor in link.parents:
+            if ancestor is root.parent:
+                break
+            if matcher.match(ancestor):
+                card = card or ancestor
+                if not _wraps_only(ancestor, link):
+                    card = ancestor
+                    break
+        if card is None:
+            continue
+        key = (id(card), link["href"])
+        if key not in index:
+            index[key] = len(cards)
+            cards.append((card, link))
+        elif not cards[index[key]][1].get_text(strip=True):
+            cards[index[key]] = (card, link)
+    return cards
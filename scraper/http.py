@@ -1,16 +1,160 @@
 """HTTP helpers with retry-aware sessions for the SPONTIS scraper."""
 from __future__ import annotations
 
+import asyncio
 import os
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
 from functools import lru_cache
-from typing import Any, Mapping, MutableMapping, Optional
+from typing import Any, AsyncIterator, Iterator, Mapping, MutableMapping, Optional
+from urllib.parse import urlsplit
 
 import requests
 from requests import Response
 from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
 from urllib3.util.retry import Retry
 
+from scraper import cassette
+from scraper.encoding import EncodingMemory, resolve_encoding
+from scraper.http_cache import CacheEntry, HttpCache
+
+try:  # pragma: no cover - exercised only when aiohttp is installed
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None  # type: ignore[assignment]
+
 DEFAULT_TIMEOUT = float(os.getenv("SPONTIS_HTTP_TIMEOUT", "25"))
+MAX_RETRY_AFTER = float(os.getenv("SPONTIS_HTTP_MAX_RETRY_AFTER", "120"))
+RETRY_AFTER_STATUSES = (429, 503)
+
+
+# --- per-host politeness -----------------------------------------------------
+
+
+@dataclass(frozen=True)
+class HostPolicy:
+    """Concurrency cap and minimum gap between request starts for one host."""
+
+    max_connections: int = 4
+    min_interval: float = 0.25
+
+    @classmethod
+    def from_env(cls) -> "HostPolicy":
+        return cls(
+            max_connections=max(1, int(os.getenv("SPONTIS_HTTP_HOST_CONNECTIONS", "4"))),
+            min_interval=max(0.0, float(os.getenv("SPONTIS_HTTP_MIN_INTERVAL", "0.25"))),
+        )
+
+
+_SOURCE_POLICY: ContextVar[Optional[HostPolicy]] = ContextVar("spontis_source_policy", default=None)
+
+
+@contextmanager
+def source_policy(policy: Optional[HostPolicy]) -> Iterator[None]:
+    """Apply ``policy`` to every request made in the current context."""
+
+    token = _SOURCE_POLICY.set(policy)
+    try:
+        yield
+    finally:
+        _SOURCE_POLICY.reset(token)
+
+
+@dataclass
+class _HostState:
+    active: int = 0
+    next_start: float = 0.0
+    blocked_until: float = 0.0
+
+
+class HostScheduler:
+    """Coordinates requests per hostname across threads and event loops.
+
+    A request may start once the host has a free connection slot, the
+    configured ``min_interval`` has passed since the previous start, and any
+    ``Retry-After`` back-off announced by the host has expired.
+    """
+
+    def __init__(self, default: Optional[HostPolicy] = None) -> None:
+        self.default = default or HostPolicy.from_env()
+        self._hosts: dict[str, _HostState] = {}
+        self._cond = threading.Condition()
+
+    def _policy(self) -> HostPolicy:
+        return _SOURCE_POLICY.get() or self.default
+
+    def _reserve(self, host: str, policy: HostPolicy) -> Optional[float]:
+        """Take a slot and return 0, or return how long to wait (None = until released)."""
+        state = self._hosts.setdefault(host, _HostState())
+        if state.active >= policy.max_connections:
+            return None
+        now = time.monotonic()
+        start = max(now, state.next_start, state.blocked_until)
+        if start > now:
+            return start - now
+        state.active += 1
+        state.next_start = now + policy.min_interval
+        return 0.0
+
+    def _release(self, host: str) -> None:
+        with self._cond:
+            state = self._hosts.get(host)
+            if state and state.active > 0:
+                state.active -= 1
+            self._cond.notify_all()
+
+    def defer(self, host: str, seconds: float) -> None:
+        """Hold back new requests to ``host`` for ``seconds`` (from ``Retry-After``)."""
+        if not host or seconds <= 0:
+            return
+        seconds = min(seconds, MAX_RETRY_AFTER)
+        with self._cond:
+            state = self._hosts.setdefault(host, _HostState())
+            state.blocked_until = max(state.blocked_until, time.monotonic() + seconds)
+
+    @contextmanager
+    def slot(self, url: str) -> Iterator[None]:
+        host = _host(url)
+        policy = self._policy()
+        with self._cond:
+            while True:
+                delay = self._reserve(host, policy)
+                if delay == 0.0:
+                    break
+                self._cond.wait(timeout=delay if delay is not None else 1.0)
+        try:
+            yield
+        finally:
+            self._release(host)
+
+    @asynccontextmanager
+    async def aslot(self, url: str) -> AsyncIterator[None]:
+        host = _host(url)
+        policy = self._policy()
+        while True:
+            with self._cond:
+                delay = self._reserve(host, policy)
+            if delay == 0.0:
+                break
+            await asyncio.sleep(delay if delay is not None else 0.05)
+        try:
+            yield
+        finally:
+            self._release(host)
+
+
+def _host(url: str) -> str:
+    return (urlsplit(url).hostname or "").lower()
+
+
+SCHEDULER = HostScheduler()
 
 
 def _default_headers() -> dict[str, str]:
@@ -24,8 +168,21 @@ def _default_headers() -> dict[str, str]:
     return headers
 
 
+class _PoliteRetry(Retry):
+    """Retry that shares ``Retry-After`` back-off with the host scheduler."""
+
+    def sleep_for_retry(self, response) -> bool:  # type: ignore[override]
+        retry_after = self.get_retry_after(response)
+        if retry_after and response is not None and response.status in RETRY_AFTER_STATUSES:
+            host = _host(getattr(response, "url", None) or "")
+            if not host:
+                host = getattr(getattr(response, "_pool", None), "host", "") or ""
+            SCHEDULER.defer(host.lower(), retry_after)
+        return super().sleep_for_retry(response)
+
+
 def _build_retry() -> Retry:
-    return Retry(
+    return _PoliteRetry(
         total=int(os.getenv("SPONTIS_HTTP_RETRIES", "3")),
         connect=int(os.getenv("SPONTIS_HTTP_RETRIES", "3")),
         read=int(os.getenv("SPONTIS_HTTP_RETRIES", "3")),
@@ -37,16 +194,98 @@ def _build_retry() -> Retry:
 
 
 @lru_cache(maxsize=1)
+def get_adapter() -> HTTPAdapter:
+    """Process-wide keep-alive pool shared by every session.
+
+    urllib3's pool manager is thread-safe, so all sources reuse the same
+    per-host connections no matter which worker thread they run on. Each
+    host pool holds at least as many connections as the scheduler lets
+    through at once.
+    """
+
+    host_pool = max(
+        int(os.getenv("SPONTIS_HTTP_POOL_MAXSIZE", "10")),
+        HostPolicy.from_env().max_connections,
+    )
+    return HTTPAdapter(
+        pool_connections=int(os.getenv("SPONTIS_HTTP_POOL_HOSTS", "64")),
+        pool_maxsize=host_pool,
+        max_retries=_build_retry(),
+    )
+
+
+_THREAD_SESSIONS = threading.local()
+
+
 def get_session() -> requests.Session:
-    session = requests.Session()
-    retry = _build_retry()
-    adapter = HTTPAdapter(max_retries=retry)
-    session.mount("http://", adapter)
-    session.mount("https://", adapter)
-    session.headers.update(_default_headers())
+    """Return this thread's session, mounted on the shared :func:`get_adapter`.
+
+    ``requests.Session`` keeps mutable cookie state and is not safe to share
+    between threads, so each thread gets its own thin session while the
+    connection pools underneath are common.
+    """
+
+    session = getattr(_THREAD_SESSIONS, "session", None)
+    if session is None:
+        session = requests.Session()
+        adapter = get_adapter()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update(_default_headers())
+        _THREAD_SESSIONS.session = session
     return session
 
 
+@lru_cache(maxsize=1)
+def get_encoding_memory() -> EncodingMemory:
+    """Per-host charset memory, persisted alongside the response cache."""
+    return EncodingMemory.from_env()
+
+
+def _apply_encoding(response: Response) -> Response:
+    response.encoding = resolve_encoding(
+        response.headers,
+        response.content or b"",
+        _host(response.url or ""),
+        get_encoding_memory(),
+        lambda: response.apparent_encoding,
+    )
+    return response
+
+
+@lru_cache(maxsize=1)
+def get_cache() -> Optional[HttpCache]:
+    """Shared on-disk response cache (``SPONTIS_HTTP_CACHE=0`` disables it)."""
+    return HttpCache.from_env()
+
+
+_CONDITIONAL_HEADERS = {"if-none-match", "if-modified-since"}
+
+
+def _cache_for(headers: Optional[Mapping[str, str]], kwargs: Mapping[str, Any]) -> Optional[HttpCache]:
+    if cassette.active() is not None:
+        return None
+    if kwargs.get("params") or kwargs.get("stream"):
+        return None
+    if headers and any(name.lower() in _CONDITIONAL_HEADERS for name in headers):
+        return None
+    return get_cache()
+
+
+def _with_validators(request_headers: Mapping[str, str], entry: Optional[CacheEntry]) -> Mapping[str, str]:
+    if entry is None:
+        return request_headers
+    merged = dict(request_headers)
+    merged.update(entry.conditional_headers())
+    return merged
+
+
+def _cached_response(entry: CacheEntry, request_headers: Mapping[str, str]) -> Response:
+    response = _build_response(entry.final_url, entry.status, "OK", entry.headers, entry.body, request_headers)
+    response.from_cache = True  # type: ignore[attr-defined]
+    return response
+
+
 def get(
     url: str,
     *,
@@ -61,13 +300,180 @@ def get(
         request_headers.update(headers)
     else:
         request_headers = session.headers
-    response = session.get(url, timeout=timeout or DEFAULT_TIMEOUT, headers=request_headers, **kwargs)
-    response.raise_for_status()
-    if not response.encoding or response.encoding.lower() == 'iso-8859-1':
-        if response.apparent_encoding:
-            response.encoding = response.apparent_encoding
+
+    cache = _cache_for(headers, kwargs)
+    entry = cache.lookup(url, request_headers) if cache else None
+    if entry is not None and entry.is_fresh():
+        return _apply_encoding(_cached_response(entry, request_headers))
+
+    with SCHEDULER.slot(url):
+        response = session.get(
+            url,
+            timeout=timeout or DEFAULT_TIMEOUT,
+            headers=_with_validators(request_headers, entry),
+            **kwargs,
+        )
+    if cache is not None:
+        if entry is not None and response.status_code == 304:
+            response = _cached_response(cache.revalidated(entry, response.headers), request_headers)
         else:
-            response.encoding = 'utf-8'
-    elif response.apparent_encoding and response.apparent_encoding.lower() not in {response.encoding.lower(), 'ascii'}:
-        response.encoding = response.apparent_encoding
+            cache.store(url, request_headers, response.url, response.status_code, response.headers, response.content)
+    response.raise_for_status()
+    return _apply_encoding(response)
+
+
+# --- asyncio transport -------------------------------------------------------
+
+_ASYNC_SESSIONS: dict[int, tuple[asyncio.AbstractEventLoop, "aiohttp.ClientSession"]] = {}
+
+
+def get_async_session() -> "aiohttp.ClientSession":
+    """Return the shared aiohttp session for the running event loop."""
+
+    if aiohttp is None:
+        raise RuntimeError("aiohttp is not installed")
+    loop = asyncio.get_running_loop()
+    entry = _ASYNC_SESSIONS.get(id(loop))
+    if entry is None or entry[0] is not loop or entry[1].closed:
+        connector = aiohttp.TCPConnector(
+            limit=int(os.getenv("SPONTIS_HTTP_ASYNC_LIMIT", "200")),
+            ttl_dns_cache=300,
+        )
+        session = aiohttp.ClientSession(
+            connector=connector,
+            headers=_default_headers(),
+            auto_decompress=True,
+        )
+        _ASYNC_SESSIONS[id(loop)] = (loop, session)
+        return session
+    return entry[1]
+
+
+async def close_async_sessions() -> None:
+    """Close the aiohttp session bound to the running loop, if any."""
+
+    loop = asyncio.get_running_loop()
+    entry = _ASYNC_SESSIONS.pop(id(loop), None)
+    if entry is not None and not entry[1].closed:
+        await entry[1].close()
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return max(0.0, (moment - datetime.now(timezone.utc)).total_seconds())
+
+
+def _backoff_delay(retry: Retry, consecutive_errors: int) -> float:
+    # Mirrors Retry.get_backoff_time(): the first retry is immediate.
+    if consecutive_errors <= 1:
+        return 0.0
+    delay = retry.backoff_factor * (2 ** (consecutive_errors - 1))
+    return float(max(0.0, min(Retry.DEFAULT_BACKOFF_MAX, delay)))
+
+
+def _build_response(
+    url: str,
+    status: int,
+    reason: Optional[str],
+    headers: Mapping[str, str],
+    body: bytes,
+    request_headers: Mapping[str, str],
+) -> Response:
+    response = Response()
+    response.status_code = status
+    response.reason = reason or ""
+    response.headers = CaseInsensitiveDict(headers)
+    response._content = body  # type: ignore[attr-defined]
+    response.url = url
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.request = requests.Request("GET", url, headers=dict(request_headers)).prepare()
     return response
+
+
+async def async_get(
+    url: str,
+    *,
+    timeout: Optional[float] = None,
+    headers: Optional[Mapping[str, str]] = None,
+    allow_redirects: bool = True,
+) -> Response:
+    """Asynchronous counterpart of :func:`get`.
+
+    Uses the same default headers, retry budget (``SPONTIS_HTTP_RETRIES``),
+    backoff, retryable status codes and encoding fix-ups as the synchronous
+    session, and returns a regular :class:`requests.Response` so callers can
+    share parsing code between both paths. Without aiohttp the request is run
+    through :func:`get` on a worker thread, as it is while a record/replay
+    cassette is active.
+    """
+
+    if aiohttp is None or cassette.active() is not None:
+        return await asyncio.to_thread(get, url, timeout=timeout, headers=headers, allow_redirects=allow_redirects)
+
+    session = get_async_session()
+    request_headers = dict(session.headers)
+    if headers:
+        request_headers.update(headers)
+
+    cache = _cache_for(headers, {})
+    entry = cache.lookup(url, request_headers) if cache else None
+    if entry is not None and entry.is_fresh():
+        return _apply_encoding(_cached_response(entry, request_headers))
+    send_headers = _with_validators(request_headers, entry)
+
+    retry = _build_retry()
+    client_timeout = aiohttp.ClientTimeout(total=timeout or DEFAULT_TIMEOUT)
+
+    attempts = 0
+    while True:
+        attempts += 1
+        try:
+            async with SCHEDULER.aslot(url), session.get(
+                url,
+                headers=send_headers,
+                timeout=client_timeout,
+                allow_redirects=allow_redirects,
+            ) as raw:
+                body = await raw.read()
+                response = _build_response(
+                    str(raw.url),
+                    raw.status,
+                    raw.reason,
+                    raw.headers,
+                    body,
+                    request_headers,
+                )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            if attempts > (retry.total or 0):
+                raise requests.ConnectionError(f"{url}: {exc}") from exc
+            await asyncio.sleep(_backoff_delay(retry, attempts))
+            continue
+
+        if response.status_code in retry.status_forcelist and attempts <= (retry.total or 0):
+            delay = _retry_after_seconds(response.headers.get("Retry-After"))
+            if delay is not None and response.status_code in RETRY_AFTER_STATUSES:
+                # The scheduler makes the next attempt (and every other request
+                # to this host) wait out the announced back-off.
+                SCHEDULER.defer(_host(url), delay)
+                continue
+            await asyncio.sleep(_backoff_delay(retry, attempts))
+            continue
+        break
+
+    if cache is not None:
+        if entry is not None and response.status_code == 304:
+            response = _cached_response(cache.revalidated(entry, response.headers), request_headers)
+        else:
+            cache.store(url, request_headers, response.url, response.status_code, response.headers, response.content)
+    response.raise_for_status()
+    return _apply_encoding(response)
@@ -0,0 +1,315 @@
+"""On-disk HTTP response cache with ETag/Last-Modified revalidation."""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Mapping, Optional
+
+LOGGER = logging.getLogger("spontis.scraper.http_cache")
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_CACHE_DIR = ROOT / ".cache" / "http"
+# Freshness lifetime for responses without validators or explicit max-age.
+DEFAULT_TTL = float(os.getenv("SPONTIS_HTTP_CACHE_TTL", "900"))
+# Upper bound for the Last-Modified heuristic (10% of the document age).
+MAX_HEURISTIC_TTL = float(os.getenv("SPONTIS_HTTP_CACHE_MAX_HEURISTIC_TTL", "86400"))
+DEFAULT_MAX_BYTES = int(float(os.getenv("SPONTIS_HTTP_CACHE_MAX_MB", "256")) * 1024 * 1024)
+
+_SKIP_HEADERS = {
+    "connection",
+    "content-encoding",
+    "content-length",
+    "keep-alive",
+    "set-cookie",
+    "transfer-encoding",
+}
+
+
+def _digest(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+def _cache_control(headers: Mapping[str, str]) -> dict[str, Optional[str]]:
+    directives: dict[str, Optional[str]] = {}
+    for part in (headers.get("Cache-Control") or "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+    return directives
+
+
+def _http_date(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def _freshness_lifetime(headers: Mapping[str, str], now: float) -> float:
+    directives = _cache_control(headers)
+    if "no-cache" in directives:
+        return 0.0
+    for name in ("s-maxage", "max-age"):
+        raw = directives.get(name)
+        if raw is not None:
+            try:
+                return max(0.0, float(raw))
+            except ValueError:
+                return 0.0
+
+    date = _http_date(headers.get("Date")) or now
+    expires = _http_date(headers.get("Expires"))
+    if headers.get("Expires") is not None:
+        return max(0.0, (expires or 0.0) - date)
+
+    last_modified = _http_date(headers.get("Last-Modified"))
+    if last_modified is not None:
+        return min(MAX_HEURISTIC_TTL, max(0.0, (date - last_modified) * 0.1))
+    if headers.get("ETag"):
+        # Cheap to revalidate; always ask the origin.
+        return 0.0
+    return DEFAULT_TTL
+
+
+@dataclass
+class CacheEntry:
+    url: str
+    final_url: str
+    status: int
+    headers: dict[str, str]
+    stored_at: float
+    expires_at: float
+    body_path: Path
+    vary: dict[str, str] = field(default_factory=dict)
+    _body: Optional[bytes] = None
+
+    @property
+    def body(self) -> bytes:
+        if self._body is None:
+            self._body = self.body_path.read_bytes()
+        return self._body
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        return (now or time.time()) < self.expires_at
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.headers.get("etag"):
+            headers["If-None-Match"] = self.headers["etag"]
+        if self.headers.get("last-modified"):
+            headers["If-Modified-Since"] = self.headers["last-modified"]
+        return headers
+
+
+class HttpCache:
+    """Size-bounded response store keyed by URL and the request's ``Vary`` headers.
+
+    Each URL has a small JSON index listing its variants; bodies live in
+    sibling files whose mtime doubles as the LRU clock for eviction.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None
+
+    @classmethod
+    def from_env(cls) -> Optional["HttpCache"]:
+        if os.getenv("SPONTIS_HTTP_CACHE", "1") == "0":
+            return None
+        directory = Path(os.getenv("SPONTIS_HTTP_CACHE_DIR") or DEFAULT_CACHE_DIR).expanduser()
+        return cls(directory)
+
+    # -- paths ---------------------------------------------------------------
+
+    def _index_path(self, url_key: str) -> Path:
+        return self.directory / url_key[:2] / f"{url_key}.json"
+
+    def _body_path(self, url_key: str, variant_key: str) -> Path:
+        return self.directory / url_key[:2] / f"{url_key}-{variant_key[:16]}.body"
+
+    @staticmethod
+    def _variant_key(vary: list[str], request_headers: Mapping[str, str]) -> str:
+        lowered = {str(k).lower(): str(v) for k, v in request_headers.items()}
+        parts = [f"{name}={lowered.get(name, '')}" for name in vary]
+        return _digest("\n".join(parts))
+
+    def _read_index(self, url_key: str) -> dict:
+        try:
+            return json.loads(self._index_path(url_key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def _write_index(self, url_key: str, index: dict) -> None:
+        path = self._index_path(url_key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(index, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+
+    # -- public API ----------------------------------------------------------
+
+    def lookup(self, url: str, request_headers: Mapping[str, str]) -> Optional[CacheEntry]:
+        url_key = _digest(url)
+        with self._lock:
+            index = self._read_index(url_key)
+        if not index:
+            return None
+        vary = index.get("vary") or []
+        variant_key = self._variant_key(vary, request_headers)
+        meta = (index.get("variants") or {}).get(variant_key)
+        if not meta:
+            return None
+        body_path = self._body_path(url_key, variant_key)
+        try:
+            # Read now rather than on first use: eviction may unlink the file
+            # mid-request, and a body that is gone is just a miss.
+            body = body_path.read_bytes()
+        except OSError:
+            return None
+        try:
+            os.utime(body_path)
+        except OSError:
+            pass
+        return CacheEntry(
+            url=url,
+            final_url=meta.get("final_url") or url,
+            status=meta.get("status", 200),
+            headers=meta.get("headers") or {},
+            stored_at=meta.get("stored_at", 0.0),
+            expires_at=meta.get("expires_at", 0.0),
+            body_path=body_path,
+            vary=meta.get("vary") or {},
+            _body=body,
+        )
+
+    def store(
+        self,
+        url: str,
+        request_headers: Mapping[str, str],
+        final_url: str,
+        status: int,
+        headers: Mapping[str, str],
+        body: bytes,
+    ) -> Optional[CacheEntry]:
+        if status != 200:
+            return None
+        directives = _cache_control(headers)
+        if "no-store" in directives or "private" in directives:
+            return None
+        vary = sorted(
+            {part.strip().lower() for part in (headers.get("Vary") or "").split(",") if part.strip()}
+        )
+        if "*" in vary:
+            return None
+
+        now = time.time()
+        kept_headers = {
+            str(name).lower(): str(value)
+            for name, value in headers.items()
+            if str(name).lower() not in _SKIP_HEADERS
+        }
+        url_key = _digest(url)
+        variant_key = self._variant_key(vary, request_headers)
+        lowered = {str(k).lower(): str(v) for k, v in request_headers.items()}
+        meta = {
+            "final_url": final_url,
+            "status": status,
+            "headers": kept_headers,
+            "stored_at": now,
+            "expires_at": now + _freshness_lifetime(headers, now),
+            "vary": {name: lowered.get(name, "") for name in vary},
+        }
+        body_path = self._body_path(url_key, variant_key)
+
+        with self._lock:
+            body_path.parent.mkdir(parents=True, exist_ok=True)
+            previous = body_path.stat().st_size if body_path.exists() else 0
+            tmp = body_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(body)
+            os.replace(tmp, body_path)
+
+            index = self._read_index(url_key)
+            if index.get("vary") != vary:
+                # The origin changed its Vary policy; older variants are unreachable.
+                index = {"url": url, "vary": vary, "variants": {}}
+            index.setdefault("variants", {})[variant_key] = meta
+            self._write_index(url_key, index)
+
+            self._size = self._current_size() + len(body) - previous
+            if self._size > self.max_bytes:
+                self._evict()
+
+        return CacheEntry(
+            url=url,
+            final_url=final_url,
+            status=status,
+            headers=kept_headers,
+            stored_at=now,
+            expires_at=meta["expires_at"],
+            body_path=body_path,
+            vary=meta["vary"],
+            _body=body,
+        )
+
+    def revalidated(self, entry: CacheEntry, headers: Mapping[str, str]) -> CacheEntry:
+        """Merge the headers of a ``304 Not Modified`` into ``entry`` and extend its lifetime."""
+        now = time.time()
+        for name, value in headers.items():
+            lowered = str(name).lower()
+            if lowered not in _SKIP_HEADERS:
+                entry.headers[lowered] = str(value)
+        entry.stored_at = now
+        entry.expires_at = now + _freshness_lifetime(_TitleCaseView(entry.headers), now)
+
+        url_key = _digest(entry.url)
+        with self._lock:
+            index = self._read_index(url_key)
+            variant_key = self._variant_key(index.get("vary") or [], entry.vary)
+            meta = (index.get("variants") or {}).get(variant_key)
+            if meta is not None:
+                meta.update(headers=entry.headers, stored_at=entry.stored_at, expires_at=entry.expires_at)
+                self._write_index(url_key, index)
+        return entry
+
+    # -- eviction ------------------------------------------------------------
+
+    def _current_size(self) -> int:
+        if self._size is None:
+            self._size = sum(path.stat().st_size for path in self.directory.glob("*/*.body"))
+        return self._size
+
+    def _evict(self) -> None:
+        bodies = sorted(self.directory.glob("*/*.body"), key=lambda path: path.stat().st_mtime)
+        size = sum(path.stat().st_size for path in bodies)
+        target = int(self.max_bytes * 0.9)
+        removed = 0
+        for path in bodies:
+            if size <= target:
+                break
+            size -= path.stat().st_size
+            path.unlink(missing_ok=True)
+            removed += 1
+        self._size = size
+        if removed:
+            LOGGER.info("Evicted %d cached responses (%.1f MB kept)", removed, size / 1_048_576)
+
+
+class _TitleCaseView(dict):
+    """Expose lower-cased stored headers under their canonical names."""
+
+    def __init__(self, headers: Mapping[str, str]) -> None:
+        super().__init__(headers)
+
+    def get(self, key, default=None):  # type: ignore[override]
+        return super().get(str(key).lower(), default)
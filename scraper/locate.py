@@ -0,0 +1,155 @@
+"""Find an event's date near a DOM node without reading whole pages.
+
+Sources used to hand ``" ".join(node.stripped_strings)`` of a card's
+ancestors, or of an entire detail page, to the date parser. That costs time
+proportional to the page and happily returns a date from the footer.
+:func:`locate_datetime` instead walks outwards from the card (or from the
+``<h1>`` of a detail page) a few levels at a time and, at each level, looks
+at a bounded number of nodes:
+
+1. structured nodes – ``<time>``, ``itemprop="startDate"``,
+   ``event:start_time`` metadata and ``data-start`` attributes;
+2. the first :data:`TEXT_BUDGET` characters of text, searched in small
+   windows by :func:`scraper.dates.iter_event_dates`.
+
+The first confident hit wins. Tentative hits (a weekday and a time, a bare
+day and month) are only used when nothing better is found. Each container's
+result is memoized per document, so sibling links that share ancestors cost
+one scan in total rather than one each.
+"""
+from __future__ import annotations
+
+import os
+import weakref
+from datetime import datetime
+from itertools import islice
+from typing import Dict, Iterator, Optional, Tuple
+
+from bs4 import BeautifulSoup, Tag
+
+from scraper.dates import iter_event_dates
+from scraper.normalize import DATE_SETTINGS, parse_datetime
+
+MAX_DEPTH = 3
+NODE_BUDGET = int(os.getenv("SPONTIS_LOCATE_NODES", "200"))
+TEXT_BUDGET = int(os.getenv("SPONTIS_LOCATE_CHARS", "600"))
+
+STAMP_ATTRS = ("datetime", "content", "data-start")
+
+Found = Tuple[Optional[datetime], Optional[datetime]]
+
+# Sibling links share their containers, so each container is scanned once per
+# document: ``id(document) -> {id(level): (confident, tentative)}``. Entries are
+# dropped when the document is garbage collected.
+_MEMOS: Dict[int, Dict[int, Found]] = {}
+
+
+def _is_structured(tag: Tag) -> bool:
+    return (
+        tag.name == "time"
+        or tag.get("itemprop") == "startDate"
+        or tag.get("property") == "event:start_time"
+        or tag.has_attr("data-start")
+    )
+
+
+def _structured(level: Tag) -> Iterator[Tag]:
+    if _is_structured(level):
+        yield level
+    for node in islice(level.descendants, NODE_BUDGET):
+        if isinstance(node, Tag) and _is_structured(node):
+            yield node
+
+
+def bounded_text(node: Tag, budget: int = TEXT_BUDGET) -> str:
+    """The first ``budget`` characters of ``node``'s visible text."""
+
+    parts: list[str] = []
+    size = 0
+    for string in node.stripped_strings:
+        parts.append(string)
+        size += len(string) + 1
+        if size >= budget:
+            break
+    return " ".join(parts)[:budget]
+
+
+def _stamped(tag: Tag) -> Optional[datetime]:
+    for attr in STAMP_ATTRS:
+        value = tag.get(attr)
+        if isinstance(value, str) and value.strip():
+            dt = parse_datetime(value)
+            if dt:
+                return dt
+    if tag.name == "meta":
+        return None
+    return parse_datetime(bounded_text(tag, 80))
+
+
+def _levels(node: Tag, depth: int) -> Iterator[Tag]:
+    document = node if isinstance(node, BeautifulSoup) else None
+    if document is not None:
+        # A whole page: metadata first, then outwards from the title heading.
+        head = document.head
+        if head is not None:
+            for meta in head.find_all("meta", limit=NODE_BUDGET):
+                if _is_structured(meta):
+                    yield meta
+        node = document.find("h1") or document.body or document
+    yield node
+    seen = {id(node)}
+    for parent in islice(node.parents, depth):
+        if isinstance(parent, Tag):
+            seen.add(id(parent))
+            yield parent
+    if document is not None and document.body is not None and id(document.body) not in seen:
+        yield document.body
+
+
+def _scan(level: Tag) -> Found:
+    """``(confident, tentative)`` date for one level, looking only at bounded content."""
+
+    for tag in _structured(level):
+        dt = _stamped(tag)
+        if dt:
+            return dt, None
+    if level.name == "meta":
+        return None, None
+    tentative: Optional[datetime] = None
+    for dt, confident in iter_event_dates(bounded_text(level), settings=DATE_SETTINGS):
+        if confident:
+            return dt, None
+        if tentative is None:
+            tentative = dt
+    return None, tentative
+
+
+def _document_memo(node: Tag) -> Dict[int, Found]:
+    root = node
+    for root in node.parents:
+        pass
+    key = id(root)
+    memo = _MEMOS.get(key)
+    if memo is None:
+        memo = _MEMOS.setdefault(key, {})
+        weakref.finalize(root, _MEMOS.pop, key, None)
+    return memo
+
+
+def locate_datetime(node: Optional[Tag], *, depth: int = MAX_DEPTH) -> Optional[datetime]:
+    """Return the start time nearest to ``node`` (a card, link or parsed page)."""
+
+    if node is None:
+        return None
+    memo = _document_memo(node)
+    tentative: Optional[datetime] = None
+    for level in _levels(node, depth):
+        found = memo.get(id(level))
+        if found is None:
+            found = memo[id(level)] = _scan(level)
+        confident, maybe = found
+        if confident:
+            return confident
+        if tentative is None:
+            tentative = maybe
+    return tentative
@@ -0,0 +1,140 @@
+"""Blocked fuzzy title index for merging the same event across sources.
+
+Two events are the same when they start on the same day and their
+normalized titles have a :class:`difflib.SequenceMatcher` ratio of at least
+:data:`TITLE_THRESHOLD`. Comparing every incoming event with every merged one
+is quadratic in the feed, so :class:`TitleIndex` narrows the search before
+any ratio is computed:
+
+1. candidates are blocked by event day (``starts_at[:10]``);
+2. within a day they are grouped by normalized title length, and only
+   lengths that can still reach the threshold are visited
+   (``ratio <= 2 * min(la, lb) / (la + lb)``);
+3. the number of characters the titles share (the bound ``quick_ratio``
+   computes) is read from precomputed bitmasks in a few integer operations
+   and rejects most of the rest before the full ``ratio``.
+
+Every bound is exact, so the first match in insertion order is the same one
+a full scan would find.
+"""
+from __future__ import annotations
+
+import re
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+from typing import Dict, Generic, List, NamedTuple, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+TITLE_THRESHOLD = 0.8
+
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_SPACE_RE = re.compile(r"\s+")
+
+# One bit per character seen so far, shared by every index.
+_BITS: Dict[str, int] = {}
+
+
+def normalize_title(value: str) -> str:
+    without_punct = _PUNCT_RE.sub(" ", value.lower())
+    return _SPACE_RE.sub(" ", without_punct).strip()
+
+
+def length_bound(la: int, lb: int) -> float:
+    """Highest ratio two strings of these lengths can have."""
+
+    total = la + lb
+    return 2.0 * min(la, lb) / total if total else 1.0
+
+
+def _levels(value: str) -> Tuple[int, ...]:
+    """Bitmasks of the characters occurring at least once, twice, … in ``value``."""
+
+    levels: List[int] = []
+    for char, count in Counter(value).items():
+        bit = _BITS.get(char)
+        if bit is None:
+            bit = _BITS.setdefault(char, 1 << len(_BITS))
+        while len(levels) < count:
+            levels.append(0)
+        for level in range(count):
+            levels[level] |= bit
+    return tuple(levels)
+
+
+def shared_characters(a: Tuple[int, ...], b: Tuple[int, ...]) -> int:
+    """Size of the multiset intersection of two titles' characters."""
+
+    return sum((x & y).bit_count() for x, y in zip(a, b))
+
+
+class _Entry(NamedTuple):
+    order: int
+    title: str
+    levels: Tuple[int, ...]
+    item: object
+
+
+class TitleIndex(Generic[T]):
+    """Items keyed by day and normalized title, searched in insertion order."""
+
+    def __init__(self, threshold: float = TITLE_THRESHOLD) -> None:
+        self.threshold = threshold
+        # day -> normalized title length -> entries, in insertion order
+        self._days: Dict[str, Dict[int, List[_Entry]]] = defaultdict(lambda: defaultdict(list))
+        # The last probe, so adding the same title right after a miss reuses it.
+        self._probe: Optional[Tuple[str, _Entry]] = None
+        self._size = 0
+        self.compared = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _entry(self, title: str, item: object = None) -> _Entry:
+        normalized = normalize_title(title)
+        return _Entry(self._size, normalized, _levels(normalized), item)
+
+    def add(self, day: str, title: str, item: T) -> None:
+        if self._probe is not None and self._probe[0] == title:
+            entry = self._probe[1]._replace(order=self._size, item=item)
+        else:
+            entry = self._entry(title, item)
+        self._days[day][len(entry.title)].append(entry)
+        self._size += 1
+
+    def _candidates(self, lengths: Dict[int, List[_Entry]], size: int) -> List[_Entry]:
+        # The range covers every length whose bound can reach the threshold;
+        # the exact check trims its rounded ends.
+        low = max(0, int(size * self.threshold / (2 - self.threshold)) - 1)
+        high = int(size * (2 - self.threshold) / self.threshold) + 1
+        candidates: List[_Entry] = []
+        for length in range(low, high + 1):
+            if length in lengths and length_bound(length, size) >= self.threshold:
+                candidates.extend(lengths[length])
+        candidates.sort(key=lambda entry: entry.order)
+        return candidates
+
+    def find(self, day: str, title: str) -> Optional[T]:
+        """The earliest added item on ``day`` whose title matches ``title``."""
+
+        incoming = self._entry(title)
+        self._probe = (title, incoming)
+        lengths = self._days.get(day)
+        if not lengths:
+            return None
+        size = len(incoming.title)
+
+        # The incoming title is always the second sequence, so its lookup
+        # tables are built once and reused for every candidate.
+        matcher: Optional[SequenceMatcher] = None
+        for entry in self._candidates(lengths, size):
+            total = len(entry.title) + size
+            if total and 2.0 * shared_characters(entry.levels, incoming.levels) / total < self.threshold:
+                continue
+            if matcher is None:
+                matcher = SequenceMatcher(None, "", incoming.title)
+            matcher.set_seq1(entry.title)
+            self.compared += 1
+            if matcher.ratio() >= self.threshold:
+                return entry.item  # type: ignore[return-value]
+        return None
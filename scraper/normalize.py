@@ -1,14 +1,43 @@
 from __future__ import annotations
 
+import os
+import re
+import threading
 from collections import OrderedDict
 from datetime import datetime
-from typing import Iterable, Optional, Sequence
+from typing import Any, Iterable, Mapping, Optional, Sequence
 from zoneinfo import ZoneInfo
 
+from scraper.dates import note_reference_date, parse_event_date, track_reference_date
+
 TZ = ZoneInfo("Europe/Oslo")
 DEFAULT_CITY = "Bergen"
 WEEKDAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
 
+DATE_LANGUAGES = ("nb", "en")
+DATE_SETTINGS: Mapping[str, Any] = {
+    "TIMEZONE": "Europe/Oslo",
+    "DATE_ORDER": "DMY",
+    "PREFER_DATES_FROM": "future",
+    "RETURN_AS_TIMEZONE_AWARE": False,
+}
+DATE_CACHE_SIZE = int(os.getenv("SPONTIS_DATE_CACHE_SIZE", "8192"))
+# dateparser is only consulted for strings the built-in grammar cannot read.
+DATEPARSER_FALLBACK = os.getenv("SPONTIS_DATEPARSER_FALLBACK", "0") == "1"
+
+# ``<time datetime>`` / ``content`` attributes and JSON feeds are ISO 8601.
+_ISO_SHAPE = re.compile(r"^\d{4}-\d{2}-\d{2}(?:[T ]\d{2}|$)")
+# Anything dateparser could turn into a date has a digit, a month or weekday
+# name, or a relative word; text without any of them is navigation or prose.
+_DATE_LIKELY = re.compile(
+    r"\d"
+    r"|\b(?:jan|feb|mar|apr|ma[iy]|jun|jul|aug|sep|o[ck]t|nov|de[cs])"
+    r"|\b(?:man|mon|tir|tue|ons|wed|tor|thu|fre|fri|l[øo]r|sat|s[øo]n|sun)"
+    r"|\b(?:today|tonight|tomorrow|yesterday|now|ago|next|last|idag|imorgen"
+    r"|i\s+(?:dag|morgen|overmorgen|går|kveld)|nå|neste|forrige|siden)\b",
+    re.IGNORECASE,
+)
+
 
 def _ensure_local(dt: datetime) -> datetime:
     if dt.tzinfo is None:
@@ -105,3 +134,160 @@ def format_showtimes(times: Sequence[datetime], *, max_days: int = 2, max_per_da
         parts.append(f"+{remaining_days} more day{suffix}")
 
     return " / ".join(parts)
+
+
+def _parse_iso(text: str, settings: Mapping[str, Any]) -> Optional[datetime]:
+    try:
+        dt = datetime.fromisoformat(text)
+    except ValueError:
+        from dateutil.parser import isoparse
+
+        try:
+            dt = isoparse(text)
+        except (ValueError, OverflowError):
+            return None
+    # Mirror dateparser: offsets are converted to the configured zone, and the
+    # result is naive when RETURN_AS_TIMEZONE_AWARE is off.
+    zone = ZoneInfo(settings.get("TIMEZONE") or "Europe/Oslo")
+    aware = settings.get("RETURN_AS_TIMEZONE_AWARE")
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(zone)
+        return dt.replace(tzinfo=None) if aware is False else dt
+    return dt.replace(tzinfo=zone) if aware is True else dt
+
+
+class DateParser:
+    """Shared, memoized, tiered date resolver.
+
+    Values are resolved by the cheapest tier that can answer them:
+
+    1. ``iso`` – ISO 8601 strings (``<time datetime>`` attributes, feeds) go
+       through ``datetime.fromisoformat`` / ``dateutil.isoparse``.
+    2. ``rejected`` – text with no digit, month, weekday or relative word
+       cannot hold a date and is dropped without parsing.
+    3. ``hits`` – sources hand the same strings over and over (ancestor text,
+       repeated ``<time>`` values, "today"), so results are kept in an LRU
+       keyed by the text, languages, settings and the local calendar day
+       (relative phrases and ``PREFER_DATES_FROM`` depend on it). A hit
+       reports its use of the day to :func:`scraper.dates.track_reference_date`
+       just as the original parse did.
+    4. ``grammar`` – the nb/en event-date grammar in :mod:`scraper.dates`.
+    5. ``dateparser`` – only with ``fallback`` (``SPONTIS_DATEPARSER_FALLBACK=1``),
+       a ``DateDataParser`` built once per languages/settings combination.
+
+    Strings no tier could read are counted as ``unparsed``.
+    """
+
+    def __init__(self, maxsize: int = DATE_CACHE_SIZE, fallback: Optional[bool] = None) -> None:
+        self.maxsize = maxsize
+        self.fallback = DATEPARSER_FALLBACK if fallback is None else fallback
+        self._lock = threading.Lock()
+        # key -> (result, whether it was resolved against today)
+        self._results: "OrderedDict[tuple, tuple[Optional[datetime], bool]]" = OrderedDict()
+        self._parsers: dict[tuple, Any] = {}
+        self.iso = 0
+        self.rejected = 0
+        self.hits = 0
+        self.grammar = 0
+        self.dateparser = 0
+        self.unparsed = 0
+
+    def _parser(self, languages: tuple[str, ...], settings_key: tuple) -> Any:
+        key = (languages, settings_key)
+        parser = self._parsers.get(key)
+        if parser is None:
+            from dateparser.date import DateDataParser
+
+            parser = DateDataParser(languages=list(languages) or None, settings=dict(settings_key))
+            with self._lock:
+                parser = self._parsers.setdefault(key, parser)
+        return parser
+
+    def parse(
+        self,
+        value: Optional[str],
+        *,
+        languages: Sequence[str] = DATE_LANGUAGES,
+        settings: Optional[Mapping[str, Any]] = None,
+    ) -> Optional[datetime]:
+        if not value or not value.strip():
+            return None
+        text = value.strip()
+        settings = settings if settings is not None else DATE_SETTINGS
+        if _ISO_SHAPE.match(text):
+            result = _parse_iso(text, settings)
+            if result is not None:
+                with self._lock:
+                    self.iso += 1
+                return result
+        elif not _DATE_LIKELY.search(text):
+            with self._lock:
+                self.rejected += 1
+            return None
+
+        langs = tuple(languages)
+        settings_key = tuple(sorted(settings.items()))
+        key = (text, langs, settings_key, datetime.now(TZ).date())
+
+        with self._lock:
+            cached = self._results.get(key)
+            if cached is not None:
+                self._results.move_to_end(key)
+                self.hits += 1
+        if cached is not None:
+            if cached[1]:
+                note_reference_date()
+            return cached[0]
+
+        tier = "grammar"
+        with track_reference_date() as reference:
+            result = parse_event_date(text, settings=settings)
+            if result is None and self.fallback:
+                tier = "dateparser"
+                result = self._parser(langs, settings_key).get_date_data(text)["date_obj"]
+                # dateparser does not say what it resolved against.
+                note_reference_date()
+
+        with self._lock:
+            if result is None:
+                self.unparsed += 1
+            elif tier == "grammar":
+                self.grammar += 1
+            else:
+                self.dateparser += 1
+            self._results[key] = (result, reference.used)
+            if len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+        return result
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "iso": self.iso,
+                "rejected": self.rejected,
+                "hits": self.hits,
+                "grammar": self.grammar,
+                "dateparser": self.dateparser,
+                "unparsed": self.unparsed,
+                "cached": len(self._results),
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+            self.iso = self.rejected = self.hits = 0
+            self.grammar = self.dateparser = self.unparsed = 0
+
+
+DATES = DateParser()
+
+
+def parse_datetime(
+    value: Optional[str],
+    *,
+    languages: Sequence[str] = DATE_LANGUAGES,
+    settings: Optional[Mapping[str, Any]] = None,
+) -> Optional[datetime]:
+    """Parse an nb/en date string with the shared :data:`DATES` service."""
+
+    return DATES.parse(value, languages=languages, settings=settings)
@@ -0,0 +1,79 @@
+"""Concurrent prefetching of detail pages for card-based sources.
+
+Listing pages link to one detail page per event card. Instead of fetching
+those one at a time inside the card loop, a source collects the candidate
+URLs first and schedules them on a shared, bounded thread pool::
+
+    details = Prefetcher(_fetch_text, parse_html).schedule(urls)
+    for card, url in candidates:
+        detail = details.get(url)  # waits for the download, parses once
+
+Downloads run concurrently (still subject to the per-host politeness
+limits in :mod:`scraper.http`), while parsing happens lazily on the
+source's own thread and only for the URLs it actually asks for.
+"""
+from __future__ import annotations
+
+import contextvars
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, Generic, Iterable, Optional, TypeVar
+
+R = TypeVar("R")
+T = TypeVar("T")
+
+DEFAULT_WORKERS = int(os.getenv("SPONTIS_PREFETCH_WORKERS", "16"))
+
+
+@lru_cache(maxsize=1)
+def _executor() -> ThreadPoolExecutor:
+    # One pool for every source keeps the total number of in-flight detail
+    # downloads bounded no matter how many sources run at once.
+    return ThreadPoolExecutor(max_workers=max(1, DEFAULT_WORKERS), thread_name_prefix="prefetch")
+
+
+class Prefetcher(Generic[R, T]):
+    """Fetch URLs ahead of time and hand back parsed documents on demand."""
+
+    def __init__(self, fetch: Callable[[str], R], parse: Optional[Callable[[R], T]] = None) -> None:
+        self._fetch = fetch
+        # Without ``parse`` the raw download is handed back as-is.
+        self._parse: Callable[[R], T] = parse or (lambda raw: raw)  # type: ignore[assignment,return-value]
+        self._lock = threading.Lock()
+        self._pending: Dict[str, "Future[R]"] = {}
+        self._parsed: Dict[str, T] = {}
+
+    def schedule(self, urls: Iterable[str]) -> "Prefetcher[R, T]":
+        executor = _executor()
+        with self._lock:
+            for url in urls:
+                if url in self._pending or url in self._parsed:
+                    continue
+                # Each download runs in a copy of the caller's context so the
+                # source's HTTP policy applies on the pool threads as well.
+                context = contextvars.copy_context()
+                self._pending[url] = executor.submit(context.run, self._fetch, url)
+        return self
+
+    def get(self, url: str) -> T:
+        """Return the parsed document for ``url``, fetching inline if it was never scheduled."""
+
+        with self._lock:
+            if url in self._parsed:
+                return self._parsed[url]
+            future = self._pending.pop(url, None)
+        raw = future.result() if future is not None else self._fetch(url)
+        parsed = self._parse(raw)
+        with self._lock:
+            self._parsed[url] = parsed
+        return parsed
+
+    def cancel(self) -> None:
+        """Drop downloads that have not started yet."""
+
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for future in pending.values():
+            future.cancel()
@@ -0,0 +1,244 @@
+"""Declarative scraping of venue programme pages.
+
+Most venue sites share one layout: a programme page with one card per event,
+each linking to a detail page that carries the description and, sometimes,
+the date or the room. Instead of a module per venue repeating fetch → select
+cards → filter links → locate the date → fetch details, a venue is described
+by a :class:`VenueProgram` and scraped by :func:`run_program`::
+
+    PROGRAM = VenueProgram(
+        module=__name__,
+        source="Grieghallen",
+        program_url="https://grieghallen.no/arrangement",
+        url_prefix="https://grieghallen.no",
+        venue="Grieghallen",
+        tags=("culture", "live"),
+        href_pattern=r"/arrangement/",
+    )
+
+    def fetch() -> list[dict]:
+        return run_program(PROGRAM, http_get)
+
+Selectors and patterns are compiled once per spec, and every venue goes
+through the same structured-data fast path, card segmentation, detail
+prefetching, extraction cache and date locator, so an improvement to any of
+those reaches all of them at once.
+"""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Iterator, NamedTuple, Optional, Pattern, Tuple
+from urllib.parse import urljoin
+
+import soupsieve
+from bs4 import BeautifulSoup, Tag
+
+from scraper.extract_cache import ExtractCache
+from scraper.html import ParseOnly, parse_html, segment_cards
+from scraper.http import get as http_get
+from scraper.locate import locate_datetime
+from scraper.normalize import build_event, to_weekday_label
+from scraper.prefetch import Prefetcher
+from scraper.structured import StructuredEvent, structured_events
+
+HEADERS = {
+    "User-Agent": "SpontisBot/0.3 (+https://spontis-app.github.io)",
+    "Accept-Language": "nb,en;q=0.8",
+}
+TIMEOUT = 25
+
+
+@dataclass(frozen=True)
+class TagRule:
+    """Add ``tag`` when the card's text mentions any of ``keywords``."""
+
+    tag: str
+    keywords: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class VenueProgram:
+    module: str
+    source: str
+    program_url: str
+    url_prefix: str
+    venue: str
+    tags: Tuple[str, ...]
+    # Containers that count as an event card, see ``segment_cards``.
+    cards: str = "article, li, div"
+    # Regex an event link's path must contain; navigation links fail it.
+    href_pattern: Optional[str] = None
+    skip_titles: Tuple[str, ...] = ()
+    tag_rules: Tuple[TagRule, ...] = ()
+    # ``extra["where"]`` when the detail page names no room; defaults to ``venue``.
+    where: Optional[str] = None
+    description_selector: str = ".event-description p, .content p"
+    # Detail nodes naming the room, optionally only those mentioning ``venue_keywords``.
+    venue_selector: Optional[str] = None
+    venue_keywords: Tuple[str, ...] = ()
+    # Programmes that list undated items (season cards, series) keep them when False.
+    require_date: bool = True
+    # Reduced tree for the listing page (scripts, styles and icons dropped by default).
+    listing: Optional[ParseOnly] = ParseOnly()
+
+
+class _Compiled(NamedTuple):
+    href: Optional[Pattern[str]]
+    description: Any
+    venue: Any
+
+
+@lru_cache(maxsize=None)
+def _compile(program: VenueProgram) -> _Compiled:
+    return _Compiled(
+        href=re.compile(program.href_pattern) if program.href_pattern else None,
+        description=soupsieve.compile(program.description_selector),
+        venue=soupsieve.compile(program.venue_selector) if program.venue_selector else None,
+    )
+
+
+@lru_cache(maxsize=None)
+def _details(module: str) -> ExtractCache:
+    # Entries depend on the venue's spec and on this engine.
+    return ExtractCache(module, depends=(__name__,))
+
+
+def _fetch_text(get: Callable[..., Any], url: str) -> Optional[str]:
+    try:
+        response = get(url, headers=HEADERS, timeout=TIMEOUT)
+    except Exception:
+        return None
+    return response.text
+
+
+def _first_text(detail: Tag, matcher: Any, keywords: Tuple[str, ...] = ()) -> Optional[str]:
+    for node in matcher.select(detail):
+        text = node.get_text(" ", strip=True)
+        if text and (not keywords or any(keyword in text.lower() for keyword in keywords)):
+            return text
+    return None
+
+
+def _detail_fields(program: VenueProgram, detail: BeautifulSoup) -> dict:
+    compiled = _compile(program)
+    fields = {
+        "starts_at": locate_datetime(detail),
+        "description": _first_text(detail, compiled.description),
+    }
+    if compiled.venue is not None:
+        fields["venue"] = _first_text(detail, compiled.venue, program.venue_keywords)
+    return fields
+
+
+def _accepts_url(program: VenueProgram, url: str) -> bool:
+    href = _compile(program).href
+    return url.startswith(program.url_prefix) and (href is None or bool(href.search(url.split("?")[0])))
+
+
+def _accepts_title(program: VenueProgram, title: str) -> bool:
+    return not program.skip_titles or not any(keyword in title.lower() for keyword in program.skip_titles)
+
+
+def _candidates(program: VenueProgram, soup: BeautifulSoup) -> Iterator[Tuple[Tag, str, str]]:
+    seen: set[Tuple[str, str]] = set()
+    for card, link in segment_cards(soup, program.cards):
+        absolute_url = urljoin(program.program_url, link.get("href"))
+        if not _accepts_url(program, absolute_url):
+            continue
+
+        title = link.get_text(" ", strip=True)
+        if not title or not _accepts_title(program, title):
+            continue
+
+        key = (title, absolute_url)
+        if key in seen:
+            continue
+        seen.add(key)
+        yield card, title, absolute_url
+
+
+def _tags(program: VenueProgram, teaser: str) -> list[str]:
+    tags = list(program.tags)
+    if program.tag_rules:
+        teaser = teaser.lower()
+        for rule in program.tag_rules:
+            if any(keyword in teaser for keyword in rule.keywords):
+                tags.append(rule.tag)
+    return tags
+
+
+def _structured_fields(program: VenueProgram, item: StructuredEvent) -> dict:
+    return {
+        "venue": item.venue or program.venue,
+        "where": item.venue or program.where or program.venue,
+        "tags": _tags(program, f"{item.name} {item.description or ''}"),
+    }
+
+
+def run_program(program: VenueProgram, get: Callable[..., Any] = http_get) -> list[dict]:
+    """Scrape ``program``'s listing page, fetching through ``get``.
+
+    Structured events go through the same URL, title and tag rules as the
+    cards. Cards whose URL the structured data does not cover are still
+    scraped, so a page that marks up only some of its programme loses nothing.
+    """
+
+    def fetch_text(url: str) -> Optional[str]:
+        return _fetch_text(get, url)
+
+    soup = parse_html(fetch_text(program.program_url), parse_only=program.listing)
+    if not soup:
+        return []
+
+    events = structured_events(
+        soup,
+        program.program_url,
+        source=program.source,
+        venue=program.venue,
+        tags=program.tags,
+        accept=lambda url: _accepts_url(program, url),
+        accept_title=lambda title: _accepts_title(program, title),
+        fields=lambda item: _structured_fields(program, item),
+    )
+    covered = {event["url"] for event in events}
+
+    candidates = [candidate for candidate in _candidates(program, soup) if candidate[2] not in covered]
+    details = Prefetcher(fetch_text).schedule(url for _, _, url in candidates)
+    cache = _details(program.module)
+
+    def extract(detail: BeautifulSoup) -> dict:
+        return _detail_fields(program, detail)
+
+    for card, title, absolute_url in candidates:
+        starts_at = locate_datetime(card)
+        detail = cache.extract(absolute_url, details.get(absolute_url), extract) or {}
+        if not starts_at:
+            starts_at = detail.get("starts_at")
+        if not starts_at and program.require_date:
+            # Navigation pages and static info have no scheduled date.
+            continue
+
+        venue = detail.get("venue")
+        extra = {"where": venue or program.where or program.venue}
+        label = to_weekday_label(starts_at)
+        if label:
+            extra["when"] = label
+        description = detail.get("description")
+        if description:
+            extra["description"] = description
+
+        events.append(
+            build_event(
+                source=program.source,
+                title=title,
+                url=absolute_url,
+                starts_at=starts_at,
+                venue=venue or program.venue,
+                tags=_tags(program, card.get_text(" ", strip=True)),
+                extra=extra,
+            )
+        )
+
+    return events
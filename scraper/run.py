@@ -6,22 +6,32 @@ from collections import Counter
 import json
 import logging
 import os
-import re
 from datetime import datetime, timedelta
-from difflib import SequenceMatcher
 from pathlib import Path
-from typing import Callable, Iterable, List, Optional, Tuple
-
-from scraper.normalize import DEFAULT_CITY, TZ as NORMALIZE_TZ
+from typing import Any, Awaitable, Callable, Iterable, List, MutableMapping, Optional, Tuple
+
+from scraper import cassette
+from scraper.executor import (
+    DEFAULT_SOURCE_TIMEOUT,
+    DEFAULT_WORKERS,
+    flatten,
+    run_sources,
+)
+from scraper.merge import TitleIndex
+from scraper.normalize import DATES, DEFAULT_CITY, TZ as NORMALIZE_TZ
 from scraper.schema import (
     BOOLEAN_FIELDS,
+    DATETIME_FIELDS,
+    Event,
     IDENTIFIER_FIELDS,
     INTEGER_FIELDS,
     REQUIRED_FIELDS,
     SOURCE_LINK_KEYS,
     STRING_FIELDS,
 )
+from scraper.similarity import SimilarityIndex
 from scraper.source_registry import SOURCE_CONFIGS
+from scraper.tagging import default_tagger
 
 ROOT = Path(__file__).resolve().parents[1]
 OUT = ROOT / "data" / "events.json"
@@ -29,6 +39,8 @@ SAMPLE_PATH = ROOT / "data" / "events.sample.json"
 TZ = NORMALIZE_TZ
 OFFLINE_MODE = os.getenv("SPONTIS_OFFLINE", "0") == "1"
 DEFAULT_RETENTION_HOURS = int(os.getenv("SPONTIS_EVENT_RETENTION_HOURS", "6"))
+# Trigram Jaccard (title + venue) for merging events across sources; 0 = off.
+FUZZY_MERGE_THRESHOLD = float(os.getenv("SPONTIS_FUZZY_MERGE", "0") or 0)
 
 LOG_LEVEL = os.getenv("SPONTIS_LOG_LEVEL", "INFO").upper()
 logging.basicConfig(
@@ -38,30 +50,9 @@ logging.basicConfig(
 LOGGER = logging.getLogger("spontis.scraper")
 
 
-Source = Tuple[str, Callable[[], Iterable[dict]]]
-
-CATEGORY_PATTERNS = {
-    "techno": re.compile(
-        r"\b(dj|club|techno|rave|house|electro|afterparty|warehouse|disco)\b",
-        re.IGNORECASE,
-    ),
-    "jazz": re.compile(r"\bjazz\b", re.IGNORECASE),
-    "lecture": re.compile(
-        r"\b(lecture|talk|seminar|conference|panel|debate|foredrag|samtale)\b",
-        re.IGNORECASE,
-    ),
-    "festival": re.compile(r"\b(festival|weekender)\b", re.IGNORECASE),
-    "underground": re.compile(r"\b(underground|basement|secret|warehouse)\b", re.IGNORECASE),
-    "family": re.compile(r"\b(family|familie|kids|children|barn|ungdom)\b", re.IGNORECASE),
-    "culture": re.compile(
-        r"\b(art|kunsthall|museum|culture|utstilling|performance|kunst|lecture|talk|seminar|conference|panel|debate|foredrag|samtale)\b",
-        re.IGNORECASE,
-    ),
-}
-LATE_NIGHT_KEYWORDS = re.compile(
-    r"\b(late night|afterparty|after-hours|night session)\b", re.IGNORECASE
-)
-
+Source = Tuple[str, Callable[[], Awaitable[Iterable[dict]]]]
+# A schema.Event inside the pipeline; callers may also pass plain dicts.
+Record = MutableMapping[str, Any]
 
 def _sources() -> List[Source]:
     sources: List[Source] = []
@@ -69,7 +60,7 @@ def _sources() -> List[Source]:
         if not config.is_enabled(os.environ):
             continue
         try:
-            fetcher = config.resolve()
+            fetcher = config.resolve_async()
         except Exception as exc:  # noqa: BLE001 - we want to keep scraper running
             LOGGER.warning("Skipping %s: %s", config.name, exc)
             continue
@@ -107,17 +98,6 @@ def _load_sample_events() -> List[dict]:
     return hydrated
 
 
-def _run_source(name: str, fetch: Callable[[], Iterable[dict]]) -> List[dict]:
-    LOGGER.info("Fetching %s", name)
-    try:
-        events = list(fetch())
-        LOGGER.info("%s: %d events", name, len(events))
-        return events
-    except Exception:
-        LOGGER.exception("%s failed", name)
-        return []
-
-
 def _append_unique(values: List[str], new_value: Optional[str]) -> None:
     if not new_value:
         return
@@ -150,6 +130,49 @@ def _coerce_datetime(value: object, field: str, index: int) -> Optional[datetime
     return dt.astimezone(TZ)
 
 
+def _as_datetime(value: object) -> Optional[datetime]:
+    """Sanitized events already hold datetimes; ISO text from elsewhere is parsed."""
+
+    if isinstance(value, datetime) or value is None:
+        return value
+    try:
+        return datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
+
+
+def _instant(value: object) -> Optional[float]:
+    # Aware datetimes sharing a tzinfo compare by wall clock, which is wrong
+    # across a DST switch; epoch seconds are not.
+    dt = _as_datetime(value)
+    if dt is None:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=TZ)
+    return dt.timestamp()
+
+
+def _event_day(value: object) -> str:
+    """The ``YYYY-MM-DD`` a start time falls on, as written in the feed."""
+
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    return str(value or "").strip()[:10]
+
+
+def _serialize_event(event: Record) -> dict:
+    """The event as written to JSON: start and end times become ISO 8601 text."""
+
+    if isinstance(event, Event):
+        return event.to_dict()
+    record = dict(event)
+    for field in DATETIME_FIELDS:
+        value = record.get(field)
+        if isinstance(value, datetime):
+            record[field] = value.isoformat()
+    return record
+
+
 def _clean_string(value: object) -> Optional[str]:
     if value is None:
         return None
@@ -194,7 +217,7 @@ def _coerce_bool(value: object) -> Optional[bool]:
     return None
 
 
-def _sanitize_source_links(event: dict, target: dict) -> None:
+def _sanitize_source_links(event: dict, target: Record) -> None:
     for key in SOURCE_LINK_KEYS:
         links = event.get(key)
         if not isinstance(links, Iterable):
@@ -216,13 +239,13 @@ def _sanitize_source_links(event: dict, target: dict) -> None:
             break
 
 
-def _sanitize_event(raw: dict, index: int) -> Optional[dict]:
-    if not isinstance(raw, dict):
-        LOGGER.warning("Event %s is not a mapping: %r", index, type(raw))
+def _sanitize_event(event: dict, index: int) -> Optional[Event]:
+    if not isinstance(event, dict):
+        LOGGER.warning("Event %s is not a mapping: %r", index, type(event))
         return None
 
-    event = dict(raw)
-    cleaned: dict = {}
+    # ``event`` is only read; the cleaned fields go straight into the record.
+    cleaned = Event()
 
     for field in REQUIRED_FIELDS:
         value = _clean_string(event.get(field))
@@ -274,10 +297,11 @@ def _sanitize_event(raw: dict, index: int) -> Optional[dict]:
 
     _sanitize_source_links(event, cleaned)
 
-    for field in ("starts_at", "ends_at"):
+    # Kept as aware datetimes until the feed is written, see _serialize_event.
+    for field in DATETIME_FIELDS:
         dt = _coerce_datetime(event.get(field), field, index)
         if dt:
-            cleaned[field] = dt.replace(microsecond=0).isoformat()
+            cleaned[field] = dt.replace(microsecond=0)
 
     # Remove empty entries explicitly set to falsy values
     for key in list(cleaned.keys()):
@@ -288,7 +312,7 @@ def _sanitize_event(raw: dict, index: int) -> Optional[dict]:
     return cleaned
 
 
-def _dedupe_key(event: dict) -> Optional[tuple]:
+def _dedupe_key(event: Record) -> Optional[tuple]:
     title = (event.get("title") or "").strip().lower()
     venue = (event.get("venue") or event.get("where") or "").strip().lower()
     starts_at = event.get("starts_at")
@@ -299,12 +323,7 @@ def _dedupe_key(event: dict) -> Optional[tuple]:
     if not starts_at and not when and not url_hash and not url:
         return None
 
-    date_key: Optional[str] = None
-    if starts_at:
-        start_str = str(starts_at).strip()
-        if start_str:
-            date_key = start_str[:10]
-
+    date_key = _event_day(starts_at) if starts_at else None
     if date_key:
         return ("starts", title, date_key, venue, url_hash or url)
 
@@ -320,9 +339,9 @@ def _dedupe_key(event: dict) -> Optional[tuple]:
     return None
 
 
-def _dedupe(events: Iterable[dict]) -> List[dict]:
+def _dedupe(events: Iterable[Record]) -> List[Record]:
     seen: set = set()
-    deduped: List[dict] = []
+    deduped: List[Record] = []
     merged = 0
     skipped = 0
 
@@ -349,72 +368,31 @@ def _dedupe(events: Iterable[dict]) -> List[dict]:
     return deduped
 
 
-def _sort(events: List[dict]) -> List[dict]:
-    def sort_key(ev: dict):
+def _sort(events: List[Record]) -> List[Record]:
+    def sort_key(ev: Record):
         starts_at = ev.get("starts_at")
         title = (ev.get("title") or "").strip().lower()
         url_hash = ev.get("urlHash") or ev.get("url_hash") or ev.get("url") or ""
         when = (ev.get("when") or "").strip().lower()
 
-        if starts_at:
-            return (0, starts_at, title, url_hash)
+        instant = _instant(starts_at) if starts_at else None
+        if instant is not None:
+            return (0, instant, title, url_hash)
 
         return (1, when, title, url_hash)
 
     return sorted(events, key=sort_key)
 
 
-def _infer_tags(event: dict) -> None:
-    tags = set(event.get("tags", []))
-    haystack = " ".join(
-        part.lower() for part in (event.get("title"), event.get("venue")) if part
-    )
-
-    for tag, pattern in CATEGORY_PATTERNS.items():
-        if pattern.search(haystack):
-            tags.add(tag)
-
-    if LATE_NIGHT_KEYWORDS.search(haystack):
-        tags.add("late-night")
-
-    starts_at = event.get("starts_at")
-    if starts_at:
-        try:
-            dt = datetime.fromisoformat(starts_at)
-        except ValueError:
-            dt = None
-        if dt and (dt.hour >= 22 or dt.hour < 5):
-            tags.add("late-night")
-
-    if tags:
-        event["tags"] = _normalize_tags(tags)
+def _apply_tags(event: Record, tags: Iterable[str]) -> None:
+    normalized = _normalize_tags(tags)
+    if normalized:
+        event["tags"] = normalized
     elif "tags" in event:
         event.pop("tags", None)
 
 
-def _normalize_title(value: str) -> str:
-    lowered = value.lower()
-    without_punct = re.sub(r"[^\w\s]", " ", lowered)
-    collapsed = re.sub(r"\s+", " ", without_punct)
-    return collapsed.strip()
-
-
-def _titles_match(a: str, b: str, threshold: float = 0.8) -> bool:
-    if not a or not b:
-        return False
-    ratio = SequenceMatcher(None, _normalize_title(a), _normalize_title(b)).ratio()
-    return ratio >= threshold
-
-
-def _same_event_day(a: dict, b: dict) -> bool:
-    starts_a = a.get("starts_at")
-    starts_b = b.get("starts_at")
-    if not starts_a or not starts_b:
-        return False
-    return starts_a[:10] == starts_b[:10]
-
-
-def _merge_into(existing: dict, incoming: dict) -> None:
+def _merge_into(existing: Record, incoming: Record) -> None:
     sources = existing.setdefault("sources", [])
     _append_unique(sources, existing.get("source"))
     _append_unique(sources, incoming.get("source"))
@@ -439,29 +417,44 @@ def _merge_into(existing: dict, incoming: dict) -> None:
                 existing_links.append(link)
 
 
-def _merge_related(events: List[dict]) -> Tuple[List[dict], int]:
-    merged: List[dict] = []
-    merges = 0
+def _similarity_text(event: Record) -> str:
+    return f"{event.get('title') or ''} {event.get('venue') or event.get('where') or ''}"
 
-    for event in events:
-        _infer_tags(event)
-        matched = False
-        for candidate in merged:
-            if not _same_event_day(candidate, event):
-                continue
-            if not _titles_match(candidate.get("title", ""), event.get("title", "")):
-                continue
+
+def _merge_related(events: List[Record], fuzzy_threshold: Optional[float] = None) -> Tuple[List[Record], int]:
+    merged: List[Record] = []
+    merges = 0
+    # Same day + similar title, the first such event in feed order wins.
+    index: TitleIndex[Record] = TitleIndex()
+    threshold = FUZZY_MERGE_THRESHOLD if fuzzy_threshold is None else fuzzy_threshold
+    # Optionally also same day + similar title and venue from another source.
+    fuzzy: Optional[SimilarityIndex[int]] = SimilarityIndex(threshold) if threshold else None
+
+    for event, tags in zip(events, default_tagger().infer_all(events)):
+        _apply_tags(event, tags)
+        day = _event_day(event.get("starts_at"))
+        title = event.get("title", "")
+        candidate = index.find(day, title) if day and title else None
+        if candidate is None and fuzzy is not None and day:
+            for match in fuzzy.query(_similarity_text(event), block=day):
+                if event.get("source") not in merged[match.key]["sources"]:
+                    candidate = merged[match.key]
+                    break
+        if candidate is not None:
             _merge_into(candidate, event)
             merges += 1
-            matched = True
-            break
+            continue
 
-        if not matched:
-            new_event = dict(event)
-            sources = []
-            _append_unique(sources, new_event.get("source"))
-            new_event["sources"] = sources
-            merged.append(new_event)
+        # The merged list takes over the event instead of copying it.
+        new_event = event
+        sources = []
+        _append_unique(sources, new_event.get("source"))
+        new_event["sources"] = sources
+        merged.append(new_event)
+        if day and title:
+            index.add(day, title, new_event)
+        if fuzzy is not None and day:
+            fuzzy.add(len(merged) - 1, _similarity_text(new_event), block=day)
 
     for event in merged:
         if event.get("tags"):
@@ -482,32 +475,22 @@ def _parse_now(value: Optional[str]) -> datetime:
     return parsed.astimezone(TZ)
 
 
-def _filter_stale(events: List[dict], now: datetime, retention_hours: int) -> List[dict]:
+def _filter_stale(events: List[Record], now: datetime, retention_hours: int) -> List[Record]:
     if retention_hours <= 0:
         return events
 
-    threshold = now - timedelta(hours=retention_hours)
-    kept: List[dict] = []
+    threshold = now.timestamp() - retention_hours * 3600
+    kept: List[Record] = []
     dropped = 0
 
     for event in events:
-        start_dt = None
-        end_dt = None
-        if event.get("starts_at"):
-            try:
-                start_dt = datetime.fromisoformat(event["starts_at"])
-            except ValueError:
-                start_dt = None
-        if event.get("ends_at"):
-            try:
-                end_dt = datetime.fromisoformat(event["ends_at"])
-            except ValueError:
-                end_dt = None
+        start = _instant(event.get("starts_at"))
+        end = _instant(event.get("ends_at"))
 
         remove = False
-        if end_dt and end_dt < threshold:
+        if end is not None and end < threshold:
             remove = True
-        elif start_dt and start_dt < threshold:
+        elif start is not None and start < threshold:
             remove = True
 
         if remove:
@@ -520,14 +503,18 @@ def _filter_stale(events: List[dict], now: datetime, retention_hours: int) -> Li
     return kept
 
 
-def _refresh_views(events: List[dict], output_path: Path, now: datetime) -> None:
+def _refresh_views(events: List[Record], records: List[dict], output_path: Path, now: datetime) -> None:
     try:
         from scripts import build_views
     except ImportError as exc:
         LOGGER.warning("Unable to import view builder: %s", exc)
         return
 
-    event_objects = [build_views.Event.from_raw(event) for event in events]
+    # ``records`` are the serialized ``events``; the views reuse their parsed start times.
+    event_objects = [
+        build_views.Event(raw=record, starts_at=_as_datetime(event.get("starts_at")))
+        for event, record in zip(events, records)
+    ]
     today = build_views.build_today(event_objects, now)
     tonight = build_views.build_tonight(event_objects, now)
     heatmap = build_views.build_heatmap(event_objects)
@@ -540,7 +527,12 @@ def _refresh_views(events: List[dict], output_path: Path, now: datetime) -> None
     LOGGER.info("Updated derived views")
 
 
-def _write_metadata(events: List[dict], output_path: Path, now: datetime) -> None:
+def _write_metadata(
+    events: List[dict],
+    output_path: Path,
+    now: datetime,
+    source_stats: Optional[List[dict]] = None,
+) -> None:
     data_dir = output_path.parent
     generated_dir = data_dir / "generated"
     generated_dir.mkdir(parents=True, exist_ok=True)
@@ -561,6 +553,15 @@ def _write_metadata(events: List[dict], output_path: Path, now: datetime) -> Non
         payload["message"] = message
     if sources:
         payload["sources"] = sources
+    if source_stats:
+        payload["source_stats"] = source_stats
+        failures = [
+            {"name": stat["name"], "error": stat.get("error", stat["status"])}
+            for stat in source_stats
+            if stat.get("status") not in ("ok", "fallback")
+        ]
+        if failures:
+            payload["source_failures"] = failures
 
     if events:
         counts = Counter()
@@ -593,19 +594,25 @@ def _write_metadata(events: List[dict], output_path: Path, now: datetime) -> Non
     meta_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
 
 
-def _collect_events(offline: bool) -> List[dict]:
+def _collect_events(
+    offline: bool,
+    workers: int = DEFAULT_WORKERS,
+    source_timeout: Optional[float] = DEFAULT_SOURCE_TIMEOUT,
+) -> Tuple[List[dict], List[dict]]:
     if offline:
         LOGGER.info("Offline mode enabled – using sample events only")
-        return _load_sample_events()
+        return _load_sample_events(), []
 
-    collected: List[dict] = []
-    for name, fetch in _sources():
-        collected.extend(_run_source(name, fetch))
+    results = run_sources(_sources(), workers=workers, timeout=source_timeout)
+    collected = flatten(results)
+    stats = [result.as_stat() for result in results]
 
     if not collected:
         LOGGER.warning("No events collected from live sources; falling back to samples")
-        collected.extend(_load_sample_events())
-    return collected
+        samples = _load_sample_events()
+        collected.extend(samples)
+        stats.append({"name": "Sample", "status": "fallback", "events": len(samples)})
+    return collected, stats
 
 
 def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
@@ -623,6 +630,37 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         default=OFFLINE_MODE,
         help="Skip network calls and rely on sample data",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help="How many sources to scrape in parallel (1 = sequential)",
+    )
+    parser.add_argument(
+        "--source-timeout",
+        type=float,
+        default=DEFAULT_SOURCE_TIMEOUT,
+        help="Seconds a single source may run before it is reported as timed out (0 = no limit)",
+    )
+    cassette_group = parser.add_mutually_exclusive_group()
+    cassette_group.add_argument(
+        "--record",
+        type=Path,
+        metavar="CASSETTE",
+        help="Record every HTTP response to a gzipped cassette file",
+    )
+    cassette_group.add_argument(
+        "--replay",
+        type=Path,
+        metavar="CASSETTE",
+        help="Serve HTTP responses from a recorded cassette instead of the network",
+    )
+    parser.add_argument(
+        "--replay-latency",
+        type=float,
+        default=cassette.DEFAULT_LATENCY,
+        help="Artificial per-request latency in seconds while replaying",
+    )
     parser.add_argument(
         "--no-update-views",
         dest="update_views",
@@ -646,8 +684,24 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
 def main(argv: Optional[List[str]] = None) -> None:
     args = parse_args(argv)
     now = _parse_now(args.now)
-    collected = _collect_events(args.offline)
+    if args.record:
+        cassette_path, cassette_mode = args.record, cassette.RECORD
+    elif args.replay:
+        cassette_path, cassette_mode = args.replay, cassette.REPLAY
+    else:
+        cassette_path, cassette_mode = None, cassette.REPLAY
+    with cassette.use(cassette_path, cassette_mode, latency=args.replay_latency):
+        collected, source_stats = _collect_events(
+            args.offline,
+            workers=args.workers,
+            source_timeout=args.source_timeout or None,
+        )
     LOGGER.info("Collected %d raw events", len(collected))
+    LOGGER.info(
+        "Dates resolved: %(iso)d ISO, %(rejected)d rejected, %(hits)d cached, "
+        "%(grammar)d grammar, %(dateparser)d dateparser, %(unparsed)d unparsed",
+        DATES.stats(),
+    )
 
     validated = []
     for idx, raw in enumerate(collected, start=1):
@@ -664,15 +718,16 @@ def main(argv: Optional[List[str]] = None) -> None:
 
     events = _filter_stale(events, now=now, retention_hours=args.retention_hours)
 
+    records = [_serialize_event(event) for event in events]
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(events, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
-    LOGGER.info("Wrote %d events → %s", len(events), output_path)
+    output_path.write_text(json.dumps(records, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    LOGGER.info("Wrote %d events → %s", len(records), output_path)
 
-    _write_metadata(events, output_path, now)
+    _write_metadata(records, output_path, now, source_stats)
 
     if args.update_views:
-        _refresh_views(events, output_path, now)
+        _refresh_views(events, records, output_path, now)
 
 
 if __name__ == "__main__":
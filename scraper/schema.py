@@ -1,4 +1,10 @@
 """Canonical event schema definitions for the SPONTIS scraper."""
+from __future__ import annotations
+
+import sys
+from collections.abc import MutableMapping
+from datetime import datetime
+from typing import Any, Dict, Iterator, Mapping, Optional
 
 REQUIRED_FIELDS = ("source", "title", "url")
 
@@ -22,4 +28,119 @@ STRING_FIELDS = {
 INTEGER_FIELDS = {"url_status"}
 BOOLEAN_FIELDS = {"free"}
 IDENTIFIER_FIELDS = {"urlHash", "url_hash"}
+DATETIME_FIELDS = ("starts_at", "ends_at")
 SOURCE_LINK_KEYS = {"sourceLinks", "source_links"}
+
+# Event fields with a slot of their own; everything else goes to ``Event.extra``.
+EVENT_SLOTS = (
+    "source",
+    "title",
+    "url",
+    "city",
+    "venue",
+    "where",
+    "when",
+    "tags",
+    "sources",
+    "starts_at",
+    "ends_at",
+)
+# Repeated across thousands of events, so one copy of each is shared.
+INTERNED_FIELDS = frozenset({"source", "venue", "city", "where"})
+
+_HEAD = EVENT_SLOTS[:7]
+_TAIL = EVENT_SLOTS[7:]
+_SLOTTED = frozenset(EVENT_SLOTS)
+_MISSING = object()
+
+
+class Event(MutableMapping):
+    """One event inside the pipeline.
+
+    Common fields live in slots and the long tail (description, price,
+    sourceLinks …) in a small ``extra`` dict created on first use, so an event
+    costs a fraction of the equivalent dict. ``source``, ``venue``, ``city``,
+    ``where`` and tags are interned. The mapping interface mirrors the JSON
+    dict (``None`` means absent), so pipeline stages read and write either;
+    :meth:`from_dict` and :meth:`to_dict` convert at the edges.
+    """
+
+    __slots__ = EVENT_SLOTS + ("extra",)
+
+    def __init__(self, fields: Optional[Mapping[str, Any]] = None, **kwargs: Any) -> None:
+        for name in EVENT_SLOTS:
+            setattr(self, name, None)
+        self.extra: Optional[Dict[str, Any]] = None
+        for source in (fields or {}, kwargs):
+            for key, value in source.items():
+                self[key] = value
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "Event":
+        return cls(data)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The JSON record: fields in a fixed order, datetimes as ISO 8601."""
+
+        record: Dict[str, Any] = {}
+        for key, value in self.items():
+            record[key] = value.isoformat() if isinstance(value, datetime) else value
+        return record
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in _SLOTTED:
+            value = getattr(self, key)
+            return default if value is None else value
+        if self.extra is None:
+            return default
+        return self.extra.get(key, default)
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(key, _MISSING) is not _MISSING  # type: ignore[arg-type]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in _SLOTTED:
+            if key in INTERNED_FIELDS and isinstance(value, str):
+                value = sys.intern(value)
+            elif key == "tags" and value is not None:
+                value = [sys.intern(str(tag)) for tag in value]
+            setattr(self, key, value)
+            return
+        if self.extra is None:
+            self.extra = {}
+        self.extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        if key in _SLOTTED:
+            setattr(self, key, None)
+        else:
+            del self.extra[key]  # type: ignore[index]
+            if not self.extra:
+                self.extra = None
+
+    def __iter__(self) -> Iterator[str]:
+        for name in _HEAD:
+            if getattr(self, name) is not None:
+                yield name
+        if self.extra:
+            yield from list(self.extra)
+        for name in _TAIL:
+            if getattr(self, name) is not None:
+                yield name
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def copy(self) -> "Event":
+        return Event(self)
+
+    def __repr__(self) -> str:
+        return f"Event({dict(self.items())!r})"
@@ -0,0 +1,283 @@
+"""Near-duplicate lookup over short texts (event titles, venues, source names).
+
+:class:`SimilarityIndex` finds texts whose character-trigram sets have a
+Jaccard similarity of at least ``threshold``. Each text gets a MinHash
+signature (one hash per trigram, see :func:`one_permutation_signature`),
+split into bands; texts sharing any band land in the same bucket,
+so a lookup only looks at the few entries that collide with it instead of
+the whole index. Candidates are then checked against the exact trigram
+Jaccard, so the index may miss a pair that barely clears the threshold
+(the band layout keeps that under ~5 % at the threshold itself) but never
+returns one below it.
+
+Entries can be partitioned by a ``block`` (a day, a city …); lookups only
+see entries in the same block::
+
+    index = SimilarityIndex(threshold=0.6)
+    index.add_many((number, text, day) for number, (text, day) in enumerate(rows))
+    index.query("Jazz på Victoria", block="2025-10-07")
+"""
+from __future__ import annotations
+
+import hashlib
+import random
+import re
+from collections import defaultdict
+from functools import lru_cache
+from typing import (
+    Dict,
+    FrozenSet,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+K = TypeVar("K", bound=Hashable)
+
+DEFAULT_THRESHOLD = 0.6
+DEFAULT_NUM_PERM = 64
+# Lowest chance that a pair exactly at the threshold shares a bucket.
+_RECALL_AT_THRESHOLD = 0.95
+
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_SPACE_RE = re.compile(r"\s+")
+
+
+class Match(NamedTuple):
+    key: Hashable
+    score: float
+
+
+def normalize_text(value: str) -> str:
+    without_punct = _PUNCT_RE.sub(" ", value.lower())
+    return _SPACE_RE.sub(" ", without_punct).strip()
+
+
+def shingles(text: str, size: int = 3) -> FrozenSet[str]:
+    """Character ``size``-grams of the normalized text, padded so short words count."""
+
+    normalized = normalize_text(text)
+    if not normalized:
+        return frozenset()
+    padded = " " * (size - 1) + normalized + " "
+    return frozenset(padded[i : i + size] for i in range(len(padded) - size + 1))
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a and not b:
+        return 1.0
+    shared = len(a & b)
+    return shared / (len(a) + len(b) - shared)
+
+
+@lru_cache(maxsize=None)
+def band_layout(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """``(bands, rows)`` with the most rows that still catch pairs at ``threshold``.
+
+    A pair with similarity ``s`` shares a bucket with probability
+    ``1 - (1 - s**rows) ** bands``; more rows per band means fewer unrelated
+    texts colliding.
+    """
+
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        if 1 - (1 - threshold**rows) ** bands < _RECALL_AT_THRESHOLD:
+            break
+        best = (bands, rows)
+    return best
+
+
+@lru_cache(maxsize=1 << 16)
+def _shingle_hash(shingle: str, seed: int) -> int:
+    digest = hashlib.blake2b(shingle.encode("utf-8"), digest_size=8, salt=seed.to_bytes(8, "little"))
+    return int.from_bytes(digest.digest(), "little")
+
+
+@lru_cache(maxsize=None)
+def _probes(num_perm: int, seed: int) -> Tuple[Tuple[int, ...], ...]:
+    """For each bin, the fixed random order in which other bins are borrowed from."""
+
+    rng = random.Random(seed)
+    probes = []
+    for slot in range(num_perm):
+        others = [other for other in range(num_perm) if other != slot]
+        rng.shuffle(others)
+        probes.append(tuple(others))
+    return tuple(probes)
+
+
+def one_permutation_signature(grams: Iterable[str], num_perm: int, seed: int) -> Tuple[int, ...]:
+    """MinHash signature from a single hash per shingle.
+
+    Each shingle's hash picks a bin and competes for that bin's minimum, so a
+    title costs one hash per trigram instead of one per trigram and
+    permutation. Bins no shingle fell into copy a filled bin chosen by a
+    fixed random probe sequence ("optimal densification", Shrivastava 2017),
+    which keeps the chance of two signatures agreeing on a position equal to
+    the Jaccard similarity of their sets.
+    """
+
+    slots: List[Optional[int]] = [None] * num_perm
+    for gram in grams:
+        value = _shingle_hash(gram, seed)
+        slot = value % num_perm
+        current = slots[slot]
+        if current is None or value < current:
+            slots[slot] = value
+    empty = [slot for slot, value in enumerate(slots) if value is None]
+    if len(empty) == num_perm:
+        return ()
+    probes = _probes(num_perm, seed)
+    signature = list(slots)
+    for slot in empty:
+        for other in probes[slot]:
+            value = slots[other]
+            if value is not None:
+                signature[slot] = value
+                break
+    return tuple(signature)  # type: ignore[arg-type]
+
+
+class _Entry(NamedTuple):
+    order: int
+    key: Hashable
+    block: Hashable
+    shingles: FrozenSet[str]
+    buckets: Tuple[tuple, ...]
+
+
+class SimilarityIndex(Generic[K]):
+    """Keys indexed by text; :meth:`query` returns the near-duplicates of a text."""
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_THRESHOLD,
+        num_perm: int = DEFAULT_NUM_PERM,
+        *,
+        seed: int = 1,
+    ) -> None:
+        if not 0 < threshold <= 1:
+            raise ValueError(f"threshold must be in (0, 1], got {threshold!r}")
+        self.threshold = threshold
+        self.bands, self.rows = band_layout(threshold, num_perm)
+        self._num_perm = num_perm
+        self._seed = seed
+        self._entries: Dict[Hashable, _Entry] = {}
+        # (block, band, band values) -> keys, in insertion order
+        self._buckets: Dict[tuple, List[Hashable]] = defaultdict(list)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def signature(self, grams: Iterable[str]) -> Tuple[int, ...]:
+        return one_permutation_signature(grams, self._num_perm, self._seed)
+
+    def _bands(self, block: Hashable, grams: FrozenSet[str]) -> Tuple[tuple, ...]:
+        if not grams:
+            return ()
+        signature = self.signature(grams)
+        rows = self.rows
+        return tuple((block, band, signature[band * rows : (band + 1) * rows]) for band in range(self.bands))
+
+    def add(self, key: K, text: str, block: Hashable = None) -> None:
+        if key in self._entries:
+            raise ValueError(f"key {key!r} is already indexed")
+        grams = shingles(text)
+        # Without shingles there are no buckets: the key is known but never matches.
+        entry = _Entry(len(self._entries), key, block, grams, self._bands(block, grams))
+        self._entries[key] = entry
+        for bucket in entry.buckets:
+            self._buckets[bucket].append(key)
+
+    def add_many(self, items: Iterable[Sequence]) -> None:
+        """Index ``(key, text)`` or ``(key, text, block)`` rows."""
+
+        for item in items:
+            self.add(*item)
+
+    def query(self, text: str, block: Hashable = None, *, threshold: Optional[float] = None) -> List[Match]:
+        """Keys in ``block`` whose text is similar to ``text``, best first.
+
+        Ties keep insertion order. ``threshold`` may be raised above the
+        index's own for one lookup; lowering it cannot find pairs the bands
+        were not laid out for.
+        """
+
+        grams = shingles(text)
+        if not grams:
+            return []
+        return self._verify(self._candidates(self._bands(block, grams)), grams, threshold)
+
+    def query_many(self, texts: Iterable[Sequence]) -> List[List[Match]]:
+        """:meth:`query` for each ``text`` or ``(text, block)`` row."""
+
+        results: List[List[Match]] = []
+        for row in texts:
+            if isinstance(row, str):
+                results.append(self.query(row))
+            else:
+                results.append(self.query(*row))
+        return results
+
+    def similar_to(self, key: K, *, threshold: Optional[float] = None) -> List[Match]:
+        """Indexed keys similar to the already indexed ``key`` (excluding itself)."""
+
+        entry = self._entries[key]
+        candidates = [found for found in self._candidates(entry.buckets) if found != key]
+        return self._verify(candidates, entry.shingles, threshold)
+
+    def duplicates(self, *, threshold: Optional[float] = None) -> List[List[K]]:
+        """Groups of keys linked by near-duplicate pairs, in insertion order.
+
+        Similarity is not transitive, so a group may hold two keys that are
+        only related through a third.
+        """
+
+        parent: Dict[Hashable, Hashable] = {key: key for key in self._entries}
+
+        def root(key: Hashable) -> Hashable:
+            while parent[key] != key:
+                parent[key] = parent[parent[key]]
+                key = parent[key]
+            return key
+
+        for key in self._entries:
+            for match in self.similar_to(key, threshold=threshold):
+                a, b = root(key), root(match.key)
+                if a != b:
+                    # The earliest key stays the representative.
+                    first, second = sorted((a, b), key=lambda k: self._entries[k].order)
+                    parent[second] = first
+
+        groups: Dict[Hashable, List[K]] = {}
+        for key in self._entries:
+            groups.setdefault(root(key), []).append(key)  # type: ignore[arg-type]
+        return [group for group in groups.values() if len(group) > 1]
+
+    def _candidates(self, buckets: Iterable[tuple]) -> List[Hashable]:
+        seen: Dict[Hashable, None] = {}
+        for bucket in buckets:
+            for key in self._buckets.get(bucket, ()):
+                seen.setdefault(key)
+        return list(seen)
+
+    def _verify(self, candidates: Iterable[Hashable], grams: FrozenSet[str], threshold: Optional[float]) -> List[Match]:
+        cutoff = self.threshold if threshold is None else threshold
+        scored = []
+        for key in candidates:
+            entry = self._entries[key]
+            score = jaccard(entry.shingles, grams)
+            if score >= cutoff:
+                scored.append((entry.order, Match(key, score)))
+        scored.sort(key=lambda item: (-item[1].score, item[0]))
+        return [match for _, match in scored]
@@ -1,12 +1,14 @@
 """Registry of scraper sources and feature flags."""
 from __future__ import annotations
 
+import inspect
 from dataclasses import dataclass
 from importlib import import_module
-from typing import Callable, Iterable, Mapping
+from typing import Awaitable, Callable, Iterable, Mapping, Optional
 
 
 Fetcher = Callable[[], Iterable[dict]]
+AsyncFetcher = Callable[[], Awaitable[Iterable[dict]]]
 
 
 @dataclass(frozen=True)
@@ -14,8 +16,12 @@ class SourceConfig:
     name: str
     module: str
     attr: str = "fetch"
+    async_attr: str = "fetch_async"
     env_flag: str | None = None
     default_enabled: bool = True
+    max_connections: Optional[int] = None
+    min_interval: Optional[float] = None
+    html_parser: Optional[str] = None
 
     def is_enabled(self, env: Mapping[str, str]) -> bool:
         if not self.env_flag:
@@ -34,12 +40,48 @@ class SourceConfig:
             raise AttributeError(f"{self.module}.{self.attr} is not callable")
         return fetcher  # type: ignore[return-value]
 
+    def http_policy(self):
+        """Per-host politeness overrides for requests made by this source."""
+        if self.max_connections is None and self.min_interval is None:
+            return None
+
+        from scraper.http import HostPolicy
+
+        default = HostPolicy.from_env()
+        return HostPolicy(
+            max_connections=self.max_connections or default.max_connections,
+            min_interval=default.min_interval if self.min_interval is None else self.min_interval,
+        )
+
+    def resolve_async(self) -> AsyncFetcher:
+        """Return the source's native ``fetch_async`` or an adapter around ``fetch``."""
+        module = import_module(self.module)
+        fetcher = getattr(module, self.async_attr, None)
+        if not inspect.iscoroutinefunction(fetcher):
+            from scraper.executor import to_async
+
+            fetcher = to_async(self.resolve())
+
+        policy = self.http_policy()
+        if policy is None and self.html_parser is None:
+            return fetcher  # type: ignore[return-value]
+
+        from scraper.html import parser_backend
+        from scraper.http import source_policy
+
+        async def fetch_with_overrides():
+            with source_policy(policy), parser_backend(self.html_parser):
+                return await fetcher()
+
+        fetch_with_overrides.__name__ = getattr(fetcher, "__name__", self.async_attr)
+        return fetch_with_overrides
+
 
 SOURCE_CONFIGS: tuple[SourceConfig, ...] = (
     SourceConfig(name="Bergen Kino", module="scraper.sources.bergen_kino"),
     SourceConfig(name="Østre", module="scraper.sources.ostre", env_flag="SCRAPE_OSTRE", default_enabled=True),
     SourceConfig(name="USF Verftet", module="scraper.sources.usf_verftet", env_flag="ENABLE_USF", default_enabled=True),
-    SourceConfig(name="Bergen Kjøtt", module="scraper.sources.bergen_kjott", env_flag="ENABLE_BERGEN_KJOTT", default_enabled=True),
+    SourceConfig(name="Bergen Kjøtt", module="scraper.sources.bergen_kjott", env_flag="ENABLE_BERGEN_KJOTT", default_enabled=True, max_connections=2, min_interval=1.0),
     SourceConfig(name="Bergen Kunsthall", module="scraper.sources.bergen_kunsthall", env_flag="ENABLE_KUNSTHALL", default_enabled=True),
     SourceConfig(name="BIT Teatergarasjen", module="scraper.sources.bit_teatergarasjen", env_flag="ENABLE_BIT", default_enabled=True),
     SourceConfig(name="Litteraturhuset", module="scraper.sources.litteraturhuset", env_flag="ENABLE_LITTERATURHUSET", default_enabled=True),
@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
-from datetime import datetime
 from typing import Iterable, Optional, Tuple
 from urllib.parse import urljoin
 
-import dateparser
-import requests
 from bs4 import BeautifulSoup, Tag
 
+from scraper.extract_cache import ExtractCache
+from scraper.html import make_soup, segment_cards
+from scraper.http import get as http_get
+from scraper.locate import locate_datetime
 from scraper.normalize import build_event, to_weekday_label
+from scraper.prefetch import Prefetcher
+from scraper.structured import structured_events
 
 BASE_URL = "https://aerialbergen.com"
 CANDIDATE_PATHS: Iterable[str] = (
@@ -24,59 +27,46 @@ HEADERS = {
     "User-Agent": "SpontisBot/0.3 (+https://spontis-app.github.io)",
     "Accept-Language": "nb,en;q=0.8",
 }
-SETTINGS = {
-    "TIMEZONE": "Europe/Oslo",
-    "DATE_ORDER": "DMY",
-    "PREFER_DATES_FROM": "future",
-    "RETURN_AS_TIMEZONE_AWARE": False,
-}
 TIMEOUT = 20
-
-
-def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
-    if not value:
-        return None
-    return dateparser.parse(value, languages=["nb", "en"], settings=SETTINGS)
+DETAILS = ExtractCache(__name__)
 
 
 def _discover_page() -> Optional[Tuple[str, BeautifulSoup]]:
     for path in CANDIDATE_PATHS:
         url = urljoin(BASE_URL, path)
         try:
-            resp = requests.get(url, headers=HEADERS, timeout=TIMEOUT)
-            resp.raise_for_status()
+            resp = http_get(url, headers=HEADERS, timeout=TIMEOUT)
         except Exception:
             continue
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = make_soup(resp.text)
         if soup.find("a", href=True):
             return url, soup
     return None
 
 
-def _extract_datetime(node: Tag) -> Optional[datetime]:
-    lineage = [node] + list(node.parents)[:3]
-    for candidate in lineage:
-        if not isinstance(candidate, Tag):
-            continue
-        for time_tag in candidate.find_all("time"):
-            stamp = time_tag.get("datetime") or time_tag.get("content")
-            dt = _parse_datetime(stamp) or _parse_datetime(time_tag.get_text(" ", strip=True))
-            if dt:
-                return dt
-        text = " ".join(candidate.get_text(" ", strip=True).split())
-        dt = _parse_datetime(text)
-        if dt:
-            return dt
-    return None
-
-
-def _fetch_detail(url: str) -> Optional[BeautifulSoup]:
+def _fetch_text(url: str) -> Optional[str]:
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=TIMEOUT)
-        resp.raise_for_status()
+        resp = http_get(url, headers=HEADERS, timeout=TIMEOUT)
     except Exception:
         return None
-    return BeautifulSoup(resp.text, "html.parser")
+    return resp.text
+
+
+def _detail_fields(detail: BeautifulSoup) -> dict:
+    description = None
+    for paragraph in detail.select(".event-description p, .content p, .et_pb_text p, .elementor-widget-container p"):
+        text = paragraph.get_text(" ", strip=True)
+        if text:
+            description = text
+            break
+    return {"starts_at": locate_datetime(detail), "description": description}
+
+
+def _tags(teaser: str) -> list[str]:
+    tags = ["culture", "community"]
+    if any(keyword in teaser.lower() for keyword in ("workshop", "kurs", "class")):
+        tags.append("workshop")
+    return tags
 
 
 def fetch() -> list[dict]:
@@ -85,13 +75,23 @@ def fetch() -> list[dict]:
         return []
     base_url, soup = discovered
 
+    structured = structured_events(
+        soup,
+        base_url,
+        source="Aerial Bergen",
+        venue="Aerial Bergen",
+        tags=["culture", "community"],
+        accept=lambda url: url.startswith(BASE_URL),
+        fields=lambda item: {"tags": _tags(f"{item.name} {item.description or ''}")},
+    )
+    if structured:
+        return structured
+
     events: list[dict] = []
     seen: set[Tuple[str, str]] = set()
 
-    for card in soup.select("article, li, div"):
-        link = card.find("a", href=True)
-        if not link:
-            continue
+    candidates: list[Tuple[Tag, str, str]] = []
+    for card, link in segment_cards(soup):
         href = link.get("href")
         absolute_url = urljoin(base_url, href)
         if not absolute_url.startswith(BASE_URL):
@@ -105,20 +105,17 @@ def fetch() -> list[dict]:
         if key in seen:
             continue
         seen.add(key)
+        candidates.append((card, title, absolute_url))
 
-        detail = _fetch_detail(absolute_url)
-        starts_at = _extract_datetime(card)
-        if not starts_at and detail:
-            starts_at = _extract_datetime(detail)
+    details = Prefetcher(_fetch_text).schedule(url for _, _, url in candidates)
+    for card, title, absolute_url in candidates:
+        starts_at = locate_datetime(card)
+        detail = DETAILS.extract(absolute_url, details.get(absolute_url), _detail_fields) or {}
+        if not starts_at:
+            starts_at = detail.get("starts_at")
 
         venue = "Aerial Bergen"
-        description = None
-        if detail:
-            for paragraph in detail.select(".event-description p, .content p, .et_pb_text p, .elementor-widget-container p"):
-                text = paragraph.get_text(" ", strip=True)
-                if text:
-                    description = text
-                    break
+        description = detail.get("description")
 
         extra = {"where": venue}
         label = to_weekday_label(starts_at)
@@ -127,11 +124,6 @@ def fetch() -> list[dict]:
         if description:
             extra["description"] = description
 
-        tags = ["culture", "community"]
-        teaser = card.get_text(" ", strip=True).lower()
-        if any(keyword in teaser for keyword in ("workshop", "kurs", "class")):
-            tags.append("workshop")
-
         events.append(
             build_event(
                 source="Aerial Bergen",
@@ -139,7 +131,7 @@ def fetch() -> list[dict]:
                 url=absolute_url,
                 starts_at=starts_at,
                 venue=venue,
-                tags=tags,
+                tags=_tags(card.get_text(" ", strip=True)),
                 extra=extra,
             )
         )
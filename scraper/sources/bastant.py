@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from scraper.sources.ticketco import fetch_events
+from scraper.sources.ticketco import fetch_events, fetch_events_async
 
 SLUGS = [
     "bastant",
@@ -18,3 +18,12 @@ def fetch() -> list[dict]:
         default_venue="Bastant Bar",
         default_tags=DEFAULT_TAGS,
     )
+
+
+async def fetch_async() -> list[dict]:
+    return await fetch_events_async(
+        SLUGS,
+        source_name="Bastant",
+        default_venue="Bastant Bar",
+        default_tags=DEFAULT_TAGS,
+    )
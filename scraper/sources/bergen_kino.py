@@ -1,15 +1,18 @@
 # scraper/sources/bergen_kino.py
+import os
 import re
 from collections import defaultdict
-from datetime import datetime
+from datetime import date, datetime, time, timedelta
+from typing import Iterator, Optional
 from urllib.parse import urljoin
 
-import dateparser
-from bs4 import BeautifulSoup
+from bs4 import NavigableString, PageElement, Tag
 from requests import HTTPError
 
+from scraper.html import make_soup, parse_html
 from scraper.http import get as http_get
-from scraper.normalize import build_event, format_showtimes
+from scraper.normalize import TZ, build_event, format_showtimes, parse_datetime
+from scraper.prefetch import Prefetcher
 
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -27,11 +30,72 @@ CANDIDATES = [
     "/",
 ]
 
-TIME_RX = re.compile(r"\b([01]?\d|2[0-3]):[0-5]\d\b")
+TIME_RX = re.compile(r"\b([01]?\d|2[0-3]):([0-5]\d)\b")
+# Antall dager (fra og med i dag) som hentes fra filmsidene; 1 = bare programsiden.
+PROGRAM_DAYS = int(os.getenv("SPONTIS_KINO_DAYS", "7"))
+# Dagsoverskrifter på filmsidene: overskriftselementer eller elementer med en
+# dag-/datoklasse («Lør 18.10», «I morgen»). Annen tekst bytter aldri dag.
+DAY_HEADINGS = ("h2", "h3", "h4")
+DAY_CLASS_RX = re.compile(r"(?:^|[-_])(?:day|dag|date|dato)(?:$|[-_])", re.IGNORECASE)
+# Sidens ramme (åpningstider, kundeservice) er aldri en del av programmet.
+PAGE_CHROME = ("header", "footer", "nav", "aside")
 
 def _get(url):
     return http_get(url, headers=HEADERS)
 
+def _get_text(url: str) -> Optional[str]:
+    try:
+        return _get(url).text
+    except Exception:
+        return None
+
+def _at(day: date, match: "re.Match[str]") -> datetime:
+    return datetime.combine(day, time(int(match.group(1)), int(match.group(2))), tzinfo=TZ)
+
+def _showtimes(text: str, day: date) -> list[datetime]:
+    """HH:MM-tokens i ``text`` som tidssonebevisste tidspunkt på ``day``."""
+    return [_at(day, m) for m in TIME_RX.finditer(text)]
+
+def _is_day_heading(tag: Tag) -> bool:
+    return tag.name in DAY_HEADINGS or any(DAY_CLASS_RX.search(name) for name in tag.get("class") or ())
+
+def _program_nodes(node: Tag) -> Iterator[PageElement]:
+    """``node.descendants`` i dokumentrekkefølge, uten :data:`PAGE_CHROME`."""
+    for child in node.children:
+        if isinstance(child, Tag):
+            if child.name in PAGE_CHROME:
+                continue
+            yield child
+            yield from _program_nodes(child)
+        else:
+            yield child
+
+def _program_days(page: Tag, today: date, days: int) -> set[datetime]:
+    """Visninger fra en filmside der tidene står under dagsoverskrifter.
+
+    Én gjennomgang i dokumentrekkefølge: en dagsoverskrift (se
+    :data:`DAY_HEADINGS`) som (uten klokkeslettene) kan leses som en dato
+    bytter dag, og klokkeslett knyttes til gjeldende dag. Før første
+    dagsoverskrift, og etter en overskrift som ikke er en dato («Om filmen»),
+    hører ingen tider til programmet; det gjør heller ikke sidens ramme.
+    Tider utenfor vinduet hoppes over.
+    """
+    last = today + timedelta(days=days - 1)
+    day: Optional[date] = None
+    found: set[datetime] = set()
+    for node in _program_nodes(page):
+        if isinstance(node, Tag):
+            if _is_day_heading(node):
+                label = TIME_RX.sub("", node.get_text(" ", strip=True)).strip(" ,.-–|")
+                parsed = parse_datetime(label) if label else None
+                if parsed:
+                    day = parsed.date()
+                elif node.name in DAY_HEADINGS:
+                    day = None
+        elif type(node) is NavigableString and day is not None and today <= day <= last:
+            found.update(_showtimes(node, day))
+    return found
+
 def _discover_program_url():
     # prøv kandidatstier
     for path in CANDIDATES:
@@ -44,7 +108,7 @@ def _discover_program_url():
         if TIME_RX.search(r.text):
             return url, r.text
         # ellers: se om det finnes lenker som peker til noe med "program/kinoprogram"
-        soup = BeautifulSoup(r.text, "html.parser")
+        soup = make_soup(r.text)
         for a in soup.select("a[href]"):
             href = a.get("href") or ""
             label = (a.get_text() or "").lower()
@@ -74,36 +138,38 @@ def _infer_tags(title: str) -> list[str]:
 
 def fetch() -> list[dict]:
     url, html = _discover_program_url()
-    soup = BeautifulSoup(html, "html.parser")
+    soup = make_soup(html)
+    # Referansedagen løses én gang per kjøring, ikke per filmkort.
+    today = datetime.now(TZ).date()
     grouped: dict[tuple[str, str], set[datetime]] = defaultdict(set)
 
-    # grep filmkort som lenker til detaljer
+    # grep filmkort som lenker til detaljer; én gjennomgang grupperer tidene per film
     for card in soup.select("a[href*='/film/'], a[href*='/kino/']"):
-        title = card.get_text(" ", strip=True)
+        text = card.get_text(" ", strip=True)
+        # tidene står ofte i kortet; tittelen er resten, så kort med ulike tider samles
+        title = " ".join(TIME_RX.sub(" ", text).split())
         href = card.get("href") or ""
         if not title or "/film/" not in href:
             continue
         film_url = urljoin(BASE, href)
-        text = card.get_text(" ", strip=True)
-        times = TIME_RX.findall(text)
+        grouped[(title, film_url)].update(_showtimes(text, today)[:6])
 
-        the_date = dateparser.parse("today", languages=["nb"], settings={"TIMEZONE": "Europe/Oslo"})
-        if not the_date:
-            continue
+    # hele ukesprogrammet per film, hentet parallelt
+    if PROGRAM_DAYS > 1 and grouped:
+        pages = Prefetcher(_get_text, parse_html).schedule(film_url for _, film_url in grouped)
+        for (title, film_url), times in grouped.items():
+            page = pages.get(film_url)
+            if page is not None:
+                times.update(_program_days(page, today, PROGRAM_DAYS))
 
-        for t in times[:6]:
-            dt = dateparser.parse(f"{the_date:%Y-%m-%d} {t}", settings={"TIMEZONE": "Europe/Oslo"})
-            if not dt:
-                continue
-            grouped[(title, film_url)].add(dt)
+    for key in [key for key, times in grouped.items() if not times]:
+        del grouped[key]
 
     # ekstrem fallback: plukk tider hvor som helst på siden
     if not grouped:
-        for m in TIME_RX.finditer(soup.get_text(" ", strip=True)):
-            t = m.group(0)
-            dt = dateparser.parse(f"today {t}", settings={"TIMEZONE":"Europe/Oslo"})
-            if dt:
-                grouped[("Kinovisning", url)].add(dt)
+        times = set(_showtimes(soup.get_text(" ", strip=True), today))
+        if times:
+            grouped[("Kinovisning", url)] = times
 
     items: list[dict] = []
     for (title, film_url), times in grouped.items():
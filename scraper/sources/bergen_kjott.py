@@ -2,18 +2,24 @@
 
 from __future__ import annotations
 
-from datetime import datetime
 from typing import Optional, Tuple
 from urllib.parse import urljoin
 import re
 
-import dateparser
 from bs4 import BeautifulSoup, Tag
 
-from scraper.normalize import build_event, to_weekday_label
+from scraper.extract_cache import ExtractCache
+from scraper.html import ParseOnly, parse_html
 from scraper.http import get as http_get
+from scraper.locate import locate_datetime
+from scraper.normalize import build_event, to_weekday_label
+from scraper.prefetch import Prefetcher
+from scraper.structured import structured_events
 
 PROGRAM_URL = "https://www.bergenkjott.org/kalendar"
+# Cards are plain ``div`` wrappers that ``locate_datetime`` walks up through,
+# so a strainer would keep nearly everything: only drop scripts, styles and icons.
+LISTING = ParseOnly()
 EVENT_PATH_PATTERN = re.compile(r"/events/[^/]+/?$|/program/[^/]+/?$", re.IGNORECASE)
 SKIP_TITLES = (
     'what´s on',
@@ -34,67 +40,37 @@ HEADERS = {
     "User-Agent": "SpontisBot/0.2 (+https://spontis-app.github.io)",
     "Accept-Language": "nb,en;q=0.8",
 }
-SETTINGS = {
-    "TIMEZONE": "Europe/Oslo",
-    "DATE_ORDER": "DMY",
-    "PREFER_DATES_FROM": "future",
-    "RETURN_AS_TIMEZONE_AWARE": False,
-}
 TIMEOUT = 25
+DETAILS = ExtractCache(__name__)
 
 
-def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
-    if not value:
-        return None
-    return dateparser.parse(value, languages=["nb", "en"], settings=SETTINGS)
-
-
-def _extract_datetime(node: Tag) -> Optional[datetime]:
-    for candidate in [node] + list(node.parents)[:3]:
-        if candidate is None or not isinstance(candidate, Tag):
-            continue
+def _download(url: str) -> Tuple[Optional[str], Optional[int]]:
+    try:
+        resp = http_get(url, headers=HEADERS, timeout=TIMEOUT, allow_redirects=True)
+    except Exception:
+        return None, None
+    return resp.text, resp.status_code
 
-        for time_tag in candidate.find_all("time"):
-            stamp = time_tag.get("datetime") or time_tag.get("content")
-            dt = _parse_datetime(stamp) or _parse_datetime(time_tag.get_text(" ", strip=True))
-            if dt:
-                return dt
 
-        text = " ".join(candidate.stripped_strings)
-        dt = _parse_datetime(text)
-        if dt:
-            return dt
-    return None
+def _parse_page(page: Tuple[Optional[str], Optional[int]]) -> Tuple[Optional[BeautifulSoup], Optional[int]]:
+    text, status = page
+    return parse_html(text, parse_only=LISTING), status
 
 
 def _fetch_page(url: str) -> Tuple[Optional[BeautifulSoup], Optional[int]]:
-    try:
-        resp = http_get(url, headers=HEADERS, timeout=TIMEOUT, allow_redirects=True)
-    except Exception:
-        return None, None
+    return _parse_page(_download(url))
 
-    status = resp.status_code
-    soup = BeautifulSoup(resp.text, "html.parser") if resp.text else None
-    return soup, status
 
+def _is_event_url(url: str) -> bool:
+    return url.startswith("https://www.bergenkjott.org") and bool(EVENT_PATH_PATTERN.search(url.split('?')[0]))
 
-def _detail_datetime(url: str, soup: Optional[BeautifulSoup] = None) -> Optional[datetime]:
-    if soup is None:
-        soup, status = _fetch_page(url)
-        if status and status >= 400:
-            return None
-    if not soup:
-        return None
 
-    for selector in ("time", "meta[itemprop='startDate']", "meta[property='event:start_time']"):
-        for tag in soup.select(selector):
-            stamp = tag.get("datetime") or tag.get("content")
-            dt = _parse_datetime(stamp) or _parse_datetime(tag.get_text(" ", strip=True))
-            if dt:
-                return dt
+def _is_event_title(title: str) -> bool:
+    return not any(keyword in title.strip().lower() for keyword in SKIP_TITLES)
 
-    text = " ".join(soup.stripped_strings)
-    return _parse_datetime(text)
+
+def _detail_fields(detail: BeautifulSoup) -> dict:
+    return {"starts_at": locate_datetime(detail)}
 
 
 def fetch() -> list[dict]:
@@ -102,79 +78,63 @@ def fetch() -> list[dict]:
     if not soup:
         return []
 
+    structured = structured_events(
+        soup,
+        PROGRAM_URL,
+        source="Bergen Kjøtt",
+        venue="Bergen Kjøtt",
+        tags=["culture"],
+        accept=_is_event_url,
+        accept_title=_is_event_title,
+    )
+    if structured:
+        return structured
+
     events: list[dict] = []
     seen: set[Tuple[str, str]] = set()
 
+    candidates: list[Tuple[Tag, str, str]] = []
     for link in soup.select("a[href]"):
         href = link.get("href")
         if not href:
             continue
         absolute_url = urljoin(PROGRAM_URL, href)
-        if not absolute_url.startswith("https://www.bergenkjott.org"):
-            continue
-
-        url_path = absolute_url.split('?')[0]
-        if not EVENT_PATH_PATTERN.search(url_path):
+        if not _is_event_url(absolute_url):
             continue
 
         title = link.get_text(" ", strip=True)
-        if not title:
-            continue
-
-        if any(keyword in title.strip().lower() for keyword in SKIP_TITLES):
+        if not title or not _is_event_title(title):
             continue
 
         key = (title, absolute_url)
         if key in seen:
             continue
         seen.add(key)
-
-        detail_soup, url_status = _fetch_page(absolute_url)
-
-        starts_at = _extract_datetime(link)
+        candidates.append((link, title, absolute_url))
+
+    # Only cards without a date of their own need their detail page.
+    card_dates = [locate_datetime(link) for link, _, _ in candidates]
+    details = Prefetcher(_download).schedule(
+        url for (_, _, url), starts_at in zip(candidates, card_dates) if not starts_at
+    )
+    for (_, title, absolute_url), starts_at in zip(candidates, card_dates):
+        extra = {"where": "Bergen Kjøtt"}
         if not starts_at:
-            starts_at = _detail_datetime(absolute_url, detail_soup)
+            text, url_status = details.get(absolute_url)
+            starts_at = (DETAILS.extract(absolute_url, text, _detail_fields) or {}).get("starts_at")
+            # The front end prefers the source whose link answered 200 when events merge.
+            if url_status is not None:
+                extra["url_status"] = url_status
 
-        extra = {"where": "Bergen Kjøtt"}
         label = to_weekday_label(starts_at)
         if label:
             extra["when"] = label
 
-        if url_status is not None:
-            extra["url_status"] = url_status
-        ticket_url: Optional[str] = None
-        if url_status and url_status >= 400:
-            # Look for TicketCo alternatives near the listing or within the detail page
-            neighbours = []
-            parent = link.parent if isinstance(link.parent, Tag) else None
-            if parent:
-                neighbours.extend(parent.select("a[href]"))
-            if detail_soup:
-                neighbours.extend(detail_soup.select("a[href]"))
-
-            for candidate in neighbours:
-                href = candidate.get("href")
-                if not href or "ticketco" not in href.lower():
-                    continue
-                ticket_url = urljoin(absolute_url, href)
-                break
-
-        if ticket_url:
-            extra["ticket_url"] = ticket_url
-            final_url = ticket_url
-        elif url_status and url_status >= 400:
-            final_url = PROGRAM_URL
-        else:
-            final_url = absolute_url
-
-        if url_status and url_status >= 400:
-            extra["url_original"] = absolute_url
-
         events.append(
             build_event(
                 source="Bergen Kjøtt",
                 title=title,
-                url=final_url,
+                url=absolute_url,
                 starts_at=starts_at,
                 venue="Bergen Kjøtt",
                 tags=["culture"],
@@ -2,16 +2,18 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Iterable, Optional, Tuple
+from typing import Optional, Tuple
 from urllib.parse import urljoin
 import re
 
-import dateparser
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup
 
-from scraper.normalize import build_event, to_weekday_label
+from scraper.extract_cache import ExtractCache
+from scraper.html import parse_html, segment_cards
 from scraper.http import get as http_get
+from scraper.locate import locate_datetime
+from scraper.normalize import build_event, to_weekday_label
+from scraper.structured import structured_events
 
 EVENT_URLS = [
     "https://www.kunsthall.no/en/events/",
@@ -63,37 +65,8 @@ HEADERS = {
     "User-Agent": "SpontisBot/0.2 (+https://spontis-app.github.io)",
     "Accept-Language": "nb,en;q=0.8",
 }
-SETTINGS = {
-    "TIMEZONE": "Europe/Oslo",
-    "DATE_ORDER": "DMY",
-    "PREFER_DATES_FROM": "future",
-    "RETURN_AS_TIMEZONE_AWARE": False,
-}
 TIMEOUT = 25
-
-
-def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
-    if not value:
-        return None
-    return dateparser.parse(value, languages=["nb", "en"], settings=SETTINGS)
-
-
-def _extract_datetime(node: Tag) -> Optional[datetime]:
-    for candidate in [node] + list(node.parents)[:3]:
-        if candidate is None or not isinstance(candidate, Tag):
-            continue
-
-        for time_tag in candidate.find_all("time"):
-            stamp = time_tag.get("datetime") or time_tag.get("content")
-            dt = _parse_datetime(stamp) or _parse_datetime(time_tag.get_text(" ", strip=True))
-            if dt:
-                return dt
-
-        text = " ".join(candidate.stripped_strings)
-        dt = _parse_datetime(text)
-        if dt:
-            return dt
-    return None
+DETAILS = ExtractCache(__name__)
 
 
 def _extract_time_hint(text: str) -> Optional[Tuple[int, int]]:
@@ -108,35 +81,44 @@ def _extract_time_hint(text: str) -> Optional[Tuple[int, int]]:
     return None
 
 
-def _fetch(url: str) -> Optional[BeautifulSoup]:
+def _fetch_text(url: str) -> Optional[str]:
     try:
         resp = http_get(url, headers=HEADERS, timeout=TIMEOUT)
     except Exception:
         return None
-    return BeautifulSoup(resp.text, "html.parser")
+    return resp.text
 
 
-def _detail_datetime(url: str) -> Optional[datetime]:
-    soup = _fetch(url)
-    if not soup:
-        return None
+def _fetch(url: str) -> Optional[BeautifulSoup]:
+    return parse_html(_fetch_text(url))
 
-    for selector in ("time", "meta[itemprop='startDate']", "meta[property='event:start_time']"):
-        for tag in soup.select(selector):
-            stamp = tag.get("datetime") or tag.get("content")
-            dt = _parse_datetime(stamp) or _parse_datetime(tag.get_text(" ", strip=True))
-            if dt:
-                return dt
 
-    text = " ".join(soup.stripped_strings)
-    return _parse_datetime(text)
+def _detail_fields(soup: BeautifulSoup) -> dict:
+    return {
+        "starts_at": locate_datetime(soup),
+        "time_hint": _extract_time_hint(soup.get_text(" ", strip=True)),
+    }
 
 
-def _iter_cards(soup: BeautifulSoup) -> Iterable[Tag]:
-    for selector in ("article", "li", "div"):
-        for node in soup.select(selector):
-            if node.find("a"):
-                yield node
+def _detail(url: str) -> dict:
+    return DETAILS.extract(url, _fetch_text(url), _detail_fields) or {}
+
+
+def _is_event_url(url: str) -> bool:
+    return (
+        url.startswith("https://www.kunsthall.no")
+        and bool(EVENT_PATH_PATTERN.search(url.split('?')[0]))
+        and not any(part in url for part in SKIP_HREF_PARTS)
+    )
+
+
+def _is_event_title(title: str) -> bool:
+    title_lower = title.strip().lower()
+    return not any(keyword in title_lower for keyword in SKIP_TITLES)
+
+
+def _venue(text: str) -> str:
+    return "Landmark" if "Landmark" in text else "Bergen Kunsthall"
 
 
 def fetch() -> list[dict]:
@@ -148,27 +130,32 @@ def fetch() -> list[dict]:
         if not soup:
             continue
 
-        for card in _iter_cards(soup):
-            link = card.find("a", href=True)
-            if not link:
-                continue
+        structured = structured_events(
+            soup,
+            url,
+            source="Bergen Kunsthall",
+            venue="Bergen Kunsthall",
+            tags=["culture"],
+            accept=_is_event_url,
+            accept_title=_is_event_title,
+            fields=lambda item: {"venue": _venue(f"{item.name} {item.venue or ''}")},
+        )
+        if structured:
+            for event in structured:
+                key = (event["title"], event["url"])
+                if key not in seen:
+                    seen.add(key)
+                    events.append(event)
+            continue
+
+        for card, link in segment_cards(soup):
             href = link.get("href")
             absolute_url = urljoin(url, href)
-            if not absolute_url.startswith("https://www.kunsthall.no"):
-                continue
-
-            url_path = absolute_url.split('?')[0]
-            if not EVENT_PATH_PATTERN.search(url_path):
+            if not _is_event_url(absolute_url):
                 continue
 
             title = link.get_text(" ", strip=True)
-            if not title:
-                continue
-
-            title_lower = title.strip().lower()
-            if any(keyword in title_lower for keyword in SKIP_TITLES):
-                continue
-            if any(part in absolute_url for part in SKIP_HREF_PARTS):
+            if not title or not _is_event_title(title):
                 continue
 
             key = (title, absolute_url)
@@ -176,27 +163,26 @@ def fetch() -> list[dict]:
                 continue
             seen.add(key)
 
-            detail_soup: Optional[BeautifulSoup] = None
-            starts_at = _extract_datetime(card)
+            detail: Optional[dict] = None
+            starts_at = locate_datetime(card)
             if not starts_at:
-                detail_soup = _fetch(absolute_url)
-                if detail_soup:
-                    starts_at = _extract_datetime(detail_soup)
+                detail = _detail(absolute_url)
+                starts_at = detail.get("starts_at")
             if not starts_at:
                 continue
             text_block = " ".join(card.stripped_strings)
             time_hint = _extract_time_hint(text_block)
             if starts_at and (starts_at.hour == 0 and starts_at.minute == 0):
                 if not time_hint:
-                    if detail_soup is None:
-                        detail_soup = _fetch(absolute_url)
-                    if detail_soup:
-                        time_hint = _extract_time_hint(detail_soup.get_text(" ", strip=True))
+                    if detail is None:
+                        detail = _detail(absolute_url)
+                    if detail.get("time_hint"):
+                        time_hint = tuple(detail["time_hint"])
                 if time_hint:
                     hour, minute = time_hint
                     starts_at = starts_at.replace(hour=hour, minute=minute)
 
-            venue = "Landmark" if "Landmark" in text_block else "Bergen Kunsthall"
+            venue = _venue(text_block)
 
             extra = {"where": venue}
             label = to_weekday_label(starts_at)
@@ -2,30 +2,10 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Optional, Tuple
-from urllib.parse import urljoin
-import re
-
-import dateparser
-import requests
-from bs4 import BeautifulSoup, Tag
-
-from scraper.normalize import build_event, to_weekday_label
+from scraper.http import get as http_get
+from scraper.program import VenueProgram, run_program
 
 PROGRAM_URL = "https://harmonien.no/program"
-HEADERS = {
-    "User-Agent": "SpontisBot/0.3 (+https://spontis-app.github.io)",
-    "Accept-Language": "nb,en;q=0.8",
-}
-SETTINGS = {
-    "TIMEZONE": "Europe/Oslo",
-    "DATE_ORDER": "DMY",
-    "PREFER_DATES_FROM": "future",
-    "RETURN_AS_TIMEZONE_AWARE": False,
-}
-TIMEOUT = 25
-EVENT_PATH_PATTERN = re.compile(r"/program/[^/]+/?$")
 SKIP_TITLES = (
     'åpenhetsloven',
     'årsberetninger',
@@ -41,110 +21,21 @@ SKIP_TITLES = (
     'om-harmonien',
 )
 
-
-def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
-    if not value:
-        return None
-    return dateparser.parse(value, languages=["nb", "en"], settings=SETTINGS)
-
-
-def _extract_datetime(node: Tag) -> Optional[datetime]:
-    lineage = [node] + list(node.parents)[:3]
-    for candidate in lineage:
-        if not isinstance(candidate, Tag):
-            continue
-        for time_tag in candidate.find_all("time"):
-            stamp = time_tag.get("datetime") or time_tag.get("content")
-            dt = _parse_datetime(stamp) or _parse_datetime(time_tag.get_text(" ", strip=True))
-            if dt:
-                return dt
-        text = " ".join(candidate.get_text(" ", strip=True).split())
-        dt = _parse_datetime(text)
-        if dt:
-            return dt
-    return None
-
-
-def _fetch_html(url: str) -> Optional[BeautifulSoup]:
-    try:
-        resp = requests.get(url, headers=HEADERS, timeout=TIMEOUT)
-        resp.raise_for_status()
-    except Exception:
-        return None
-    return BeautifulSoup(resp.text, "html.parser")
+PROGRAM = VenueProgram(
+    module=__name__,
+    source="Bergen Filharmoniske Orkester",
+    program_url=PROGRAM_URL,
+    url_prefix="https://harmonien.no",
+    venue="Grieghallen",
+    tags=("culture", "live"),
+    cards="article, li, div.event",
+    href_pattern=r"/program/[^/]+/?$",
+    skip_titles=SKIP_TITLES,
+    venue_selector=".event-meta, .event-details, .event-info",
+    venue_keywords=("grieghallen", "bergen domkirke", "logen"),
+    require_date=False,
+)
 
 
 def fetch() -> list[dict]:
-    soup = _fetch_html(PROGRAM_URL)
-    if not soup:
-        return []
-
-    events: list[dict] = []
-    seen: set[Tuple[str, str]] = set()
-
-    for card in soup.select("article, li, div.event"):
-        link = card.find("a", href=True)
-        if not link:
-            continue
-        href = link.get("href")
-        absolute_url = urljoin(PROGRAM_URL, href)
-        if not absolute_url.startswith("https://harmonien.no"):
-            continue
-
-        url_path = absolute_url.split('?')[0]
-        if not EVENT_PATH_PATTERN.search(url_path):
-            continue
-
-        title = link.get_text(" ", strip=True)
-        if not title:
-            continue
-
-        if any(keyword in title.strip().lower() for keyword in SKIP_TITLES):
-            continue
-
-        key = (title, absolute_url)
-        if key in seen:
-            continue
-        seen.add(key)
-
-        detail = _fetch_html(absolute_url)
-        starts_at = _extract_datetime(card)
-        if not starts_at and detail:
-            starts_at = _extract_datetime(detail)
-
-        venue = "Grieghallen"
-        description = None
-        if detail:
-            for meta in detail.select(".event-meta, .event-details, .event-info"):
-                text = meta.get_text(" ", strip=True)
-                if text and any(keyword in text.lower() for keyword in ("grieghallen", "bergen domkirke", "logen")):
-                    venue = text
-                    break
-            for paragraph in detail.select(".event-description p, .content p"):
-                text = paragraph.get_text(" ", strip=True)
-                if text:
-                    description = text
-                    break
-
-        extra = {"where": venue}
-        label = to_weekday_label(starts_at)
-        if label:
-            extra["when"] = label
-        if description:
-            extra["description"] = description
-
-        tags = ["culture", "live"]
-
-        events.append(
-            build_event(
-                source="Bergen Filharmoniske Orkester",
-                title=title,
-                url=absolute_url,
-                starts_at=starts_at,
-                venue=venue,
-                tags=tags,
-                extra=extra,
-            )
-        )
-
-    return events
+    return run_program(PROGRAM, http_get)
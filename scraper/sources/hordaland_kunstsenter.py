@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-from datetime import datetime
 from typing import Iterable, Optional, Tuple
 from urllib.parse import urljoin
 
-import dateparser
-import requests
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup
 
+from scraper.extract_cache import ExtractCache
+from scraper.html import make_soup, segment_cards
+from scraper.http import get as http_get
+from scraper.locate import locate_datetime
 from scraper.normalize import build_event, to_weekday_label
+from scraper.structured import structured_events
 
 BASE_URL = "https://kunstsenter.no"
 CANDIDATE_PATHS: Iterable[str] = (
@@ -24,64 +26,48 @@ HEADERS = {
     "User-Agent": "SpontisBot/0.3 (+https://spontis-app.github.io)",
     "Accept-Language": "nb,en;q=0.8",
 }
-SETTINGS = {
-    "TIMEZONE": "Europe/Oslo",
-    "DATE_ORDER": "DMY",
-    "PREFER_DATES_FROM": "future",
-    "RETURN_AS_TIMEZONE_AWARE": False,
-}
 TIMEOUT = 25
-
-
-def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
-    if not value:
-        return None
-    return dateparser.parse(value, languages=["nb", "en"], settings=SETTINGS)
+DETAILS = ExtractCache(__name__)
 
 
 def _discover_program_page() -> Optional[Tuple[str, BeautifulSoup]]:
     for path in CANDIDATE_PATHS:
         url = urljoin(BASE_URL, path)
         try:
-            response = requests.get(url, headers=HEADERS, timeout=TIMEOUT)
-            response.raise_for_status()
+            response = http_get(url, headers=HEADERS, timeout=TIMEOUT)
         except Exception:
             continue
-        soup = BeautifulSoup(response.text, "html.parser")
+        soup = make_soup(response.text)
         if soup.find("a", href=True):
             return url, soup
     try:
-        response = requests.get(BASE_URL, headers=HEADERS, timeout=TIMEOUT)
-        response.raise_for_status()
+        response = http_get(BASE_URL, headers=HEADERS, timeout=TIMEOUT)
     except Exception:
         return None
-    return BASE_URL, BeautifulSoup(response.text, "html.parser")
+    return BASE_URL, make_soup(response.text)
 
 
-def _extract_datetime(node: Tag) -> Optional[datetime]:
-    lineage = [node] + list(node.parents)[:4]
-    for candidate in lineage:
-        if not isinstance(candidate, Tag):
-            continue
-        for time_tag in candidate.find_all("time"):
-            stamp = time_tag.get("datetime") or time_tag.get("content")
-            dt = _parse_datetime(stamp) or _parse_datetime(time_tag.get_text(" ", strip=True))
-            if dt:
-                return dt
-        text = " ".join(candidate.get_text(" ", strip=True).split())
-        dt = _parse_datetime(text)
-        if dt:
-            return dt
-    return None
-
-
-def _fetch_detail(url: str) -> Optional[BeautifulSoup]:
+def _fetch_text(url: str) -> Optional[str]:
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=TIMEOUT)
-        resp.raise_for_status()
+        resp = http_get(url, headers=HEADERS, timeout=TIMEOUT)
     except Exception:
         return None
-    return BeautifulSoup(resp.text, "html.parser")
+    return resp.text
+
+
+def _detail_fields(detail: BeautifulSoup) -> dict:
+    venue = None
+    description = None
+    for paragraph in detail.select(".event-description p, .content p, .rich-text p"):
+        description = paragraph.get_text(" ", strip=True)
+        if description:
+            break
+    for meta in detail.select(".event-meta, .event-details, .meta"):
+        text = meta.get_text(" ", strip=True)
+        if text and any(word in text.lower() for word in ("kunstnersenter", "kunstcenter", "strandgaten")):
+            venue = text
+            break
+    return {"starts_at": locate_datetime(detail, depth=4), "description": description, "venue": venue}
 
 
 def fetch() -> list[dict]:
@@ -90,13 +76,21 @@ def fetch() -> list[dict]:
         return []
     base_url, soup = discovered
 
+    structured = structured_events(
+        soup,
+        base_url,
+        source="Hordaland Kunstsenter",
+        venue="Hordaland Kunstsenter",
+        tags=["culture"],
+        accept=lambda url: url.startswith(BASE_URL),
+    )
+    if structured:
+        return structured
+
     events: list[dict] = []
     seen: set[Tuple[str, str]] = set()
 
-    for card in soup.select("article, li, div"):
-        link = card.find("a", href=True)
-        if not link:
-            continue
+    for card, link in segment_cards(soup):
         href = link.get("href")
         absolute_url = urljoin(base_url, href)
         if not absolute_url.startswith(BASE_URL):
@@ -111,23 +105,13 @@ def fetch() -> list[dict]:
             continue
         seen.add(key)
 
-        detail = _fetch_detail(absolute_url)
-        starts_at = _extract_datetime(card)
-        if not starts_at and detail:
-            starts_at = _extract_datetime(detail)
-
-        venue = "Hordaland Kunstsenter"
-        description = None
-        if detail:
-            for paragraph in detail.select(".event-description p, .content p, .rich-text p"):
-                description = paragraph.get_text(" ", strip=True)
-                if description:
-                    break
-            for meta in detail.select(".event-meta, .event-details, .meta"):
-                text = meta.get_text(" ", strip=True)
-                if text and any(word in text.lower() for word in ("kunstnersenter", "kunstcenter", "strandgaten")):
-                    venue = text
-                    break
+        detail = DETAILS.extract(absolute_url, _fetch_text(absolute_url), _detail_fields) or {}
+        starts_at = locate_datetime(card, depth=4)
+        if not starts_at:
+            starts_at = detail.get("starts_at")
+
+        venue = detail.get("venue") or "Hordaland Kunstsenter"
+        description = detail.get("description")
 
         extra = {"where": venue}
         label = to_weekday_label(starts_at)
@@ -3,35 +3,20 @@
 from __future__ import annotations
 
 import re
-from datetime import datetime
 from typing import List, Optional
 
-import dateparser
-
-from scraper.normalize import build_event, to_weekday_label
 from scraper.http import get as http_get
+from scraper.normalize import build_event, parse_datetime, to_weekday_label
 
 PROFILE_URL = "https://www.instagram.com/kennelvinylbar/"
 HEADERS = {
     "User-Agent": "SpontisBot/0.2 (+https://spontis-app.github.io)",
     "Accept-Language": "en,nb;q=0.8",
 }
-SETTINGS = {
-    "TIMEZONE": "Europe/Oslo",
-    "DATE_ORDER": "DMY",
-    "PREFER_DATES_FROM": "future",
-    "RETURN_AS_TIMEZONE_AWARE": False,
-}
 TIMEOUT = 20
 DATE_PATTERN = re.compile(r"(\d{1,2}[.\-/]\d{1,2}[.\-/]\d{2,4})")
 
 
-def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
-    if not value:
-        return None
-    return dateparser.parse(value, languages=["nb", "en"], settings=SETTINGS)
-
-
 def _fetch_profile_html() -> Optional[str]:
     try:
         resp = http_get(PROFILE_URL, headers=HEADERS, timeout=TIMEOUT)
@@ -47,7 +32,7 @@ def _extract_events_from_text(text: str, limit: int = 10) -> List[dict]:
         window_end = min(len(text), match.end() + 160)
         snippet = text[window_start:window_end]
 
-        dt = _parse_datetime(match.group(1))
+        dt = parse_datetime(match.group(1))
         if not dt:
             continue
 
@@ -2,127 +2,26 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Optional, Tuple
-from urllib.parse import urljoin
-
-import dateparser
-import requests
-from bs4 import BeautifulSoup, Tag
-
-from scraper.normalize import build_event, to_weekday_label
+from scraper.http import get as http_get
+from scraper.program import TagRule, VenueProgram, run_program
 
 PROGRAM_URL = "https://www.kulturhusetibergen.no/program"
-HEADERS = {
-    "User-Agent": "SpontisBot/0.3 (+https://spontis-app.github.io)",
-    "Accept-Language": "nb,en;q=0.8",
-}
-SETTINGS = {
-    "TIMEZONE": "Europe/Oslo",
-    "DATE_ORDER": "DMY",
-    "PREFER_DATES_FROM": "future",
-    "RETURN_AS_TIMEZONE_AWARE": False,
-}
-TIMEOUT = 25
-
-
-def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
-    if not value:
-        return None
-    return dateparser.parse(value, languages=["nb", "en"], settings=SETTINGS)
-
 
-def _extract_datetime(node: Tag) -> Optional[datetime]:
-    for candidate in [node] + list(node.parents)[:3]:
-        if not isinstance(candidate, Tag):
-            continue
-        for time_tag in candidate.find_all("time"):
-            stamp = time_tag.get("datetime") or time_tag.get("content")
-            dt = _parse_datetime(stamp) or _parse_datetime(time_tag.get_text(" ", strip=True))
-            if dt:
-                return dt
-        text = " ".join(candidate.stripped_strings)
-        dt = _parse_datetime(text)
-        if dt:
-            return dt
-    return None
-
-
-def _fetch_html(url: str) -> Optional[BeautifulSoup]:
-    try:
-        resp = requests.get(url, headers=HEADERS, timeout=TIMEOUT)
-        resp.raise_for_status()
-    except Exception:
-        return None
-    return BeautifulSoup(resp.text, "html.parser")
+PROGRAM = VenueProgram(
+    module=__name__,
+    source="Kulturhuset i Bergen",
+    program_url=PROGRAM_URL,
+    url_prefix="https://www.kulturhusetibergen.no",
+    venue="Kulturhuset i Bergen",
+    tags=("culture",),
+    cards="article, li, div.program-card",
+    tag_rules=(
+        TagRule("dj", ("dj", "club", "klubb", "electro", "techno")),
+        TagRule("live", ("konsert", "concert", "live")),
+    ),
+    description_selector=".event-content p, .event-description p, .content p",
+)
 
 
 def fetch() -> list[dict]:
-    soup = _fetch_html(PROGRAM_URL)
-    if not soup:
-        return []
-
-    events: list[dict] = []
-    seen: set[Tuple[str, str]] = set()
-
-    for card in soup.select("article, li, div.program-card"):
-        link = card.find("a", href=True)
-        if not link:
-            continue
-        href = link.get("href")
-        absolute_url = urljoin(PROGRAM_URL, href)
-        if not absolute_url.startswith("https://www.kulturhusetibergen.no"):
-            continue
-
-        title = link.get_text(" ", strip=True)
-        if not title:
-            continue
-
-        key = (title, absolute_url)
-        if key in seen:
-            continue
-        seen.add(key)
-
-        detail = _fetch_html(absolute_url)
-        starts_at = _extract_datetime(card)
-        if not starts_at and detail:
-            starts_at = _extract_datetime(detail)
-        if not starts_at:
-            continue
-
-        extra = {"where": "Kulturhuset i Bergen"}
-        label = to_weekday_label(starts_at)
-        if label:
-            extra["when"] = label
-
-        description = None
-        if detail:
-            for paragraph in detail.select(".event-content p, .event-description p, .content p"):
-                description = paragraph.get_text(" ", strip=True)
-                if description:
-                    break
-
-        tags = ["culture"]
-        teaser_text = card.get_text(" ", strip=True).lower()
-        if any(keyword in teaser_text for keyword in ("dj", "club", "klubb", "electro", "techno")):
-            tags.append("dj")
-        if any(keyword in teaser_text for keyword in ("konsert", "concert", "live")):
-            tags.append("live")
-
-        payload_extra = dict(extra)
-        if description:
-            payload_extra["description"] = description
-
-        events.append(
-            build_event(
-                source="Kulturhuset i Bergen",
-                title=title,
-                url=absolute_url,
-                starts_at=starts_at,
-                venue="Kulturhuset i Bergen",
-                tags=tags,
-                extra=payload_extra,
-            )
-        )
-
-    return events
+    return run_program(PROGRAM, http_get)
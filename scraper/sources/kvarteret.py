@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from scraper.sources.ticketco import fetch_events
+from scraper.sources.ticketco import fetch_events, fetch_events_async
 
 SLUGS = [
     "det-akademiske-kvarter",
@@ -19,3 +19,12 @@ def fetch() -> list[dict]:
         default_venue="Det Akademiske Kvarter",
         default_tags=DEFAULT_TAGS,
     )
+
+
+async def fetch_async() -> list[dict]:
+    return await fetch_events_async(
+        SLUGS,
+        source_name="Det Akademiske Kvarter",
+        default_venue="Det Akademiske Kvarter",
+        default_tags=DEFAULT_TAGS,
+    )
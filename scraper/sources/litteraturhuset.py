@@ -2,118 +2,23 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Optional, Tuple
-from urllib.parse import urljoin
-
-import dateparser
-import requests
-from bs4 import BeautifulSoup, Tag
-
-from scraper.normalize import build_event, to_weekday_label
+from scraper.http import get as http_get
+from scraper.program import VenueProgram, run_program
 
 PROGRAM_URL = "https://www.litteraturhuset.no/program"
-HEADERS = {
-    "User-Agent": "SpontisBot/0.3 (+https://spontis-app.github.io)",
-    "Accept-Language": "nb,en;q=0.8",
-}
-SETTINGS = {
-    "TIMEZONE": "Europe/Oslo",
-    "DATE_ORDER": "DMY",
-    "PREFER_DATES_FROM": "future",
-    "RETURN_AS_TIMEZONE_AWARE": False,
-}
-TIMEOUT = 25
-
-
-def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
-    if not value:
-        return None
-    return dateparser.parse(value, languages=["nb", "en"], settings=SETTINGS)
-
 
-def _extract_datetime(node: Tag) -> Optional[datetime]:
-    for candidate in [node] + list(node.parents)[:3]:
-        if not isinstance(candidate, Tag):
-            continue
-        for time_tag in candidate.find_all("time"):
-            stamp = time_tag.get("datetime") or time_tag.get("content")
-            dt = _parse_datetime(stamp) or _parse_datetime(time_tag.get_text(" ", strip=True))
-            if dt:
-                return dt
-        text = " ".join(candidate.stripped_strings)
-        dt = _parse_datetime(text)
-        if dt:
-            return dt
-    return None
-
-
-def _fetch_html(url: str) -> Optional[BeautifulSoup]:
-    try:
-        resp = requests.get(url, headers=HEADERS, timeout=TIMEOUT)
-        resp.raise_for_status()
-    except Exception:
-        return None
-    return BeautifulSoup(resp.text, "html.parser")
+PROGRAM = VenueProgram(
+    module=__name__,
+    source="Litteraturhuset i Bergen",
+    program_url=PROGRAM_URL,
+    url_prefix="https://www.litteraturhuset.no",
+    venue="Litteraturhuset i Bergen",
+    tags=("lecture",),
+    cards="article, li.event, div.program-card",
+    where="Litteraturhuset",
+    require_date=False,
+)
 
 
 def fetch() -> list[dict]:
-    soup = _fetch_html(PROGRAM_URL)
-    if not soup:
-        return []
-
-    events: list[dict] = []
-    seen: set[Tuple[str, str]] = set()
-
-    for card in soup.select("article, li.event, div.program-card"):
-        link = card.find("a", href=True)
-        if not link:
-            continue
-        href = link.get("href")
-        absolute_url = urljoin(PROGRAM_URL, href)
-        if not absolute_url.startswith("https://www.litteraturhuset.no"):
-            continue
-
-        title = link.get_text(" ", strip=True)
-        if not title:
-            continue
-
-        key = (title, absolute_url)
-        if key in seen:
-            continue
-        seen.add(key)
-
-        detail = _fetch_html(absolute_url)
-        starts_at = _extract_datetime(card)
-        if not starts_at and detail:
-            starts_at = _extract_datetime(detail)
-
-        extra = {"where": "Litteraturhuset"}
-        label = to_weekday_label(starts_at)
-        if label:
-            extra["when"] = label
-
-        description = None
-        if detail:
-            for paragraph in detail.select(".event-description p, .content p"):
-                description = paragraph.get_text(" ", strip=True)
-                if description:
-                    break
-
-        payload_extra = dict(extra)
-        if description:
-            payload_extra["description"] = description
-
-        events.append(
-            build_event(
-                source="Litteraturhuset i Bergen",
-                title=title,
-                url=absolute_url,
-                starts_at=starts_at,
-                venue="Litteraturhuset i Bergen",
-                tags=["lecture"],
-                extra=payload_extra,
-            )
-        )
-
-    return events
+    return run_program(PROGRAM, http_get)
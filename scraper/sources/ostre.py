@@ -2,27 +2,22 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Optional, Tuple
+from typing import Tuple
 from urllib.parse import urljoin
 
-import dateparser
-from bs4 import BeautifulSoup, Tag
-
-from scraper.normalize import TZ, build_event, to_weekday_label
+from scraper.html import ParseOnly, make_soup
 from scraper.http import get as http_get
+from scraper.locate import locate_datetime
+from scraper.normalize import TZ, build_event, to_weekday_label
+from scraper.structured import structured_events
 
 PROGRAM_URL = "https://www.ekko.no/ostre"
+# Cards are plain wrappers, so keep the tree and only drop scripts, styles and icons.
+LISTING = ParseOnly()
 HEADERS = {
     "User-Agent": "SpontisBot/0.2 (+https://spontis-app.github.io)",
     "Accept-Language": "nb,en;q=0.8",
 }
-PARSE_SETTINGS = {
-    "TIMEZONE": "Europe/Oslo",
-    "DATE_ORDER": "DMY",
-    "PREFER_DATES_FROM": "future",
-    "RETURN_AS_TIMEZONE_AWARE": False,
-}
 
 
 def _looks_like_event(href: str) -> bool:
@@ -34,36 +29,20 @@ def _looks_like_event(href: str) -> bool:
     return False
 
 
-def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
-    if not value:
-        return None
-    return dateparser.parse(value, languages=["nb", "en"], settings=PARSE_SETTINGS)
-
-
-def _extract_datetime(node: Tag) -> Optional[datetime]:
-    """Try to locate a datetime for the card by walking ancestors."""
-    for ancestor in [node] + list(node.parents)[:3]:
-        if ancestor is None or not isinstance(ancestor, Tag):
-            continue
-
-        for time_tag in ancestor.find_all("time"):
-            dt = _parse_datetime(time_tag.get("datetime") or time_tag.get("data-start"))
-            if dt:
-                return dt
-            dt = _parse_datetime(time_tag.get_text(" ", strip=True))
-            if dt:
-                return dt
-
-        text = " ".join(ancestor.stripped_strings)
-        dt = _parse_datetime(text)
-        if dt:
-            return dt
-    return None
-
-
 def fetch() -> list[dict]:
     response = http_get(PROGRAM_URL, headers=HEADERS)
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = make_soup(response.text, parse_only=LISTING)
+
+    structured = structured_events(
+        soup,
+        PROGRAM_URL,
+        source="Østre",
+        venue="Østre",
+        tags=["culture"],
+        accept=_looks_like_event,
+    )
+    if structured:
+        return structured
 
     events: list[dict] = []
     seen: set[Tuple[str, str]] = set()
@@ -85,7 +64,7 @@ def fetch() -> list[dict]:
             continue
         seen.add(key)
 
-        starts_at = _extract_datetime(link)
+        starts_at = locate_datetime(link)
         if not starts_at:
             continue
 
@@ -1,10 +1,9 @@
 from datetime import datetime
 
-import dateparser
-from bs4 import BeautifulSoup
-
-from scraper.normalize import TZ, build_event, to_weekday_label
+from scraper.dates import search_event_date
+from scraper.html import make_soup
 from scraper.http import get as http_get
+from scraper.normalize import TZ, build_event, to_weekday_label
 
 HEADERS = {"User-Agent":"SpontisBot/0.1 (+https://spontis-app.github.io)","Accept-Language":"en,nb;q=0.7"}
 BASE = "https://ra.co"
@@ -12,7 +11,7 @@ CITY_URL = f"{BASE}/events/no/bergen"
 
 def fetch() -> list[dict]:
     r = http_get(CITY_URL, headers=HEADERS, timeout=20)
-    soup = BeautifulSoup(r.text, "html.parser")
+    soup = make_soup(r.text)
 
     items = []
     for a in soup.select("a[href^='/events/']"):
@@ -23,7 +22,8 @@ def fetch() -> list[dict]:
         block = a.find_parent()
         text = block.get_text(" ", strip=True) if block else title
 
-        dt = dateparser.parse(text, settings={"TIMEZONE":"Europe/Oslo"})
+        # The block holds the title and venue as well; find the date inside it.
+        dt = search_event_date(text, settings={"TIMEZONE": "Europe/Oslo"})
         if not dt:
             continue
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from collections.abc import Iterable
 from datetime import datetime
@@ -9,9 +10,10 @@ from typing import Iterable as TypingIterable
 from typing import Optional, Sequence
 from urllib.parse import urljoin
 
-import requests
 from dateutil import parser as dateparser
 
+from scraper.http import async_get
+from scraper.http import get as http_get
 from scraper.normalize import build_event
 
 LOGGER = logging.getLogger("spontis.scraper.ticketco")
@@ -94,6 +96,98 @@ def _collect_tags(event: dict, default_tags: Sequence[str]) -> list[str]:
     return tags
 
 
+def _events_from_payload(
+    payload,
+    slug: str,
+    *,
+    source_name: str,
+    default_venue: Optional[str],
+    default_tags: Sequence[str],
+    seen_urls: set[str],
+) -> list[dict]:
+    results: list[dict] = []
+    events = _extract_events(payload)
+    if not events:
+        LOGGER.info("TicketCo returned no events for %s (%s)", source_name, slug)
+        return results
+
+    base_url = f"https://{slug}.ticketco.events/"
+
+    for raw_event in events:
+        title = (raw_event.get("name") or raw_event.get("title") or "").strip()
+        if not title:
+            continue
+
+        event_url = _normalise_url(raw_event, base_url)
+        if event_url:
+            if event_url in seen_urls:
+                continue
+            seen_urls.add(event_url)
+
+        starts_at = _parse_datetime(
+            raw_event.get("start_at")
+            or raw_event.get("start_time")
+            or raw_event.get("start")
+        )
+        ends_at = _parse_datetime(
+            raw_event.get("end_at")
+            or raw_event.get("end_time")
+            or raw_event.get("end")
+        )
+
+        venue = (
+            raw_event.get("venue")
+            or raw_event.get("venue_name")
+            or raw_event.get("location")
+            or default_venue
+        )
+        if isinstance(venue, dict):
+            venue = venue.get("name") or venue.get("title")
+        if venue:
+            venue = str(venue).strip()
+
+        description = (raw_event.get("description") or raw_event.get("summary") or "").strip()
+        price = None
+        if raw_event.get("min_price"):
+            price = f"Fra {raw_event['min_price']} kr"
+
+        tags = _collect_tags(raw_event, default_tags)
+
+        extra = {}
+        if description:
+            extra["description"] = description
+        if raw_event.get("image"):
+            if isinstance(raw_event["image"], dict):
+                image_url = raw_event["image"].get("url") or raw_event["image"].get("main")
+                if image_url:
+                    extra["image"] = image_url
+            elif isinstance(raw_event["image"], str):
+                extra["image"] = raw_event["image"]
+        if price:
+            extra["price"] = price
+        if venue and not extra.get("where"):
+            extra["where"] = venue
+
+        results.append(
+            build_event(
+                source=source_name,
+                title=title,
+                url=event_url or "",
+                starts_at=starts_at,
+                ends_at=ends_at,
+                venue=venue or default_venue,
+                tags=tags,
+                extra=extra or None,
+            )
+        )
+
+    return results
+
+
+def _clean_slugs(slugs: TypingIterable[str]) -> list[str]:
+    return [slug.strip() for slug in slugs if slug and slug.strip()]
+
+
 def fetch_events(
     slugs: TypingIterable[str],
     *,
@@ -108,93 +202,62 @@ def fetch_events(
     seen_urls: set[str] = set()
     default_tags = tuple(default_tags or ())
 
-    for slug in slugs:
-        slug = slug.strip()
-        if not slug:
-            continue
-
+    for slug in _clean_slugs(slugs):
         url = API_TEMPLATE.format(slug=slug)
         try:
-            response = requests.get(url, headers=HEADERS, timeout=timeout)
-            response.raise_for_status()
+            response = http_get(url, headers=HEADERS, timeout=timeout)
         except Exception as exc:
             LOGGER.warning("TicketCo fetch failed for %s (%s): %s", source_name, slug, exc)
             continue
 
-        payload = response.json()
-        events = _extract_events(payload)
-        if not events:
-            LOGGER.info("TicketCo returned no events for %s (%s)", source_name, slug)
-            continue
+        results.extend(
+            _events_from_payload(
+                response.json(),
+                slug,
+                source_name=source_name,
+                default_venue=default_venue,
+                default_tags=default_tags,
+                seen_urls=seen_urls,
+            )
+        )
 
-        base_url = f"https://{slug}.ticketco.events/"
+    return results
 
-        for raw_event in events:
-            title = (raw_event.get("name") or raw_event.get("title") or "").strip()
-            if not title:
-                continue
 
-            event_url = _normalise_url(raw_event, base_url)
-            if event_url:
-                if event_url in seen_urls:
-                    continue
-                seen_urls.add(event_url)
+async def fetch_events_async(
+    slugs: TypingIterable[str],
+    *,
+    source_name: str,
+    default_venue: Optional[str] = None,
+    default_tags: Optional[Sequence[str]] = None,
+    timeout: int = DEFAULT_TIMEOUT,
+) -> list[dict]:
+    """Async variant of :func:`fetch_events` that requests every organiser at once."""
+
+    cleaned = _clean_slugs(slugs)
+    responses = await asyncio.gather(
+        *(async_get(API_TEMPLATE.format(slug=slug), headers=HEADERS, timeout=timeout) for slug in cleaned),
+        return_exceptions=True,
+    )
 
-            starts_at = _parse_datetime(
-                raw_event.get("start_at")
-                or raw_event.get("start_time")
-                or raw_event.get("start")
-            )
-            ends_at = _parse_datetime(
-                raw_event.get("end_at")
-                or raw_event.get("end_time")
-                or raw_event.get("end")
-            )
+    results: list[dict] = []
+    seen_urls: set[str] = set()
+    default_tags = tuple(default_tags or ())
 
-            venue = (
-                raw_event.get("venue")
-                or raw_event.get("venue_name")
-                or raw_event.get("location")
-                or default_venue
-            )
-            if isinstance(venue, dict):
-                venue = venue.get("name") or venue.get("title")
-            if venue:
-                venue = str(venue).strip()
-
-            description = (raw_event.get("description") or raw_event.get("summary") or "").strip()
-            price = None
-            if raw_event.get("min_price"):
-                price = f"Fra {raw_event['min_price']} kr"
-
-            tags = _collect_tags(raw_event, default_tags)
-
-            extra = {}
-            if description:
-                extra["description"] = description
-            if raw_event.get("image"):
-                if isinstance(raw_event["image"], dict):
-                    image_url = raw_event["image"].get("url") or raw_event["image"].get("main")
-                    if image_url:
-                        extra["image"] = image_url
-                elif isinstance(raw_event["image"], str):
-                    extra["image"] = raw_event["image"]
-            if price:
-                extra["price"] = price
-            if venue and not extra.get("where"):
-                extra["where"] = venue
-
-            results.append(
-                build_event(
-                    source=source_name,
-                    title=title,
-                    url=event_url or "",
-                    starts_at=starts_at,
-                    ends_at=ends_at,
-                    venue=venue or default_venue,
-                    tags=tags,
-                    extra=extra or None,
-                )
+    # Responses are consumed in slug order so deduplication matches fetch_events().
+    for slug, response in zip(cleaned, responses):
+        if isinstance(response, BaseException):
+            LOGGER.warning("TicketCo fetch failed for %s (%s): %s", source_name, slug, response)
+            continue
+        results.extend(
+            _events_from_payload(
+                response.json(),
+                slug,
+                source_name=source_name,
+                default_venue=default_venue,
+                default_tags=default_tags,
+                seen_urls=seen_urls,
             )
+        )
 
     return results
@@ -6,78 +6,55 @@ from datetime import datetime
 from typing import Optional, Tuple
 from urllib.parse import urljoin
 
-import dateparser
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup
 
-from scraper.normalize import build_event, to_weekday_label
+from scraper.extract_cache import ExtractCache
+from scraper.html import make_soup
 from scraper.http import get as http_get
+from scraper.locate import locate_datetime
+from scraper.normalize import build_event, to_weekday_label
+from scraper.structured import structured_events
 
 PROGRAM_URL = "https://usf.no/program/"
 HEADERS = {
     "User-Agent": "SpontisBot/0.2 (+https://spontis-app.github.io)",
     "Accept-Language": "nb,en;q=0.8",
 }
-PARSER_SETTINGS = {
-    "TIMEZONE": "Europe/Oslo",
-    "DATE_ORDER": "DMY",
-    "PREFER_DATES_FROM": "future",
-    "RETURN_AS_TIMEZONE_AWARE": False,
-}
 REQUEST_TIMEOUT = 25
+DETAILS = ExtractCache(__name__)
 
 
-def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
-    if not value:
-        return None
-    return dateparser.parse(value, languages=["nb", "en"], settings=PARSER_SETTINGS)
-
-
-def _extract_datetime(node: Tag) -> Optional[datetime]:
-    for candidate in [node] + list(node.parents)[:3]:
-        if candidate is None or not isinstance(candidate, Tag):
-            continue
-
-        for time_tag in candidate.find_all("time"):
-            stamp = time_tag.get("datetime") or time_tag.get("data-start")
-            dt = _parse_datetime(stamp) or _parse_datetime(time_tag.get_text(" ", strip=True))
-            if dt:
-                return dt
-
-        text = " ".join(candidate.stripped_strings)
-        dt = _parse_datetime(text)
-        if dt:
-            return dt
-    return None
-
-
-def _fetch_detail(url: str) -> Optional[BeautifulSoup]:
+def _fetch_text(url: str) -> Optional[str]:
     try:
         resp = http_get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT)
     except Exception:
         return None
-    return BeautifulSoup(resp.text, "html.parser")
+    return resp.text
 
 
-def _detail_datetime(url: str) -> Optional[datetime]:
-    soup = _fetch_detail(url)
-    if not soup:
-        return None
+def _detail_fields(soup: BeautifulSoup) -> dict:
+    return {"starts_at": locate_datetime(soup)}
 
-    for selector in ("time", "[data-start]", "meta[itemprop='startDate']", "meta[property='event:start_time']"):
-        for tag in soup.select(selector):
-            if isinstance(tag, Tag):
-                stamp = tag.get("datetime") or tag.get("content") or tag.get("data-start")
-                dt = _parse_datetime(stamp) or _parse_datetime(tag.get_text(" ", strip=True))
-                if dt:
-                    return dt
 
-    text = " ".join(soup.stripped_strings)
-    return _parse_datetime(text)
+def _detail_datetime(url: str) -> Optional[datetime]:
+    fields = DETAILS.extract(url, _fetch_text(url), _detail_fields)
+    return fields.get("starts_at") if fields else None
 
 
 def fetch() -> list[dict]:
     response = http_get(PROGRAM_URL, headers=HEADERS, timeout=REQUEST_TIMEOUT)
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = make_soup(response.text)
+
+    structured = structured_events(
+        soup,
+        PROGRAM_URL,
+        source="USF Verftet",
+        venue="USF Verftet",
+        tags=["culture"],
+        accept=lambda url: url.startswith("https://usf.no/"),
+    )
+    if structured:
+        return structured
 
     seen: set[Tuple[str, str]] = set()
     events: list[dict] = []
@@ -99,7 +76,7 @@ def fetch() -> list[dict]:
             continue
         seen.add(key)
 
-        starts_at = _extract_datetime(link)
+        starts_at = locate_datetime(link)
         if not starts_at:
             starts_at = _detail_datetime(absolute_url)
         if not starts_at:
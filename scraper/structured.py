@@ -0,0 +1,260 @@
+"""schema.org Event extraction from listing pages.
+
+Many venue sites embed their programme as ``application/ld+json`` Event
+objects or ``itemscope``/``itemprop`` microdata. Reading those is one JSON
+decode (or one pass over a few tagged nodes) per page, instead of heuristic
+card scraping followed by a detail-page fetch and a date parse per event, so
+sources call :func:`structured_events` first and only fall back to their
+card heuristics when a page carries no usable Event data.
+"""
+from __future__ import annotations
+
+import html
+import json
+import logging
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Iterable, Iterator, Mapping, Optional, Sequence
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup, Tag
+
+from scraper.normalize import build_event, parse_datetime, to_weekday_label
+
+LOGGER = logging.getLogger("spontis.scraper.structured")
+
+_LD_JSON = "application/ld+json"
+_EVENT_TYPES = {"Event", "Festival"}
+_MICRODATA_EVENT = re.compile(r"schema\.org/\w*(?:Event|Festival)\b")
+
+
+@dataclass(frozen=True)
+class StructuredEvent:
+    name: str
+    starts_at: Optional[datetime] = None
+    ends_at: Optional[datetime] = None
+    url: Optional[str] = None
+    venue: Optional[str] = None
+    ticket_url: Optional[str] = None
+    price: Optional[str] = None
+    image: Optional[str] = None
+    description: Optional[str] = None
+
+
+def _is_event_type(value: Any) -> bool:
+    types = value if isinstance(value, list) else [value]
+    return any(isinstance(t, str) and (t.rsplit("/", 1)[-1] in _EVENT_TYPES or t.endswith("Event")) for t in types)
+
+
+def _text(value: Any) -> Optional[str]:
+    if isinstance(value, list):
+        value = next((item for item in value if item), None)
+    if isinstance(value, dict):
+        value = value.get("name") or value.get("url") or value.get("@id")
+    if value is None or isinstance(value, (dict, list)):
+        return None
+    cleaned = " ".join(html.unescape(str(value)).split())
+    return cleaned or None
+
+
+def _link(value: Any, base_url: str) -> Optional[str]:
+    if isinstance(value, list):
+        value = next((item for item in value if item), None)
+    if isinstance(value, dict):
+        value = value.get("url") or value.get("contentUrl") or value.get("@id")
+    if not isinstance(value, str) or not value.strip():
+        return None
+    return urljoin(base_url, html.unescape(value.strip()))
+
+
+def _offer(value: Any) -> dict:
+    if isinstance(value, list):
+        value = next((item for item in value if isinstance(item, dict)), None)
+    return value if isinstance(value, dict) else {}
+
+
+def _price(offer: dict) -> Optional[str]:
+    amount = offer.get("price") if offer.get("price") not in (None, "") else offer.get("lowPrice")
+    if amount in (None, ""):
+        return None
+    currency = offer.get("priceCurrency")
+    return f"{amount} {currency}" if currency else str(amount)
+
+
+def _from_json(item: dict, base_url: str) -> Optional[StructuredEvent]:
+    name = _text(item.get("name"))
+    if not name:
+        return None
+    offer = _offer(item.get("offers"))
+    return StructuredEvent(
+        name=name,
+        starts_at=parse_datetime(_text(item.get("startDate"))),
+        ends_at=parse_datetime(_text(item.get("endDate"))),
+        url=_link(item.get("url") or item.get("@id"), base_url),
+        venue=_text(item.get("location")),
+        ticket_url=_link(offer.get("url"), base_url),
+        price=_price(offer),
+        image=_link(item.get("image"), base_url),
+        description=_text(item.get("description")),
+    )
+
+
+def _walk(node: Any) -> Iterator[dict]:
+    """Every Event object in a decoded JSON-LD document, including nested ones."""
+
+    if isinstance(node, list):
+        for item in node:
+            yield from _walk(item)
+        return
+    if not isinstance(node, dict):
+        return
+    if _is_event_type(node.get("@type")):
+        yield node
+        yield from _walk(node.get("subEvent"))
+        return
+    for key in ("@graph", "itemListElement", "item", "mainEntity", "event", "events"):
+        if key in node:
+            yield from _walk(node[key])
+
+
+def _decode(raw: str) -> Any:
+    try:
+        return json.loads(raw)
+    except ValueError:
+        pass
+    try:
+        # CMSes regularly emit raw newlines inside strings.
+        return json.loads(raw, strict=False)
+    except ValueError as exc:
+        LOGGER.debug("Skipping malformed JSON-LD block: %s", exc)
+        return None
+
+
+def _prop(scope: Tag, name: str) -> Optional[Tag]:
+    for tag in scope.find_all(attrs={"itemprop": name}):
+        # Properties of nested items (the location's name …) belong to them.
+        if tag.find_parent(attrs={"itemscope": True}) is scope:
+            return tag
+    return None
+
+
+def _prop_value(tag: Optional[Tag], base_url: str) -> Optional[str]:
+    if tag is None:
+        return None
+    for attr in ("content", "datetime"):
+        if tag.get(attr):
+            return _text(tag[attr])
+    for attr in ("href", "src"):
+        if tag.get(attr):
+            return _link(tag[attr], base_url)
+    if tag.has_attr("itemscope"):
+        return _prop_value(_prop(tag, "name"), base_url) or _prop_value(_prop(tag, "url"), base_url)
+    return _text(tag.get_text(" ", strip=True))
+
+
+def _from_microdata(scope: Tag, base_url: str) -> Optional[StructuredEvent]:
+    name = _prop_value(_prop(scope, "name"), base_url)
+    if not name:
+        return None
+    offers = _prop(scope, "offers")
+    price = _prop_value(_prop(offers, "price"), base_url) if offers is not None else None
+    currency = _prop_value(_prop(offers, "priceCurrency"), base_url) if offers is not None else None
+    return StructuredEvent(
+        name=name,
+        starts_at=parse_datetime(_prop_value(_prop(scope, "startDate"), base_url)),
+        ends_at=parse_datetime(_prop_value(_prop(scope, "endDate"), base_url)),
+        url=_prop_value(_prop(scope, "url"), base_url),
+        venue=_prop_value(_prop(scope, "location"), base_url),
+        ticket_url=_prop_value(_prop(offers, "url"), base_url) if offers is not None else None,
+        price=f"{price} {currency}" if price and currency else price,
+        image=_prop_value(_prop(scope, "image"), base_url),
+        description=_prop_value(_prop(scope, "description"), base_url),
+    )
+
+
+def _is_structured(tag: Tag) -> bool:
+    if tag.name == "script":
+        return (tag.get("type") or "").strip().lower() == _LD_JSON
+    itemtype = tag.get("itemtype")
+    return bool(itemtype and tag.has_attr("itemscope") and _MICRODATA_EVENT.search(str(itemtype)))
+
+
+def extract_events(soup: Optional[BeautifulSoup], base_url: str) -> list[StructuredEvent]:
+    """All schema.org Events on the page, JSON-LD and microdata, in document order."""
+
+    if soup is None:
+        return []
+    events: list[StructuredEvent] = []
+    seen: set[tuple] = set()
+    for tag in soup.find_all(_is_structured):
+        if tag.name == "script":
+            found: Iterable[Optional[StructuredEvent]] = (
+                _from_json(item, base_url) for item in _walk(_decode(tag.string or tag.get_text()))
+            )
+        else:
+            found = (_from_microdata(tag, base_url),)
+        for event in found:
+            if event is None:
+                continue
+            # The same programme is often published both ways.
+            key = (event.name, event.url, event.starts_at)
+            if key not in seen:
+                seen.add(key)
+                events.append(event)
+    return events
+
+
+def structured_events(
+    soup: Optional[BeautifulSoup],
+    base_url: str,
+    *,
+    source: str,
+    venue: str,
+    tags: Sequence[str],
+    accept: Optional[Callable[[str], bool]] = None,
+    accept_title: Optional[Callable[[str], bool]] = None,
+    fields: Optional[Callable[[StructuredEvent], Mapping[str, Any]]] = None,
+) -> list[dict]:
+    """``build_event`` dicts for the dated Events on a listing page.
+
+    Events without a start date, whose URL ``accept`` rejects or whose title
+    ``accept_title`` rejects are dropped (an Event without a URL links to the
+    listing page); an empty result tells the caller to use its card
+    heuristics. ``fields`` lets a source add what its card path adds: a
+    ``venue`` or ``tags`` it returns replace the defaults (``where`` follows
+    the venue), anything else is added to the event.
+    """
+
+    events: list[dict] = []
+    for item in extract_events(soup, base_url):
+        url = item.url or base_url
+        if item.starts_at is None or (accept is not None and not accept(url)):
+            continue
+        if accept_title is not None and not accept_title(item.name):
+            continue
+        overrides = dict(fields(item)) if fields is not None else {}
+        where = overrides.pop("venue", None) or item.venue or venue
+        event_tags = overrides.pop("tags", None) or tags
+        extra = {"where": where}
+        label = to_weekday_label(item.starts_at)
+        if label:
+            extra["when"] = label
+        for field in ("description", "ticket_url", "price", "image"):
+            value = getattr(item, field)
+            if value:
+                extra[field] = value
+        extra.update(overrides)
+        events.append(
+            build_event(
+                source=source,
+                title=item.name,
+                url=url,
+                starts_at=item.starts_at,
+                ends_at=item.ends_at,
+                venue=where,
+                tags=event_tags,
+                extra=extra,
+            )
+        )
+    return events
@@ -0,0 +1,135 @@
+"""Keyword tagging of events in a single pass over their text.
+
+Tag rules live in ``tag_rules.json`` (or the file named by
+``SPONTIS_TAG_RULES``): for each tag a list of whole-word keywords, plus the
+hours that count as late night. :class:`Tagger` compiles every keyword into
+one alternation that maps a hit back to its tags, so an event's title and
+venue are scanned once however many tags there are, and :meth:`Tagger.infer_all`
+scans a whole feed with a single regex call.
+"""
+from __future__ import annotations
+
+import bisect
+import json
+import os
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Mapping, Optional, Sequence, Set, Tuple, Union
+
+RULES_PATH = Path(__file__).with_name("tag_rules.json")
+
+
+@dataclass(frozen=True)
+class TagRules:
+    # tag -> whole-word keywords (matched case-insensitively)
+    keywords: Tuple[Tuple[str, Tuple[str, ...]], ...]
+    night_tag: Optional[str] = "late-night"
+    night_from_hour: int = 22
+    night_until_hour: int = 5
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "TagRules":
+        keywords = tuple((tag, tuple(words)) for tag, words in data.get("keywords", {}).items())
+        night = data.get("late_night") or {}
+        return cls(
+            keywords=keywords,
+            night_tag=night.get("tag"),
+            night_from_hour=int(night.get("from_hour", 22)),
+            night_until_hour=int(night.get("until_hour", 5)),
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "TagRules":
+        with open(path, "r", encoding="utf-8") as handle:
+            return cls.from_dict(json.load(handle))
+
+
+def _tags_by_keyword(rules: TagRules) -> Dict[str, FrozenSet[str]]:
+    tags: Dict[str, Set[str]] = {}
+    for tag, words in rules.keywords:
+        for word in words:
+            tags.setdefault(word.lower(), set()).add(tag)
+    # One scan reports a single keyword per position, the longest. A keyword
+    # that starts with a shorter whole-word keyword ("late night" / "late")
+    # carries the shorter one's tags too, so nothing is lost.
+    for word in tags:
+        for other, other_tags in list(tags.items()):
+            if other != word and re.match(rf"{re.escape(other)}\b", word):
+                tags[word] |= other_tags
+    return {word: frozenset(found) for word, found in tags.items()}
+
+
+class Tagger:
+    def __init__(self, rules: TagRules) -> None:
+        self.rules = rules
+        self._tags = _tags_by_keyword(rules)
+        words = sorted(self._tags, key=len, reverse=True)
+        # A lookahead so overlapping keywords ("after-hours party", "late
+        # night session") are all reported.
+        self._pattern = (
+            re.compile(r"(?=\b(" + "|".join(map(re.escape, words)) + r")\b)", re.IGNORECASE)
+            if words
+            else None
+        )
+
+    def match(self, text: str) -> Set[str]:
+        """Tags whose keywords occur in ``text`` (already lowercased)."""
+
+        found: Set[str] = set()
+        if self._pattern is None or not text:
+            return found
+        for hit in self._pattern.finditer(text):
+            found |= self._tags[hit.group(1)]
+        return found
+
+    def _night(self, starts_at: object) -> bool:
+        if not self.rules.night_tag or not starts_at:
+            return False
+        if isinstance(starts_at, datetime):
+            hour = starts_at.hour
+        else:
+            try:
+                hour = datetime.fromisoformat(str(starts_at)).hour
+            except ValueError:
+                return False
+        return hour >= self.rules.night_from_hour or hour < self.rules.night_until_hour
+
+    def _finish(self, event: Mapping, found: Set[str]) -> Set[str]:
+        tags = set(event.get("tags") or ()) | found
+        if self._night(event.get("starts_at")):
+            tags.add(self.rules.night_tag)  # type: ignore[arg-type]
+        return tags
+
+    @staticmethod
+    def haystack(event: Mapping) -> str:
+        return " ".join(part.lower() for part in (event.get("title"), event.get("venue")) if part)
+
+    def infer(self, event: Mapping) -> Set[str]:
+        """The event's own tags plus the ones its title, venue and start time imply."""
+
+        return self._finish(event, self.match(self.haystack(event)))
+
+    def infer_all(self, events: Sequence[Mapping]) -> List[Set[str]]:
+        """:meth:`infer` for every event, scanning the whole feed at once."""
+
+        haystacks = [self.haystack(event) for event in events]
+        found: List[Set[str]] = [set() for _ in events]
+        if self._pattern is not None and events:
+            # Newlines separate the events and never belong to a keyword.
+            starts: List[int] = []
+            offset = 0
+            for text in haystacks:
+                starts.append(offset)
+                offset += len(text) + 1
+            for hit in self._pattern.finditer("\n".join(haystacks)):
+                position = bisect.bisect_right(starts, hit.start()) - 1
+                found[position] |= self._tags[hit.group(1)]
+        return [self._finish(event, tags) for event, tags in zip(events, found)]
+
+
+@lru_cache(maxsize=None)
+def default_tagger() -> Tagger:
+    return Tagger(TagRules.load(os.getenv("SPONTIS_TAG_RULES") or RULES_PATH))
@@ -49,7 +49,7 @@ def build_report() -> Dict[str, Any]:
     inactive = []
     for entry in stats:
         status = str(entry.get("status", "")).lower()
-        if status in {"error", "fallback", "offline"}:
+        if status in {"error", "timeout", "fallback", "offline"}:
             failing.append({
                 "name": entry.get("name"),
                 "status": status,
@@ -64,6 +64,7 @@ def build_report() -> Dict[str, Any]:
     report["sources"] = {
         "ok": len(grouped.get("ok", [])),
         "error": len(grouped.get("error", [])),
+        "timeout": len(grouped.get("timeout", [])),
         "fallback": len(grouped.get("fallback", [])),
         "offline": len(grouped.get("offline", [])),
         "total": len(stats),
@@ -107,7 +108,7 @@ def main() -> None:
     sources = payload["sources"]
     print("\n== Sources ==")
     print(
-        f"OK:{sources.get('ok', 0)}  Error:{sources.get('error', 0)}  "
+        f"OK:{sources.get('ok', 0)}  Error:{sources.get('error', 0)}  Timeout:{sources.get('timeout', 0)}  "
         f"Fallback:{sources.get('fallback', 0)}  Offline:{sources.get('offline', 0)}"
     )
     if payload.get("failures"):
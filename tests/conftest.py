@@ -0,0 +1,15 @@
+import pytest
+
+from scraper import http
+
+
+@pytest.fixture(autouse=True)
+def isolated_http_cache(tmp_path, monkeypatch):
+    """Keep the on-disk HTTP and extraction caches out of the working tree during tests."""
+    monkeypatch.setenv("SPONTIS_HTTP_CACHE_DIR", str(tmp_path / "http-cache"))
+    monkeypatch.setenv("SPONTIS_EXTRACT_CACHE_DIR", str(tmp_path / "extract-cache"))
+    http.get_cache.cache_clear()
+    http.get_encoding_memory.cache_clear()
+    yield
+    http.get_cache.cache_clear()
+    http.get_encoding_memory.cache_clear()
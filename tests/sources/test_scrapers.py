@@ -1,15 +1,21 @@
-import types
+import ast
+from datetime import datetime
+from pathlib import Path
 
 import pytest
 
 from scraper.sources import (
+    bergen_kino,
     bergen_kjott,
     bergen_kunsthall,
     bergen_philharmonic,
     den_nationale_scene,
     grieghallen,
+    resident_advisor,
 )
 
+SOURCES_DIR = Path(__file__).resolve().parents[2] / "scraper" / "sources"
+
 
 class FakeResponse:
     def __init__(self, text: str, status: int = 200, encoding: str = "utf-8") -> None:
@@ -60,6 +66,74 @@ def test_kunsthall_filters_navigation(monkeypatch, html, detail_url, detail_html
     assert all('/events/' in event['url'] for event in events)
 
 
+def test_bergen_kino_groups_showtimes_per_film_over_the_week(monkeypatch):
+    listing_html = """
+    <a href="/film/dune">Dune 18:00</a>
+    <a href="/film/dune">Dune 21:00</a>
+    <a href="/film/pingu">Pingu</a>
+    """
+    film_html = """
+    <h2>I dag</h2><ul><li>18:00</li><li>21:00</li></ul>
+    <h2>I morgen</h2><ul><li>20:30</li></ul>
+    """
+    requested = []
+
+    def fake_get(url: str, **_kwargs):
+        requested.append(url)
+        if url == bergen_kino.BASE + "/program":
+            return FakeResponse(listing_html)
+        if url.endswith("/film/dune"):
+            return FakeResponse(film_html)
+        return FakeResponse("<p>Ingen visninger</p>")
+
+    monkeypatch.setattr(bergen_kino, "http_get", fake_get)
+    monkeypatch.setattr(bergen_kino, "PROGRAM_DAYS", 7)
+
+    events = bergen_kino.fetch()
+    assert [event["title"] for event in events] == ["Dune"]
+    today = datetime.now(bergen_kino.TZ).date()
+    assert events[0]["starts_at"].startswith(f"{today:%Y-%m-%d}T18:00")
+    # Tomorrow's showing comes from the film page, fetched once.
+    assert events[0]["when"].endswith("20:30")
+    assert sum(url.endswith("/film/dune") for url in requested) == 1
+
+
+def test_bergen_kino_only_switches_day_on_day_headings():
+    from datetime import timedelta
+
+    from scraper.html import parse_html
+
+    today = datetime.now(bergen_kino.TZ).date()
+    page = parse_html("""
+    <h2>I dag</h2><ul><li>18:00</li></ul>
+    <p>Premiere 3.10.2030</p><ul><li>20:30</li></ul>
+    <div class="showtimes-day">I morgen</div><ul><li>21:00</li></ul>
+    """)
+
+    found = bergen_kino._program_days(page, today, 7)
+    assert sorted((moment.date(), f"{moment:%H:%M}") for moment in found) == [
+        (today, "18:00"),
+        (today, "20:30"),
+        (today + timedelta(days=1), "21:00"),
+    ]
+
+
+def test_bergen_kino_ignores_clock_text_outside_the_programme():
+    from scraper.html import parse_html
+
+    today = datetime.now(bergen_kino.TZ).date()
+    page = parse_html("""
+    <header>Billettluke åpner 10:00</header>
+    <p>Lengde 1:52</p>
+    <h2>I dag</h2><ul><li>18:00</li></ul>
+    <h2>Om filmen</h2><p>Spilletid 2:05</p>
+    <footer>Kundeservice 09:00-16:00</footer>
+    """)
+
+    found = bergen_kino._program_days(page, today, 7)
+    assert [f"{moment:%H:%M}" for moment in found] == ["18:00"]
+
+
 def test_bergen_kjott_filters_static_pages(monkeypatch):
     listing_html = """
     <ul>
@@ -85,6 +159,95 @@ def test_bergen_kjott_filters_static_pages(monkeypatch):
 
     events = bergen_kjott.fetch()
     assert [event['title'] for event in events] == ['Performance Lab']
+    assert events[0]['url_status'] == 200
+
+
+def test_bergen_kjott_finds_dates_in_sibling_divs(monkeypatch):
+    listing_html = """
+    <div class="event-card">
+      <div class="title"><a href="/events/performance-lab">Performance Lab</a></div>
+      <div class="date">24.05.2025 20:00</div>
+    </div>
+    """
+    requested = []
+
+    def fake_http_get(url: str, **_kwargs):
+        requested.append(url)
+        if url == bergen_kjott.PROGRAM_URL:
+            return FakeResponse(listing_html)
+        return FakeResponse("", status=404)
+
+    monkeypatch.setattr(bergen_kjott, 'http_get', fake_http_get)
+
+    events = bergen_kjott.fetch()
+    assert [event['title'] for event in events] == ['Performance Lab']
+    assert events[0]['starts_at'].startswith('2025-05-24T20:00')
+    # The card carries the date, so its detail page is never fetched.
+    assert requested == [bergen_kjott.PROGRAM_URL]
+
+
+def test_bergen_kjott_prefers_structured_events(monkeypatch):
+    listing_html = """
+    <script type="application/ld+json">
+    {"@type": "Event", "name": "Performance Lab", "startDate": "2025-05-24T20:00",
+     "url": "https://www.bergenkjott.org/events/performance-lab"}
+    </script>
+    <ul><li><a href="/events/performance-lab">Performance Lab</a></li></ul>
+    """
+    requested = []
+
+    def fake_http_get(url: str, **_kwargs):
+        requested.append(url)
+        if url == bergen_kjott.PROGRAM_URL:
+            return FakeResponse(listing_html)
+        return FakeResponse("", status=404)
+
+    monkeypatch.setattr(bergen_kjott, 'http_get', fake_http_get)
+
+    events = bergen_kjott.fetch()
+    assert [event['title'] for event in events] == ['Performance Lab']
+    assert events[0]['starts_at'].startswith('2025-05-24T20:00')
+    # No detail pages are fetched when the listing carries the dates.
+    assert requested == [bergen_kjott.PROGRAM_URL]
+
+
+def test_bergen_kjott_filters_structured_events_like_cards(monkeypatch):
+    listing_html = """
+    <script type="application/ld+json">
+    [{"@type": "Event", "name": "Performance Lab", "startDate": "2025-05-24T20:00",
+      "url": "https://www.bergenkjott.org/events/performance-lab"},
+     {"@type": "Event", "name": "Bar Nights", "startDate": "2025-05-25T20:00",
+      "url": "https://www.bergenkjott.org/events/bar-nights"},
+     {"@type": "Event", "name": "Studioer", "startDate": "2025-05-26T20:00",
+      "url": "https://www.bergenkjott.org/studioer"}]
+    </script>
+    """
+
+    monkeypatch.setattr(bergen_kjott, 'http_get', lambda url, **_kwargs: FakeResponse(listing_html))
+
+    events = bergen_kjott.fetch()
+    assert [event['title'] for event in events] == ['Performance Lab']
+    assert events[0]['where'] == 'Bergen Kjøtt'
+    assert events[0]['when']
+
+
+def test_resident_advisor_reads_dates_inside_cards(monkeypatch):
+    listing_html = """
+    <ul>
+      <li><a href="/events/2001">Techno Night</a> Sat, 4 Oct 2025 23:00 • Hulen</li>
+      <li><a href="/events/2002">Festival Weekend</a> 7 Oct 2025 - 9 Oct 2025 • Kulturhuset</li>
+      <li><a href="/events/2003">Members</a></li>
+    </ul>
+    """
+
+    monkeypatch.setattr(resident_advisor, 'http_get', lambda url, **_kwargs: FakeResponse(listing_html))
+
+    events = resident_advisor.fetch()
+    assert [(event['title'], event['starts_at'][:16]) for event in events] == [
+        ('Techno Night', '2025-10-04T23:00'),
+        ('Festival Weekend', '2025-10-07T00:00'),
+    ]
+    assert events[0]['venue'] == 'Hulen'
 
 
 def test_grieghallen_filters_navigation(monkeypatch):
@@ -110,7 +273,7 @@ def test_grieghallen_filters_navigation(monkeypatch):
             return FakeResponse(detail_html)
         return FakeResponse("", status=404)
 
-    monkeypatch.setattr(grieghallen, 'requests', types.SimpleNamespace(get=lambda url, **_: fake_get(url)))
+    monkeypatch.setattr(grieghallen, 'http_get', fake_get)
 
     events = grieghallen.fetch()
     assert [event['title'] for event in events] == ['Konsert 1']
@@ -143,7 +306,7 @@ def test_bergen_philharmonic_filters_navigation(monkeypatch):
             return FakeResponse(detail_html)
         return FakeResponse("", status=404)
 
-    monkeypatch.setattr(bergen_philharmonic, 'requests', types.SimpleNamespace(get=lambda url, **_: fake_get(url)))
+    monkeypatch.setattr(bergen_philharmonic, 'http_get', fake_get)
 
     events = bergen_philharmonic.fetch()
     assert [event['title'] for event in events] == ['Mahler 2']
@@ -169,7 +332,20 @@ def test_dns_filters_navigation(monkeypatch):
             return FakeResponse(detail_html)
         return FakeResponse("", status=404)
 
-    monkeypatch.setattr(den_nationale_scene, 'requests', types.SimpleNamespace(get=lambda url, **_: fake_get(url)))
+    monkeypatch.setattr(den_nationale_scene, 'http_get', fake_get)
 
     events = den_nationale_scene.fetch()
     assert [event['title'] for event in events] == ['Dronningen']
+
+
+def test_sources_use_shared_transport():
+    offenders = []
+    for path in sorted(SOURCES_DIR.glob("*.py")):
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import) and any(alias.name == "requests" for alias in node.names):
+                offenders.append(path.name)
+            elif isinstance(node, ast.ImportFrom) and node.module == "requests":
+                if any(alias.name in {"get", "Session", "request"} for alias in node.names):
+                    offenders.append(path.name)
+    assert not offenders, f"fetch through scraper.http instead of requests: {offenders}"
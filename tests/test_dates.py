@@ -0,0 +1,68 @@
+import json
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from scraper.dates import (
+    iter_event_dates,
+    parse_event_date,
+    parse_event_range,
+    search_event_date,
+    track_reference_date,
+)
+from scraper.normalize import DATE_SETTINGS, parse_datetime
+
+CORPUS = json.loads((Path(__file__).parent / "data" / "date_corpus.json").read_text(encoding="utf-8"))
+NOW = datetime.fromisoformat(CORPUS["now"])
+
+
+@pytest.mark.parametrize("case", CORPUS["cases"], ids=lambda case: f"{case['source']}:{case['text']}")
+def test_grammar_matches_corpus(case):
+    span = parse_event_range(case["text"], settings=CORPUS["settings"], now=NOW)
+    if case["start"] is None:
+        assert span is None
+        return
+    assert span is not None
+    start, end = span
+    assert start.isoformat() == case["start"]
+    assert (end.isoformat() if end else None) == case.get("end")
+
+
+def test_grammar_settings():
+    now = datetime(2025, 10, 1, 12)
+    assert parse_event_date("05.06.2025", settings={**DATE_SETTINGS, "DATE_ORDER": "MDY"}, now=now).month == 5
+    # Without a future preference a past day stays in the current year.
+    assert parse_event_date("24. mai", settings={"TIMEZONE": "Europe/Oslo"}, now=now) == datetime(2025, 5, 24)
+    aware = parse_event_date("24. mai 20:00", settings={**DATE_SETTINGS, "RETURN_AS_TIMEZONE_AWARE": True}, now=now)
+    assert aware.tzinfo is not None and aware.hour == 20
+    assert parse_event_date("on", settings=DATE_SETTINGS, now=now) is None
+    assert parse_event_date("31.02.2025", settings=DATE_SETTINGS, now=now) is None
+
+
+def test_search_finds_dates_inside_running_text():
+    now = datetime(2025, 10, 1, 12)
+    text = "Conversation VOLT: Filipa Ramos Tue 7 Oct 19:00, Landmark Visit Us Become a member"
+    assert list(iter_event_dates(text, settings=DATE_SETTINGS, now=now)) == [(datetime(2025, 10, 7, 19, 0), True)]
+    assert search_event_date("Konsert lør 12. okt kl. 21 Billetter 250,-", settings=DATE_SETTINGS, now=now) == datetime(
+        2025, 10, 12, 21, 0
+    )
+    # Opening hours are only a tentative hit.
+    assert list(iter_event_dates("Åpent man–fre 10:00–16:00", settings=DATE_SETTINGS, now=now)) == [
+        (datetime(2025, 10, 3, 10, 0), False)
+    ]
+
+
+def test_tracks_dates_resolved_against_today():
+    for text, relative in (("24. mai", True), ("i morgen kl 20", True), ("19:30", True), ("24.05.2025 20:00", False)):
+        with track_reference_date() as reference:
+            parse_event_date(text, now=NOW)
+        assert reference.used is relative, text
+
+    # Memoized results report the same, and inner blocks count for the outer one.
+    with track_reference_date() as outer:
+        with track_reference_date():
+            parse_datetime("24. mai")
+        with track_reference_date() as again:
+            parse_datetime("24. mai")
+    assert outer.used and again.used
@@ -0,0 +1,46 @@
+from scraper.encoding import EncodingMemory, resolve_encoding
+
+LATIN1_PAGE = "<p>Østre - lørdag</p>".encode("latin-1")
+
+
+def _never():
+    raise AssertionError("full detection should not run")
+
+
+def test_declared_sources_win_without_detection():
+    html = {"Content-Type": "text/html; charset=windows-1252"}
+    assert resolve_encoding(html, LATIN1_PAGE, "a.no", None, _never) == "cp1252"
+
+    meta = b'<html><head><meta charset="iso-8859-1"></head>' + LATIN1_PAGE
+    assert resolve_encoding({"Content-Type": "text/html"}, meta, "a.no", None, _never) == "iso8859-1"
+
+    bom = b"\xef\xbb\xbf" + "Østre".encode("utf-8")
+    assert resolve_encoding({}, bom, "a.no", None, _never) == "utf-8-sig"
+
+    # Latin-1 is the HTTP default label; valid UTF-8 bodies are taken at face value.
+    utf8 = "<p>Østre</p>".encode("utf-8")
+    assert resolve_encoding({"Content-Type": "text/html; charset=ISO-8859-1"}, utf8, "a.no", None, _never) == "utf-8"
+    assert resolve_encoding({"Content-Type": "text/html"}, utf8, "a.no", None, _never) == "utf-8"
+
+
+def test_detected_encoding_is_remembered_per_host(tmp_path):
+    path = tmp_path / "encodings.json"
+    calls = []
+
+    def detect():
+        calls.append(1)
+        return "windows-1252"
+
+    memory = EncodingMemory(path)
+    assert resolve_encoding({"Content-Type": "text/html"}, LATIN1_PAGE, "a.no", memory, detect) == "cp1252"
+    assert resolve_encoding({"Content-Type": "text/html"}, LATIN1_PAGE, "a.no", memory, detect) == "cp1252"
+    assert len(calls) == 1
+
+    # A fresh process picks the host up from disk.
+    warm = EncodingMemory(path)
+    assert resolve_encoding({"Content-Type": "text/html"}, LATIN1_PAGE, "a.no", warm, _never) == "cp1252"
+
+
+def test_mislabelled_utf8_falls_back_to_detection():
+    headers = {"Content-Type": "text/html; charset=utf-8"}
+    assert resolve_encoding(headers, LATIN1_PAGE, "a.no", None, lambda: "ISO-8859-1") == "iso8859-1"
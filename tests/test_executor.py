@@ -0,0 +1,65 @@
+import asyncio
+import time
+
+from scraper.executor import STATUS_ERROR, STATUS_OK, STATUS_TIMEOUT, flatten, run_sources
+
+
+def _sleepy(seconds: float, title: str):
+    def fetch():
+        time.sleep(seconds)
+        return [{"title": title}]
+
+    return fetch
+
+
+def _broken():
+    raise RuntimeError("boom")
+
+
+def test_run_sources_keeps_order_and_reports_status():
+    sources = [
+        ("slow", _sleepy(0.2, "slow")),
+        ("broken", _broken),
+        ("fast", _sleepy(0.0, "fast")),
+        ("hung", _sleepy(5, "hung")),
+    ]
+
+    started = time.monotonic()
+    results = run_sources(sources, workers=4, timeout=0.5)
+    elapsed = time.monotonic() - started
+
+    assert [result.name for result in results] == ["slow", "broken", "fast", "hung"]
+    assert [result.status for result in results] == [STATUS_OK, STATUS_ERROR, STATUS_OK, STATUS_TIMEOUT]
+    assert [event["title"] for event in flatten(results)] == ["slow", "fast"]
+    assert "boom" in results[1].error
+    assert elapsed < 2
+
+
+def test_run_sources_runs_in_parallel():
+    sources = [(f"s{idx}", _sleepy(0.3, f"s{idx}")) for idx in range(6)]
+
+    started = time.monotonic()
+    results = run_sources(sources, workers=6, timeout=5)
+    elapsed = time.monotonic() - started
+
+    assert all(result.status == STATUS_OK for result in results)
+    assert elapsed < 1.0
+
+
+def test_run_sources_mixes_async_sources():
+    async def native():
+        await asyncio.sleep(0.1)
+        return [{"title": "native"}]
+
+    async def stuck():
+        await asyncio.sleep(10)
+        return []
+
+    results = run_sources(
+        [("native", native), ("sync", _sleepy(0.1, "sync")), ("stuck", stuck)],
+        workers=3,
+        timeout=0.5,
+    )
+
+    assert [result.status for result in results] == [STATUS_OK, STATUS_OK, STATUS_TIMEOUT]
+    assert [event["title"] for event in flatten(results)] == ["native", "sync"]
@@ -0,0 +1,116 @@
+from datetime import datetime, timedelta
+
+from scraper import extract_cache
+from scraper.extract_cache import ExtractCache
+from scraper.normalize import TZ, parse_datetime
+
+PAGE = "<article><time datetime='2025-06-01T19:30'></time><p>Konsert</p></article>"
+
+
+def _extractor(calls):
+    def extract(soup):
+        calls.append(1)
+        return {
+            "starts_at": datetime.fromisoformat(soup.find("time")["datetime"]),
+            "description": soup.find("p").get_text(),
+        }
+
+    return extract
+
+
+def test_unchanged_pages_skip_parsing(tmp_path):
+    calls = []
+    cache = ExtractCache("scraper.sources.grieghallen", tmp_path)
+    url = "https://grieghallen.no/arrangement/konsert"
+
+    first = cache.extract(url, PAGE, _extractor(calls))
+    again = ExtractCache("scraper.sources.grieghallen", tmp_path).extract(url, PAGE, _extractor(calls))
+    assert again == first == {"starts_at": datetime(2025, 6, 1, 19, 30), "description": "Konsert"}
+    assert len(calls) == 1
+
+    changed = cache.extract(url, PAGE.replace("Konsert", "Avlyst"), _extractor(calls))
+    assert changed["description"] == "Avlyst"
+    assert len(calls) == 2
+
+    assert cache.extract(url, None, _extractor(calls)) is None
+
+
+def test_module_changes_invalidate_entries(tmp_path, monkeypatch):
+    calls = []
+    cache = ExtractCache("scraper.sources.grieghallen", tmp_path)
+    url = "https://grieghallen.no/arrangement/konsert"
+    cache.extract(url, PAGE, _extractor(calls))
+
+    monkeypatch.setattr(extract_cache, "module_fingerprint", lambda name: "edited")
+    cache.extract(url, PAGE, _extractor(calls))
+    assert len(calls) == 2
+
+
+def test_dependency_changes_invalidate_entries(tmp_path, monkeypatch):
+    calls = []
+    cache = ExtractCache("scraper.sources.grieghallen", tmp_path, depends=("scraper.program",))
+    url = "https://grieghallen.no/arrangement/konsert"
+    cache.extract(url, PAGE, _extractor(calls))
+    cache.extract(url, PAGE, _extractor(calls))
+    assert len(calls) == 1
+
+    original = extract_cache.module_fingerprint
+    monkeypatch.setattr(
+        extract_cache,
+        "module_fingerprint",
+        lambda name: "edited" if name == "scraper.program" else original(name),
+    )
+    cache.extract(url, PAGE, _extractor(calls))
+    assert len(calls) == 2
+
+
+def test_shared_extraction_modules_invalidate_entries(tmp_path, monkeypatch):
+    calls = []
+    cache = ExtractCache("scraper.sources.bergen_kjott", tmp_path)
+    url = "https://www.bergenkjott.org/events/lab"
+    cache.extract(url, PAGE, _extractor(calls))
+
+    original = extract_cache.module_fingerprint
+    monkeypatch.setattr(
+        extract_cache,
+        "module_fingerprint",
+        lambda name: "grammar fix" if name == "scraper.dates" else original(name),
+    )
+    cache.extract(url, PAGE, _extractor(calls))
+    assert len(calls) == 2
+
+
+def _dated(text, calls):
+    def extract(soup):
+        calls.append(1)
+        return {"starts_at": parse_datetime(text)}
+
+    return extract
+
+
+def test_entries_resolved_against_today_expire_with_the_day(tmp_path, monkeypatch):
+    cache = ExtractCache("scraper.sources.bergen_kjott", tmp_path)
+    yearless, explicit = [], []
+    cache.extract("https://www.bergenkjott.org/events/a", PAGE, _dated("24. mai", yearless))
+    cache.extract("https://www.bergenkjott.org/events/b", PAGE, _dated("24.05.2025 20:00", explicit))
+    cache.extract("https://www.bergenkjott.org/events/a", PAGE, _dated("24. mai", yearless))
+    assert len(yearless) == len(explicit) == 1
+
+    tomorrow = (datetime.now(TZ) + timedelta(days=1)).date().isoformat()
+    monkeypatch.setattr(extract_cache, "_today", lambda: tomorrow)
+    cache.extract("https://www.bergenkjott.org/events/a", PAGE, _dated("24. mai", yearless))
+    cache.extract("https://www.bergenkjott.org/events/b", PAGE, _dated("24.05.2025 20:00", explicit))
+    # Only the yearless date is resolved again on the next day.
+    assert len(yearless) == 2
+    assert len(explicit) == 1
+
+
+def test_cache_directory_is_bounded(tmp_path):
+    cache = ExtractCache("scraper.sources.grieghallen", tmp_path, max_bytes=2_000)
+    calls = []
+    for number in range(40):
+        cache.extract(f"https://grieghallen.no/arrangement/{number}", PAGE, _extractor(calls))
+    assert sum(path.stat().st_size for path in tmp_path.glob("*.json")) <= 2_000
+    # The most recent entry survives eviction.
+    cache.extract("https://grieghallen.no/arrangement/39", PAGE, _extractor(calls))
+    assert len(calls) == 40
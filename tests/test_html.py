@@ -0,0 +1,103 @@
+import asyncio
+import sys
+import types
+
+import pytest
+
+from scraper import html
+from scraper.source_registry import SourceConfig
+
+PAGE = "<ul><li><a href='/a'>Konsert</a><time datetime='2025-06-01T19:30'>1. juni</time></li></ul>"
+
+
+@pytest.mark.parametrize("backend", html.BACKENDS)
+def test_backends_support_the_source_api(backend):
+    if backend == html.LXML and not html.HAS_LXML:
+        pytest.skip("lxml is not installed")
+    soup = html.parse_html(PAGE, backend)
+    link = soup.select("li")[0].find("a", href=True)
+    assert link["href"] == "/a"
+    assert [tag["datetime"] for tag in soup.find_all("time")] == ["2025-06-01T19:30"]
+    assert "li" in [parent.name for parent in link.parents]
+    assert list(soup.li.stripped_strings) == ["Konsert", "1. juni"]
+    assert html.parse_html("", backend) is None
+
+
+def test_backend_selection(monkeypatch):
+    monkeypatch.setenv("SPONTIS_HTML_PARSER", html.HTML_PARSER)
+    assert html.backend() == html.HTML_PARSER
+    with html.parser_backend(html.LXML):
+        assert html.backend() == (html.LXML if html.HAS_LXML else html.HTML_PARSER)
+    monkeypatch.setenv("SPONTIS_HTML_PARSER", "selectolax")
+    assert html.backend() == html.HTML_PARSER
+
+
+def test_source_config_applies_parser_override(monkeypatch):
+    module = types.ModuleType("fake_source")
+    module.fetch = lambda: [{"parser": html.backend()}]
+    monkeypatch.setitem(sys.modules, "fake_source", module)
+    monkeypatch.delenv("SPONTIS_HTML_PARSER", raising=False)
+
+    config = SourceConfig(name="Fake", module="fake_source", html_parser=html.HTML_PARSER)
+    assert asyncio.run(config.resolve_async()()) == [{"parser": html.HTML_PARSER}]
+
+
+def test_segment_cards_picks_smallest_container_once():
+    soup = html.make_soup(
+        """
+        <div class="page"><div class="wrapper">
+          <article>
+            <div class="thumb"><a href="/e/1"><img src="x.jpg"></a></div>
+            <div class="title"><a href="/e/1">Konsert</a></div>
+            <p>Lør 12. okt kl. 21</p>
+          </article>
+          <ul>
+            <li><a href="/e/2">Foredrag</a> 13. okt</li>
+            <li><a href="/e/3">Quiz</a> 14. okt</li>
+          </ul>
+        </div></div>
+        <a href="/outside">Utenfor</a>
+        """,
+        html.HTML_PARSER,
+    )
+    cards = html.segment_cards(soup)
+    assert [(card.name, link["href"], link.get_text(strip=True)) for card, link in cards] == [
+        ("article", "/e/1", "Konsert"),
+        ("li", "/e/2", "Foredrag"),
+        ("li", "/e/3", "Quiz"),
+    ]
+
+    only_lists = html.segment_cards(soup, "li", accept=lambda link: link["href"] != "/e/3")
+    assert [link["href"] for _, link in only_lists] == ["/e/2"]
+
+
+def test_parse_only_strips_heavy_markup_and_keeps_json_ld():
+    markup = """
+    <html><head>
+      <style>.a { color: red }</style>
+      <script src="app.js"></script>
+      <script type="application/ld+json">{"@type": "Event", "name": "Konsert"}</script>
+    </head><body>
+      <!-- <a href="/kommentert">Kommentert</a> -->
+      <nav><a href="/om">Om oss</a></nav>
+      <ul><li><a href="/e/1">Konsert</a><svg><path d="M0"/></svg><time>1. juni</time></li></ul>
+      <script>document.write('<a href="/skript">Skript</a>')</script>
+    </body></html>
+    """
+    stripped = html.make_soup(markup, html.HTML_PARSER, parse_only=html.ParseOnly())
+    assert [a["href"] for a in stripped.find_all("a")] == ["/om", "/e/1"]
+    assert stripped.find("svg") is None and stripped.find("style") is None
+    assert [script.get("type") for script in stripped.find_all("script")] == ["application/ld+json"]
+
+    strained = html.make_soup(markup, html.HTML_PARSER, parse_only=html.ParseOnly(("li",)))
+    assert [a["href"] for a in strained.find_all("a")] == ["/e/1"]
+    assert strained.find("li").find("time") is not None
+    assert strained.find("nav") is None
+    assert strained.find("script", type="application/ld+json") is not None
+
+
+def test_strip_markup_leaves_custom_elements_alone():
+    markup = '<style-x><a href="/e/1">Konsert</a></style-x><style>.a {}</style><svg/><p>Tekst</p>'
+    stripped = html.strip_markup(markup)
+    assert '<style-x><a href="/e/1">Konsert</a></style-x>' in stripped
+    assert "<style>" not in stripped
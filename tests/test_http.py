@@ -0,0 +1,217 @@
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from scraper import cassette, http
+from scraper.http_cache import HttpCache
+
+
+class _Handler(BaseHTTPRequestHandler):
+    hits: dict = {}
+
+    def log_message(self, *_args):  # keep pytest output quiet
+        pass
+
+    def do_GET(self):
+        hits = self.hits.setdefault(self.path, 0) + 1
+        self.hits[self.path] = hits
+        if self.path == "/busy" and hits == 1:
+            self.send_response(429)
+            self.send_header("Retry-After", "1")
+            self.end_headers()
+            return
+        if self.path == "/flaky" and hits == 1:
+            self.send_response(503)
+            self.send_header("Retry-After", "0")
+            self.end_headers()
+            return
+        if self.path == "/etag":
+            if self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                self.send_header("ETag", '"v1"')
+                self.end_headers()
+                return
+            body = b"<p>program</p>"
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("ETag", '"v1"')
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        if self.path == "/missing":
+            self.send_response(404)
+            self.end_headers()
+            return
+        body = "<p>Østre – lør 12. okt</p>".encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    _Handler.hits = {}
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class _KeepAliveHandler(_Handler):
+    protocol_version = "HTTP/1.1"
+    peers: set = set()
+
+    def do_GET(self):
+        self.peers.add(self.client_address)
+        super().do_GET()
+
+
+def test_sessions_are_per_thread_but_share_connections(server):
+    sessions = []
+    thread = threading.Thread(target=lambda: sessions.append(http.get_session()))
+    thread.start()
+    thread.join()
+    assert sessions[0] is not http.get_session()
+    assert sessions[0].get_adapter("https://example.org") is http.get_session().get_adapter("https://example.org")
+
+    _KeepAliveHandler.peers = set()
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    try:
+        base = f"http://127.0.0.1:{httpd.server_address[1]}"
+        for idx in range(4):
+            http.get(f"{base}/listing/{idx}")
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+    assert len(_KeepAliveHandler.peers) == 1
+
+
+def test_async_get_matches_sync_get(server):
+    sync_response = http.get(f"{server}/page")
+
+    async def run():
+        try:
+            return await http.async_get(f"{server}/page")
+        finally:
+            await http.close_async_sessions()
+
+    async_response = asyncio.run(run())
+    assert async_response.status_code == 200
+    assert async_response.text == sync_response.text
+    assert "Østre" in async_response.text
+
+
+def test_async_get_retries_and_raises(server):
+    async def run():
+        try:
+            flaky = await http.async_get(f"{server}/flaky")
+            with pytest.raises(Exception):
+                await http.async_get(f"{server}/missing")
+            return flaky
+        finally:
+            await http.close_async_sessions()
+
+    flaky = asyncio.run(run())
+    assert flaky.status_code == 200
+    assert _Handler.hits["/flaky"] == 2
+
+
+def test_scheduler_spaces_requests_per_host(server):
+    policy = http.HostPolicy(max_connections=1, min_interval=0.2)
+    started = time.monotonic()
+    with http.source_policy(policy):
+        for idx in range(3):
+            http.get(f"{server}/page/{idx}")
+    assert time.monotonic() - started >= 0.4
+
+
+def test_scheduler_honours_retry_after(server):
+    scheduler = http.HostScheduler(http.HostPolicy(max_connections=2, min_interval=0))
+    scheduler.defer("example.org", 0.3)
+    started = time.monotonic()
+    with scheduler.slot("https://example.org/program"):
+        pass
+    assert time.monotonic() - started >= 0.25
+
+    response = http.get(f"{server}/busy")
+    assert response.status_code == 200
+    assert http.SCHEDULER._hosts["127.0.0.1"].blocked_until > 0
+
+
+def test_cache_revalidates_with_etag(server):
+    first = http.get(f"{server}/etag")
+    second = http.get(f"{server}/etag")
+
+    assert first.text == second.text == "<p>program</p>"
+    assert getattr(second, "from_cache", False)
+    assert _Handler.hits["/etag"] == 2  # second request was a conditional 304
+
+
+def test_cache_serves_fresh_entries_without_network(server):
+    http.get(f"{server}/page")
+    cached = http.get(f"{server}/page")
+
+    assert getattr(cached, "from_cache", False)
+    assert _Handler.hits["/page"] == 1
+    assert "Østre" in cached.text
+
+
+def test_cache_keys_on_vary_and_evicts(tmp_path):
+    cache = HttpCache(tmp_path, max_bytes=150)
+    vary = {"Vary": "Accept-Language", "Cache-Control": "max-age=60"}
+    cache.store("https://example.org/", {"Accept-Language": "nb"}, "https://example.org/", 200, vary, b"n" * 60)
+    cache.store("https://example.org/", {"Accept-Language": "en"}, "https://example.org/", 200, vary, b"e" * 60)
+
+    assert cache.lookup("https://example.org/", {"Accept-Language": "nb"}).body == b"n" * 60
+    assert cache.lookup("https://example.org/", {"Accept-Language": "en"}).body == b"e" * 60
+
+    cache.store("https://example.org/other", {}, "https://example.org/other", 200, {}, b"o" * 60)
+    remaining = [cache.lookup("https://example.org/", {"Accept-Language": lang}) for lang in ("nb", "en")]
+    assert None in remaining
+    assert cache.lookup("https://example.org/other", {}) is not None
+
+
+def test_cache_treats_evicted_bodies_as_misses(tmp_path):
+    cache = HttpCache(tmp_path)
+    headers = {"Cache-Control": "max-age=60"}
+    cache.store("https://example.org/a", {}, "https://example.org/a", 200, headers, b"a" * 10)
+    cache.store("https://example.org/b", {}, "https://example.org/b", 200, headers, b"b" * 10)
+
+    entry = cache.lookup("https://example.org/a", {})
+    entry.body_path.unlink()
+    # Already looked up: the body was read with the entry.
+    assert entry.body == b"a" * 10
+    assert cache.lookup("https://example.org/a", {}) is None
+
+    for path in tmp_path.glob("*/*.body"):
+        path.unlink()
+    assert cache.lookup("https://example.org/b", {}) is None
+
+
+def test_cassette_records_and_replays_all_requests(server, tmp_path):
+    path = tmp_path / "run.jsonl.gz"
+    with cassette.use(path, cassette.RECORD):
+        shared = http.get(f"{server}/page").text
+        direct = requests.get(f"{server}/etag", timeout=5).text
+
+    hits_before = dict(_Handler.hits)
+    with cassette.use(path, cassette.REPLAY, latency=0.05) as replay:
+        started = time.monotonic()
+        assert http.get(f"{server}/page").text == shared
+        assert requests.get(f"{server}/etag", timeout=5).text == direct
+        assert time.monotonic() - started >= 0.1
+        with pytest.raises(requests.ConnectionError):
+            http.get(f"{server}/never-recorded")
+
+    assert _Handler.hits == hits_before
+    assert (replay.hits, replay.misses) == (2, 1)
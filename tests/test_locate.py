@@ -0,0 +1,60 @@
+from datetime import datetime
+
+from bs4 import BeautifulSoup
+
+from scraper.locate import bounded_text, locate_datetime
+
+
+def test_locate_prefers_card_over_footer():
+    soup = BeautifulSoup(
+        """
+        <main>
+          <article><a href="/e/1">Konsert</a><span>Tue 7 Oct 2025 19:00</span></article>
+          <article><a href="/e/2">Foredrag</a><p>Gratis inngang</p></article>
+        </main>
+        <footer>Oppdatert 01.01.2024 12:00</footer>
+        """,
+        "html.parser",
+    )
+    first, second = soup.select("article a")
+    assert locate_datetime(first) == datetime(2025, 10, 7, 19, 0)
+    # The search stays within the card instead of picking up the footer.
+    assert locate_datetime(second, depth=1) is None
+
+
+def test_locate_uses_structured_nodes_on_detail_pages():
+    soup = BeautifulSoup(
+        """
+        <html><head><meta property="event:start_time" content="2025-10-12T21:00"></head>
+        <body><h1>Konsert</h1><p>Publisert 3. januar 2024</p></body></html>
+        """,
+        "html.parser",
+    )
+    assert locate_datetime(soup) == datetime(2025, 10, 12, 21, 0)
+
+    page = BeautifulSoup(
+        "<body><nav>Meny</nav><div><h1>Konsert</h1><time datetime='2025-05-24T20:00'>lør</time></div></body>",
+        "html.parser",
+    )
+    assert locate_datetime(page) == datetime(2025, 5, 24, 20, 0)
+
+
+def test_bounded_text_stops_early():
+    soup = BeautifulSoup("<div>" + "<p>Lorem ipsum dolor</p>" * 10000 + "</div>", "html.parser")
+    assert len(bounded_text(soup.div, 100)) == 100
+    assert locate_datetime(soup.div) is None
+
+
+def test_locate_scans_each_container_once(monkeypatch):
+    from scraper import locate
+
+    scans = []
+    original = locate._scan
+    monkeypatch.setattr(locate, "_scan", lambda level: scans.append(level) or original(level))
+
+    cards = "".join(f"<li><a href='/e/{i}'>Event {i}</a></li>" for i in range(50))
+    soup = BeautifulSoup(f"<main><ul>{cards}</ul><p>Lør 12. okt 2025 kl. 21</p></main>", "html.parser")
+    links = soup.select("a")
+    assert {locate_datetime(link) for link in links} == {datetime(2025, 10, 12, 21, 0)}
+    # Each link and <li> once, plus the shared <ul> and <main>.
+    assert len(scans) == 2 * len(links) + 2
@@ -0,0 +1,72 @@
+import copy
+import random
+from difflib import SequenceMatcher
+
+from scraper.merge import TitleIndex, length_bound, normalize_title
+from scraper.run import _merge_into, _merge_related
+
+
+def _reference_merge(events):
+    """The original pairwise scan, kept here as the behaviour to match."""
+
+    def titles_match(a, b):
+        if not a or not b:
+            return False
+        return SequenceMatcher(None, normalize_title(a), normalize_title(b)).ratio() >= 0.8
+
+    merged = []
+    for event in events:
+        for candidate in merged:
+            a, b = candidate.get("starts_at"), event.get("starts_at")
+            if not a or not b or a[:10] != b[:10]:
+                continue
+            if not titles_match(candidate.get("title", ""), event.get("title", "")):
+                continue
+            _merge_into(candidate, event)
+            break
+        else:
+            merged.append(dict(event, sources=[event["source"]]))
+    return merged
+
+
+def _feed(count, seed=7):
+    rng = random.Random(seed)
+    words = ["Jazz", "kveld", "Quiz", "Konsert", "med", "Bergen", "Live", "DJ", "Nattjazz:", "Trio", "—", "Ola", "Kari"]
+    events = []
+    for number in range(count):
+        title = " ".join(rng.choice(words) for _ in range(rng.randint(0, 4)))
+        if rng.random() < 0.3 and events:
+            # Near-duplicates from another source.
+            title = rng.choice(events)["title"] + rng.choice(["", "!", " (utsolgt)", "s"])
+        day = rng.randint(1, 5)
+        events.append({
+            "source": f"kilde-{number % 4}",
+            "title": title,
+            "url": f"https://example.org/{number}",
+            "starts_at": f"2025-10-0{day}T2{rng.randint(0, 3)}:00:00+02:00" if rng.random() < 0.9 else None,
+        })
+    return events
+
+
+def test_merge_related_matches_pairwise_scan():
+    events = _feed(600)
+    expected = _reference_merge(copy.deepcopy(events))
+    merged, merges = _merge_related(copy.deepcopy(events))
+    strip = lambda items: [{k: v for k, v in e.items() if k != "tags"} for e in items]  # noqa: E731
+    assert strip(merged) == strip(expected)
+    assert merges == len(events) - len(merged)
+
+
+def test_title_index_prunes_by_day_and_length():
+    index = TitleIndex()
+    index.add("2025-10-01", "Jazzkveld med Trio", "a")
+    index.add("2025-10-01", "Quiz", "b")
+    index.add("2025-10-02", "Jazzkveld med Trio", "c")
+    index.add("2025-10-01", "Jazzkveld med trio!", "d")
+
+    assert index.find("2025-10-01", "JAZZKVELD MED TRIO") == "a"
+    assert index.find("2025-10-02", "Jazzkveld med Trio") == "c"
+    assert index.find("2025-10-03", "Jazzkveld med Trio") is None
+    # "Quiz" is too short to reach the threshold, so it is never compared.
+    assert index.compared == 2
+    assert length_bound(4, 18) < 0.8
@@ -0,0 +1,47 @@
+from datetime import datetime
+
+from scraper.normalize import DATE_SETTINGS, DateParser
+
+
+def test_date_parser_memoizes_identical_strings():
+    parser = DateParser(maxsize=2)
+
+    first = parser.parse("24.05.2025 20:00")
+    assert first == datetime(2025, 5, 24, 20, 0)
+    assert parser.parse(" 24.05.2025 20:00 ") == first
+    assert parser.stats()["hits"] == 1
+
+    # Different settings are cached separately.
+    month_first = parser.parse("05.06.2025", settings={**DATE_SETTINGS, "DATE_ORDER": "MDY"})
+    assert month_first.month == 5
+    assert parser.parse("Navigasjon") is None
+    assert parser.parse("") is None
+    assert parser.stats() == {
+        "iso": 0, "rejected": 1, "hits": 1, "grammar": 2, "dateparser": 0, "unparsed": 0, "cached": 2,
+    }
+
+
+def test_date_parser_resolves_iso_without_dateparser():
+    parser = DateParser()
+
+    # Day-first ordering must not swap month and day of ISO dates.
+    assert parser.parse("2025-10-07T19:00") == datetime(2025, 10, 7, 19, 0)
+    assert parser.parse("2025-10-07") == datetime(2025, 10, 7)
+    # Offsets are converted to Oslo time and returned naive, like dateparser does.
+    assert parser.parse("2025-10-07T17:00:00Z") == datetime(2025, 10, 7, 19, 0)
+    aware = parser.parse("2025-10-07T17:00:00+00:00", settings={"TIMEZONE": "Europe/Oslo"})
+    assert aware.utcoffset().total_seconds() == 7200 and aware.hour == 19
+
+    assert parser.parse("Kjøp billetter") is None
+    assert parser.stats() == {
+        "iso": 4, "rejected": 1, "hits": 0, "grammar": 0, "dateparser": 0, "unparsed": 0, "cached": 0,
+    }
+
+
+def test_date_parser_uses_dateparser_only_when_enabled():
+    text = "October 3rd 2025 at noon"
+    assert DateParser().parse(text) is None
+
+    parser = DateParser(fallback=True)
+    assert parser.parse(text) == datetime(2025, 10, 3, 12, 0)
+    assert parser.stats()["dateparser"] == 1
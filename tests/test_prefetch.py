@@ -0,0 +1,35 @@
+import contextvars
+import time
+
+from scraper.html import parse_html
+from scraper.prefetch import Prefetcher
+
+MARKER = contextvars.ContextVar("marker", default=None)
+
+
+def test_prefetcher_downloads_concurrently_and_parses_lazily():
+    parsed = []
+
+    def fetch(url):
+        time.sleep(0.2)
+        return f"<p>{url} {MARKER.get()}</p>"
+
+    def parse(text):
+        parsed.append(text)
+        return parse_html(text)
+
+    urls = [f"https://example.org/event/{idx}" for idx in range(10)]
+    MARKER.set("source-a")
+    started = time.monotonic()
+    details = Prefetcher(fetch, parse).schedule(urls)
+    first = details.get(urls[0])
+    assert details.get(urls[0]) is first
+    last = details.get(urls[-1])
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 1.0
+    assert len(parsed) == 2
+    assert first.get_text() == f"{urls[0]} source-a"
+    assert last.get_text() == f"{urls[-1]} source-a"
+    # URLs that were never scheduled are fetched inline.
+    assert details.get("https://example.org/other").get_text().startswith("https://example.org/other")
@@ -0,0 +1,111 @@
+from scraper.program import TagRule, VenueProgram, run_program
+
+
+class FakeResponse:
+    def __init__(self, text: str, status: int = 200) -> None:
+        self.text = text
+        self.status_code = status
+
+
+PROGRAM = VenueProgram(
+    module="tests.test_program",
+    source="Testhuset",
+    program_url="https://testhuset.no/program",
+    url_prefix="https://testhuset.no",
+    venue="Testhuset",
+    tags=("culture",),
+    href_pattern=r"/program/[^/]+/?$",
+    skip_titles=("abonnement",),
+    tag_rules=(TagRule("dj", ("dj", "klubb")),),
+    venue_selector=".meta",
+    venue_keywords=("sal",),
+)
+
+CARDS = (
+    '<a href="/program/klubbkveld">Klubbkveld</a><span>DJ-sett fra 23</span>'
+    '<time datetime="2025-10-10T23:00">10. okt</time>',
+    '<a href="/program/foredrag">Foredrag</a><p>Om byen</p>',
+    '<a href="/program/abonnement">Abonnement</a><p>Kjøp nå</p>',
+    '<a href="/program/serie">Serie</a><p>Hele høsten</p>',
+    '<a href="/om-oss">Om oss</a><p>Kontakt</p>',
+)
+# Each card sits deep enough that date lookups never reach its neighbours.
+LISTING = "".join(f"<section><div><div><article>{card}</article></div></div></section>" for card in CARDS)
+
+DETAILS = {
+    "/program/klubbkveld": "<p class='meta'>Åpent for alle</p><p class='meta'>Lille sal</p>",
+    "/program/foredrag": (
+        "<h1>Foredrag</h1><time datetime='2025-10-12T18:00'></time>"
+        "<div class='content'><p>Byhistorie.</p></div>"
+    ),
+    "/program/serie": "<h1>Serie</h1><p>Datoer kommer.</p>",
+}
+
+
+def _fake_get(requested):
+    def get(url: str, **_kwargs):
+        requested.append(url)
+        if url == PROGRAM.program_url:
+            return FakeResponse(LISTING)
+        for path, html in DETAILS.items():
+            if url.endswith(path):
+                return FakeResponse(html)
+        return FakeResponse("", status=404)
+
+    return get
+
+
+def test_run_program_filters_cards_and_reads_details():
+    requested = []
+    events = run_program(PROGRAM, _fake_get(requested))
+
+    assert [event["title"] for event in events] == ["Klubbkveld", "Foredrag"]
+    club, talk = events
+    assert club["starts_at"].startswith("2025-10-10T23:00")
+    assert club["tags"] == ["culture", "dj"]
+    # Only detail nodes mentioning a venue keyword name the room.
+    assert club["venue"] == "Lille sal"
+    assert talk["starts_at"].startswith("2025-10-12T18:00")
+    assert talk["venue"] == "Testhuset"
+    assert talk["description"] == "Byhistorie."
+    assert not any("abonnement" in url or "om-oss" in url for url in requested)
+
+
+def test_run_program_keeps_undated_items_when_asked():
+    from dataclasses import replace
+
+    events = run_program(replace(PROGRAM, require_date=False), _fake_get([]))
+    assert [event["title"] for event in events] == ["Klubbkveld", "Foredrag", "Serie"]
+    assert "starts_at" not in events[2]
+
+
+def test_run_program_filters_structured_events_and_merges_uncovered_cards():
+    structured = """
+    <script type="application/ld+json">
+    [{"@type": "Event", "name": "Klubbkveld", "startDate": "2025-10-10T23:00",
+      "url": "https://testhuset.no/program/klubbkveld", "description": "Klubb med DJ"},
+     {"@type": "Event", "name": "Abonnement", "startDate": "2025-10-11T12:00",
+      "url": "https://testhuset.no/program/abonnement"},
+     {"@type": "Event", "name": "Om oss", "startDate": "2025-10-11T12:00",
+      "url": "https://testhuset.no/om-oss"}]
+    </script>
+    """
+    requested = []
+    get = _fake_get(requested)
+
+    def fake_get(url: str, **kwargs):
+        response = get(url, **kwargs)
+        if url == PROGRAM.program_url:
+            response.text = structured + response.text
+        return response
+
+    events = run_program(PROGRAM, fake_get)
+
+    assert [event["title"] for event in events] == ["Klubbkveld", "Foredrag"]
+    club, talk = events
+    assert club["tags"] == ["culture", "dj"]
+    assert club["where"] == club["venue"] == "Testhuset"
+    assert club["when"]
+    # The listing only marks up one event; the other cards are still scraped.
+    assert talk["starts_at"].startswith("2025-10-12T18:00")
+    assert not any(url.endswith("/program/klubbkveld") for url in requested)
@@ -0,0 +1,42 @@
+import json
+from datetime import datetime
+
+from scraper import run
+
+
+def _sanitized(*events):
+    return [run._sanitize_event(event, index) for index, event in enumerate(events, start=1)]
+
+
+def test_pipeline_carries_datetimes_and_serializes_at_the_end():
+    events = _sanitized(
+        {"source": "A", "title": "Late", "url": "https://a.example/1", "starts_at": "2025-10-26T01:15:00Z"},
+        {"source": "B", "title": "Early", "url": "https://b.example/2", "starts_at": "2025-10-26T00:30:00Z"},
+        {"source": "C", "title": "Undated", "url": "https://c.example/3", "when": "Fri"},
+    )
+    assert isinstance(events[0]["starts_at"], datetime)
+    assert events[0]["starts_at"].tzinfo is not None
+
+    ordered = run._sort(run._dedupe(events))
+    # Around the DST switch 02:15+01:00 sorts before 02:30+02:00 as text but is later.
+    assert [event["title"] for event in ordered] == ["Early", "Late", "Undated"]
+
+    merged, _ = run._merge_related(ordered)
+    kept = run._filter_stale(merged, now=datetime.fromisoformat("2025-10-26T03:00:00+01:00"), retention_hours=1)
+    assert [event["title"] for event in kept] == ["Late", "Undated"]
+
+    records = [run._serialize_event(event) for event in kept]
+    assert json.loads(json.dumps(records))[0]["starts_at"] == "2025-10-26T02:15:00+01:00"
+    assert isinstance(kept[0]["starts_at"], datetime)
+
+
+def test_dedupe_and_merge_use_the_local_day():
+    events = _sanitized(
+        {"source": "A", "title": "Quiz", "url": "https://a.example/q", "starts_at": "2025-10-07T23:30:00Z"},
+        {"source": "B", "title": "Quiz!", "url": "https://b.example/q", "starts_at": "2025-10-08T01:30:00+02:00"},
+    )
+    # 23:30Z is already 8 October in Bergen.
+    assert run._dedupe_key(events[0])[2] == "2025-10-08"
+    merged, merges = run._merge_related(run._dedupe(events))
+    assert merges == 1
+    assert merged[0]["sources"] == ["A", "B"]
@@ -0,0 +1,41 @@
+import json
+from datetime import datetime, timezone
+
+from scraper import run
+from scraper.schema import Event
+
+
+def test_event_behaves_like_the_json_dict():
+    event = Event({"source": "Hulen", "title": "Quiz", "url": "https://hulen.no/quiz", "price": "100 kr"})
+    assert event["title"] == "Quiz"
+    assert event.get("venue") is None and "venue" not in event
+    assert "price" in event and event.extra == {"price": "100 kr"}
+
+    event.setdefault("sources", []).append("Hulen")
+    event["starts_at"] = datetime(2025, 10, 7, 20, 0, tzinfo=timezone.utc)
+    assert event.pop("price") == "100 kr"
+    assert event.extra is None
+
+    record = event.to_dict()
+    assert list(record) == ["source", "title", "url", "sources", "starts_at"]
+    assert json.loads(json.dumps(record))["starts_at"] == "2025-10-07T20:00:00+00:00"
+    assert Event.from_dict(record) == record
+
+
+def test_repeated_strings_are_shared():
+    first = Event(source="".join(["Bergen ", "Live"]), venue="".join(["U", "SF"]), tags=["".join(["li", "ve"])])
+    second = Event(source="".join(["Bergen ", "Live"]), venue="".join(["U", "SF"]), tags=["".join(["li", "ve"])])
+    assert first["source"] is second["source"]
+    assert first["venue"] is second["venue"]
+    assert first["tags"][0] is second["tags"][0]
+
+
+def test_pipeline_moves_records_without_copying():
+    raw = {"source": "Hulen", "title": "Quiz", "url": "https://hulen.no/quiz", "starts_at": "2025-10-07T20:00:00+02:00"}
+    event = run._sanitize_event(raw, 1)
+    assert isinstance(event, Event)
+    assert "sources" in event and "sources" not in raw
+
+    merged, _ = run._merge_related(run._sort(run._dedupe([event])))
+    assert merged[0] is event
+    assert run._serialize_event(event)["starts_at"] == "2025-10-07T20:00:00+02:00"
@@ -0,0 +1,90 @@
+import random
+import string
+
+import auto_scraper
+from scraper import run
+from scraper.similarity import SimilarityIndex, band_layout, jaccard, shingles
+
+
+def _titles(count, seed=5):
+    rng = random.Random(seed)
+    words = ["".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 9))) for _ in range(200)]
+    titles = []
+    for _ in range(count):
+        if titles and rng.random() < 0.4:
+            base = rng.choice(titles).split()
+            base.append(rng.choice(words))
+            titles.append(" ".join(base))
+        else:
+            titles.append(" ".join(rng.choice(words) for _ in range(rng.randint(2, 5))))
+    return titles
+
+
+def test_query_verifies_candidates_and_respects_blocks():
+    index = SimilarityIndex(threshold=0.6)
+    index.add_many([
+        ("a", "Jazz på Victoria Kafé", "2025-10-07"),
+        ("b", "Jazz paa Victoria kafe!", "2025-10-07"),
+        ("c", "Quiz på Victoria", "2025-10-07"),
+        ("d", "Jazz på Victoria Kafé", "2025-10-08"),
+    ])
+
+    matches = index.query("Jazz på Victoria Kafé", block="2025-10-07")
+    assert [match.key for match in matches] == ["a", "b"]
+    assert matches[0].score == 1.0
+    assert all(match.score >= 0.6 for match in matches)
+    assert index.query("") == []
+    assert index.duplicates() == [["a", "b"]]
+
+
+def test_index_finds_what_a_full_scan_finds():
+    titles = _titles(800)
+    index = SimilarityIndex(threshold=0.6)
+    index.add_many(enumerate(titles))
+    grams = [shingles(title) for title in titles]
+
+    expected = found = 0
+    for number, title in enumerate(titles):
+        got = {match.key for match in index.query(title)}
+        truth = {other for other in range(len(titles)) if jaccard(grams[number], grams[other]) >= 0.6}
+        assert got <= truth
+        expected += len(truth)
+        found += len(got)
+    # Banding trades a few borderline pairs for sublinear lookups.
+    assert found / expected > 0.97
+
+
+def test_band_layout_keeps_recall_at_threshold():
+    for threshold in (0.5, 0.6, 0.8):
+        bands, rows = band_layout(threshold, 64)
+        assert bands * rows <= 64
+        assert 1 - (1 - threshold**rows) ** bands >= 0.95
+
+
+def test_fuzzy_merge_joins_sources_when_enabled():
+    events = [
+        {"source": "Bergen Live", "title": "Kaizers Orchestra", "venue": "USF Verftet", "starts_at": "2025-10-07T20:00:00+02:00"},
+        {"source": "Ticketco", "title": "Kaizers Orchestra – Vestlandsturné", "venue": "USF Verftet", "starts_at": "2025-10-07T20:00:00+02:00"},
+        {"source": "Ticketco", "title": "Kaizers Orchestra", "venue": "USF Verftet", "starts_at": "2025-10-08T20:00:00+02:00"},
+    ]
+
+    merged, merges = run._merge_related([dict(event) for event in events])
+    assert merges == 0
+
+    merged, merges = run._merge_related([dict(event) for event in events], fuzzy_threshold=0.5)
+    assert merges == 1
+    assert merged[0]["sources"] == ["Bergen Live", "Ticketco"]
+    assert len(merged) == 2
+
+
+def test_discovery_marks_known_sources():
+    candidates = [
+        {"name": "www.bergenkino.no", "url": "https://www.bergenkino.no/program"},
+        {"name": "Isotop Fellesatelier"},
+        {"name": "Isotop Fellesatelier!"},
+    ]
+
+    marked = auto_scraper.mark_duplicate_sources(candidates)
+    assert marked[0]["duplicate_of"] == "Bergen Kino"
+    assert "duplicate_of" not in marked[1]
+    assert marked[2]["duplicate_of"] == "Isotop Fellesatelier"
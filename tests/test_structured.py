@@ -0,0 +1,118 @@
+from datetime import datetime
+
+from bs4 import BeautifulSoup
+
+from scraper.structured import extract_events, structured_events
+
+BASE_URL = "https://venue.example/program"
+
+
+def test_extract_events_reads_json_ld_graph():
+    soup = BeautifulSoup(
+        """
+        <script type="application/ld+json">
+        {"@context": "https://schema.org", "@graph": [
+          {"@type": "WebPage", "name": "Program"},
+          {"@type": "MusicEvent", "name": "Kari &amp; Ola",
+           "startDate": "2025-10-07T19:30:00+02:00", "url": "/e/kari-ola",
+           "location": {"@type": "Place", "name": "Lille sal"},
+           "offers": [{"@type": "Offer", "price": "250", "priceCurrency": "NOK", "url": "/billetter/1"}]}
+        ]}
+        </script>
+        """,
+        "html.parser",
+    )
+    (event,) = extract_events(soup, BASE_URL)
+    assert event.name == "Kari & Ola"
+    assert event.starts_at == datetime(2025, 10, 7, 19, 30)
+    assert event.url == "https://venue.example/e/kari-ola"
+    assert event.venue == "Lille sal"
+    assert event.price == "250 NOK"
+    assert event.ticket_url == "https://venue.example/billetter/1"
+
+
+def test_extract_events_reads_microdata_and_skips_duplicates():
+    soup = BeautifulSoup(
+        """
+        <script type="application/ld+json">
+        {"@type": "Event", "name": "Foredrag", "startDate": "2025-11-02T18:00", "url": "/e/foredrag"}
+        </script>
+        <div itemscope itemtype="https://schema.org/Event">
+          <a itemprop="url" href="/e/foredrag"><span itemprop="name">Foredrag</span></a>
+          <time itemprop="startDate" datetime="2025-11-02T18:00">2. nov</time>
+          <div itemprop="location" itemscope itemtype="https://schema.org/Place">
+            <span itemprop="name">Store sal</span>
+          </div>
+        </div>
+        <div itemscope itemtype="https://schema.org/Event">
+          <span itemprop="name">Konsert</span>
+          <meta itemprop="startDate" content="2025-11-03T20:00">
+          <div itemprop="location" itemscope itemtype="https://schema.org/Place">
+            <span itemprop="name">Lille sal</span>
+          </div>
+        </div>
+        """,
+        "html.parser",
+    )
+    events = extract_events(soup, BASE_URL)
+    assert [event.name for event in events] == ["Foredrag", "Konsert"]
+    # The nested Place's name is the venue, not the event's name.
+    assert events[1].venue == "Lille sal"
+    assert events[1].starts_at == datetime(2025, 11, 3, 20, 0)
+
+
+def test_structured_events_builds_dated_accepted_events():
+    soup = BeautifulSoup(
+        """
+        <script type="application/ld+json">
+        [{"@type": "Event", "name": "Konsert", "startDate": "2025-10-07T19:30", "url": "/e/konsert"},
+         {"@type": "Event", "name": "Udatert", "url": "/e/udatert"},
+         {"@type": "Event", "name": "Annen side", "startDate": "2025-10-08T19:30",
+          "url": "https://other.example/e/1"}]
+        </script>
+        """,
+        "html.parser",
+    )
+    events = structured_events(
+        soup,
+        BASE_URL,
+        source="Venue",
+        venue="Venue",
+        tags=["culture"],
+        accept=lambda url: url.startswith("https://venue.example"),
+    )
+    assert [event["title"] for event in events] == ["Konsert"]
+    assert events[0]["url"] == "https://venue.example/e/konsert"
+    assert events[0]["venue"] == "Venue"
+    assert events[0]["starts_at"].startswith("2025-10-07T19:30")
+
+
+def test_structured_events_empty_without_markup():
+    soup = BeautifulSoup("<div><a href='/e/1'>Konsert</a></div>", "html.parser")
+    assert structured_events(soup, BASE_URL, source="Venue", venue="Venue", tags=[]) == []
+
+
+def test_structured_events_apply_title_filter_and_source_fields():
+    soup = BeautifulSoup(
+        """
+        <script type="application/ld+json">
+        [{"@type": "Event", "name": "Dansekurs", "startDate": "2025-10-07T19:30", "url": "/e/kurs"},
+         {"@type": "Event", "name": "Kontakt oss", "startDate": "2025-10-08T19:30", "url": "/kontakt"}]
+        </script>
+        """,
+        "html.parser",
+    )
+    events = structured_events(
+        soup,
+        BASE_URL,
+        source="Venue",
+        venue="Venue",
+        tags=["culture"],
+        accept_title=lambda title: "kontakt" not in title.lower(),
+        fields=lambda item: {"venue": "Lille sal", "tags": ["culture", "workshop"], "kind": "kurs"},
+    )
+    assert [event["title"] for event in events] == ["Dansekurs"]
+    assert events[0]["venue"] == events[0]["where"] == "Lille sal"
+    assert events[0]["tags"] == ["culture", "workshop"]
+    assert events[0]["kind"] == "kurs"
+    assert "when" in events[0]
@@ -0,0 +1,84 @@
+import json
+import random
+import re
+from datetime import datetime
+
+from scraper.run import _merge_related
+from scraper.tagging import TagRules, Tagger, default_tagger
+
+# The per-tag regexes the rules file replaced.
+LEGACY_PATTERNS = {
+    "techno": r"\b(dj|club|techno|rave|house|electro|afterparty|warehouse|disco)\b",
+    "jazz": r"\bjazz\b",
+    "lecture": r"\b(lecture|talk|seminar|conference|panel|debate|foredrag|samtale)\b",
+    "festival": r"\b(festival|weekender)\b",
+    "underground": r"\b(underground|basement|secret|warehouse)\b",
+    "family": r"\b(family|familie|kids|children|barn|ungdom)\b",
+    "culture": r"\b(art|kunsthall|museum|culture|utstilling|performance|kunst|lecture|talk|seminar|conference|panel|debate|foredrag|samtale)\b",
+    "late-night": r"\b(late night|afterparty|after-hours|night session)\b",
+}
+
+
+def _legacy_tags(event):
+    tags = set(event.get("tags", []))
+    haystack = " ".join(part.lower() for part in (event.get("title"), event.get("venue")) if part)
+    for tag, pattern in LEGACY_PATTERNS.items():
+        if re.search(pattern, haystack, re.IGNORECASE):
+            tags.add(tag)
+    if event.get("starts_at"):
+        hour = datetime.fromisoformat(event["starts_at"]).hour
+        if hour >= 22 or hour < 5:
+            tags.add("late-night")
+    return tags
+
+
+def _events(count, seed=11):
+    rng = random.Random(seed)
+    words = ["DJ", "Jazz", "kveld", "late", "night", "session", "After-Hours", "Warehouse", "barnas", "barn",
+             "Kunsthall", "art", "party", "Samtale:", "festivalen", "Festival", "house-music", "Secret"]
+    events = []
+    for _ in range(count):
+        event = {"title": " ".join(rng.choice(words) for _ in range(rng.randint(1, 6)))}
+        if rng.random() < 0.5:
+            event["venue"] = rng.choice(["Landmark", "Hulen", "Bergen Kunsthall", "Basement"])
+        if rng.random() < 0.7:
+            event["starts_at"] = f"2025-10-07T{rng.randint(0, 23):02d}:30:00+02:00"
+        if rng.random() < 0.2:
+            event["tags"] = ["cinema"]
+        events.append(event)
+    return events
+
+
+def test_tagger_matches_the_legacy_patterns():
+    events = _events(500)
+    tagger = default_tagger()
+    expected = [_legacy_tags(event) for event in events]
+    assert [tagger.infer(event) for event in events] == expected
+    assert tagger.infer_all(events) == expected
+
+
+def test_overlapping_keywords_are_all_reported():
+    tagger = Tagger(TagRules.from_dict({
+        "keywords": {"night": ["late night", "night session"], "late": ["late"], "quiz": ["quiz"]},
+    }))
+    assert tagger.match("late night session") == {"night", "late"}
+    assert tagger.match("the latest quiz") == {"quiz"}
+
+
+def test_rules_load_from_a_data_file(tmp_path, monkeypatch):
+    rules = tmp_path / "rules.json"
+    rules.write_text(json.dumps({
+        "keywords": {"quiz": ["quiz", "pubquiz"]},
+        "late_night": {"tag": "nattugle", "from_hour": 23, "until_hour": 4},
+    }), encoding="utf-8")
+    monkeypatch.setenv("SPONTIS_TAG_RULES", str(rules))
+    default_tagger.cache_clear()
+    try:
+        merged, _ = _merge_related([
+            {"source": "Hulen", "title": "Pubquiz", "starts_at": "2025-10-07T23:30:00+02:00"},
+            {"source": "Hulen", "title": "DJ Ola", "starts_at": "2025-10-08T22:30:00+02:00"},
+        ])
+    finally:
+        default_tagger.cache_clear()
+    assert merged[0]["tags"] == ["nattugle", "quiz"]
+    assert "tags" not in merged[1]